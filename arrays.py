@@ -0,0 +1,481 @@
+import numbers
+import operator
+
+import numpy as np
+
+from classes import Complex, Fraction
+
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _as_storage(values):
+    """Массив int64, если значения помещаются, иначе массив Python-int (dtype=object).
+    Нецелые значения (float, дроби) не усекаются, а дают TypeError"""
+    arr = np.asarray(values)
+    if arr.dtype.kind in 'bi' or arr.size == 0:
+        return arr.astype(np.int64)
+    if arr.dtype.kind == 'u' and (arr.size == 0 or arr.max() <= _INT64_MAX):
+        return arr.astype(np.int64)
+    if arr.dtype.kind not in 'uO':
+        raise TypeError(f"expected integers, got array of {arr.dtype}")
+    # operator.index пропускает только целые: Python int, numpy-целые, bool
+    items = [operator.index(v) for v in arr.ravel().tolist()]
+    try:
+        return np.array(items, dtype=np.int64).reshape(arr.shape)
+    except OverflowError:
+        result = np.empty(len(items), dtype=object)
+        result[:] = items
+        return result.reshape(arr.shape)
+
+
+def _is_fraction(value):
+    return isinstance(value, numbers.Rational) and not isinstance(value, numbers.Integral)
+
+
+def _max_abs(arr):
+    if arr.size == 0:
+        return 0
+    return max(abs(int(arr.max())), abs(int(arr.min())))
+
+
+def _fit(arr):
+    """Возврат к int64, если после сокращения значения снова помещаются"""
+    if arr.dtype == object and _max_abs(arr) <= _INT64_MAX:
+        return arr.astype(np.int64)
+    return arr
+
+
+def _widen(bound, *arrays):
+    """Перевод в dtype=object, если промежуточный результат может переполнить int64"""
+    if bound > _INT64_MAX:
+        return tuple(arr.astype(object) for arr in arrays)
+    return arrays
+
+
+def _negate(arr):
+    """-arr без переполнения: -(-2 ** 63) не помещается в int64"""
+    arr, = _widen(_max_abs(arr), arr)
+    return -arr
+
+
+def _normalize(num, den):
+    if (den == 0).any():
+        raise ValueError("Denominator cannot be zero")
+    g = np.gcd(num, den)
+    num = num // g
+    den = den // g
+    negative = den < 0
+    if negative.any():
+        num, den = _widen(max(_max_abs(num), _max_abs(den)), num, den)
+        num = np.where(negative, -num, num)
+        den = np.where(negative, -den, den)
+    return _fit(num), _fit(den)
+
+
+def _add(n1, d1, n2, d2):
+    bound = max(_max_abs(n1) * _max_abs(d2) + _max_abs(n2) * _max_abs(d1),
+                _max_abs(d1) * _max_abs(d2))
+    n1, d1, n2, d2 = _widen(bound, n1, d1, n2, d2)
+    return _normalize(n1 * d2 + n2 * d1, d1 * d2)
+
+
+def _mul(n1, d1, n2, d2):
+    """Произведение несократимых дробей: после перекрёстного сокращения результат уже несократим"""
+    g1 = np.gcd(n1, d2)
+    g2 = np.gcd(n2, d1)
+    n1, d2 = n1 // g1, d2 // g1
+    n2, d1 = n2 // g2, d1 // g2
+    bound = max(_max_abs(n1) * _max_abs(n2), _max_abs(d1) * _max_abs(d2))
+    n1, d1, n2, d2 = _widen(bound, n1, d1, n2, d2)
+    return _fit(n1 * n2), _fit(d1 * d2)
+
+
+def _reciprocal(num, den):
+    if (num == 0).any():
+        raise ZeroDivisionError
+    negative = num < 0
+    num, den = _widen(_max_abs(num), num, den)
+    return _fit(np.where(negative, -den, den)), _fit(np.where(negative, -num, num))
+
+
+class FractionArray:
+    """Массив рациональных чисел: числители и знаменатели хранятся в двух параллельных массивах"""
+    __slots__ = ('numerators', 'denominators')
+    __array_ufunc__ = None
+
+    def __init__(self, numerators, denominators=None):
+        if denominators is None and not isinstance(numerators, np.ndarray | FractionArray):
+            numerators = list(numerators)
+            if any(_is_fraction(v) for v in numerators):
+                other = self.from_fractions(numerators)
+                self.numerators, self.denominators = other.numerators, other.denominators
+                return
+        numerators = _as_storage(numerators)
+        if denominators is None:
+            denominators = np.ones_like(numerators)
+        else:
+            denominators = _as_storage(denominators)
+        if numerators.shape != denominators.shape:
+            raise ValueError("numerators and denominators must have the same shape")
+        self.numerators, self.denominators = _normalize(numerators, denominators)
+
+    @classmethod
+    def _from_normalized(cls, numerators, denominators):
+        obj = object.__new__(cls)
+        obj.numerators = numerators
+        obj.denominators = denominators
+        return obj
+
+    @classmethod
+    def from_fractions(cls, values):
+        """Массив из целых и рациональных чисел (Fraction, fractions.Fraction); float дают TypeError"""
+        values = list(values)
+        # numerator и denominator рациональных чисел уже несократимы, знаменатель положителен
+        numerators = [int(v.numerator) if isinstance(v, numbers.Rational) else v for v in values]
+        denominators = [int(v.denominator) if isinstance(v, numbers.Rational) else 1 for v in values]
+        return cls._from_normalized(_as_storage(numerators), _as_storage(denominators))
+
+    def to_fractions(self):
+        return [Fraction._from_normalized(int(n), int(d))
+                for n, d in zip(self.numerators.tolist(), self.denominators.tolist())]
+
+    def to_numpy(self):
+        """Приближение массивом float64"""
+        return np.asarray(self.numerators / self.denominators, dtype=np.float64)
+
+    @property
+    def dtype(self):
+        if self.numerators.dtype == object or self.denominators.dtype == object:
+            return np.dtype(object)
+        return self.numerators.dtype
+
+    def __len__(self):
+        return len(self.numerators)
+
+    def __iter__(self):
+        return iter(self.to_fractions())
+
+    def __getitem__(self, item):
+        if isinstance(item, int | np.integer):
+            return Fraction._from_normalized(int(self.numerators[item]), int(self.denominators[item]))
+        return self._from_normalized(self.numerators[item], self.denominators[item])
+
+    def __str__(self):
+        return f"[{', '.join(str(f) for f in self)}]"
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self})"
+
+    @staticmethod
+    def _coerce(other):
+        if isinstance(other, FractionArray):
+            return other.numerators, other.denominators
+        if isinstance(other, Fraction):
+            return _as_storage(other.numerator), _as_storage(other.denominator)
+        if isinstance(other, int):
+            return _as_storage(other), _as_storage(1)
+        return None
+
+    def _binary(self, other, kernel):
+        operand = self._coerce(other)
+        if operand is None:
+            return NotImplemented
+        return self._from_normalized(*kernel(self.numerators, self.denominators, *operand))
+
+    def __add__(self, other):
+        return self._binary(other, _add)
+
+    def __sub__(self, other):
+        operand = self._coerce(other)
+        if operand is None:
+            return NotImplemented
+        return self._from_normalized(*_add(self.numerators, self.denominators, _negate(operand[0]), operand[1]))
+
+    def __mul__(self, other):
+        return self._binary(other, _mul)
+
+    def __truediv__(self, other):
+        operand = self._coerce(other)
+        if operand is None:
+            return NotImplemented
+        return self._from_normalized(*_mul(self.numerators, self.denominators, *_reciprocal(*operand)))
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+    def __rsub__(self, other):
+        return (-self).__add__(other)
+
+    def __rtruediv__(self, other):
+        operand = self._coerce(other)
+        if operand is None:
+            return NotImplemented
+        return self._from_normalized(*_mul(*operand, *_reciprocal(self.numerators, self.denominators)))
+
+    def __neg__(self):
+        return self._from_normalized(_negate(self.numerators), self.denominators)
+
+    def __abs__(self):
+        numerators, = _widen(_max_abs(self.numerators), self.numerators)
+        return self._from_normalized(np.abs(numerators), self.denominators)
+
+    def _compare(self, other, op):
+        operand = self._coerce(other)
+        if operand is None:
+            return NotImplemented
+        n1, d1 = self.numerators, self.denominators
+        n2, d2 = operand
+        bound = max(_max_abs(n1) * _max_abs(d2), _max_abs(n2) * _max_abs(d1))
+        n1, d1, n2, d2 = _widen(bound, n1, d1, n2, d2)
+        return np.asarray(op(n1 * d2, n2 * d1), dtype=bool)
+
+    def __eq__(self, other):
+        return self._compare(other, np.equal)
+
+    def __ne__(self, other):
+        return self._compare(other, np.not_equal)
+
+    def __lt__(self, other):
+        return self._compare(other, np.less)
+
+    def __le__(self, other):
+        return self._compare(other, np.less_equal)
+
+    def __gt__(self, other):
+        return self._compare(other, np.greater)
+
+    def __ge__(self, other):
+        return self._compare(other, np.greater_equal)
+
+    __hash__ = None
+
+    def _reduce(self, kernel, empty):
+        """Попарная (древовидная) свёртка: log2(n) векторных проходов вместо n скалярных"""
+        num, den = self.numerators, self.denominators
+        if num.size == 0:
+            return empty
+        while num.size > 1:
+            half = num.size // 2
+            new_num, new_den = kernel(num[:half], den[:half], num[half:2 * half], den[half:2 * half])
+            if num.size % 2:
+                new_num = np.concatenate((new_num, num[-1:]))
+                new_den = np.concatenate((new_den, den[-1:]))
+            num, den = new_num, new_den
+        return Fraction._from_normalized(int(num[0]), int(den[0]))
+
+    def sum(self):
+        return self._reduce(_add, Fraction._from_normalized(0))
+
+    def prod(self):
+        return self._reduce(_mul, Fraction._from_normalized(1))
+
+    def cumsum(self):
+        """Префиксные суммы сканированием Хиллиса–Стила"""
+        num, den = self.numerators, self.denominators
+        shift = 1
+        while shift < num.size:
+            sum_num, sum_den = _add(num[shift:], den[shift:], num[:-shift], den[:-shift])
+            num = np.concatenate((num[:shift], sum_num))
+            den = np.concatenate((den[:shift], sum_den))
+            shift *= 2
+        return self._from_normalized(_fit(num), _fit(den))
+
+
+class ComplexArray:
+    """Массив комплексных чисел в одном из двух режимов:
+    точный — действительные и мнимые части в двух FractionArray,
+    быстрый — один буфер numpy complex128 (values)"""
+    __slots__ = ('real', 'imagine', 'values')
+    __array_ufunc__ = None
+
+    def __init__(self, real, imagine=None):
+        if not isinstance(real, FractionArray):
+            real = FractionArray(real)
+        if imagine is None:
+            imagine = FractionArray(np.zeros(len(real), dtype=np.int64))
+        elif not isinstance(imagine, FractionArray):
+            imagine = FractionArray(imagine)
+        if len(real) != len(imagine):
+            raise ValueError("real and imagine must have the same length")
+        self.real = real
+        self.imagine = imagine
+        self.values = None
+
+    @classmethod
+    def from_numpy(cls, values):
+        obj = object.__new__(cls)
+        obj.real = obj.imagine = None
+        obj.values = np.asarray(values, dtype=np.complex128)
+        return obj
+
+    @classmethod
+    def from_complexes(cls, values, exact=True):
+        values = [value if isinstance(value, Complex) else Complex(value) for value in values]
+        if not exact:
+            return cls.from_numpy([complex(float(v.real), float(v.imagine)) for v in values])
+        return cls(FractionArray.from_fractions([v.real for v in values]),
+                   FractionArray.from_fractions([v.imagine for v in values]))
+
+    @property
+    def exact(self):
+        return self.values is None
+
+    def to_numpy(self):
+        if self.exact:
+            return self.real.to_numpy() + 1j * self.imagine.to_numpy()
+        return self.values
+
+    def to_complexes(self):
+        """Список Complex; в быстром режиме части переводятся из float точно (Fraction.from_float)"""
+        if self.exact:
+            return [Complex._from_parts(r, i) for r, i in zip(self.real, self.imagine)]
+        return [Complex._from_parts(Fraction.from_float(z.real), Fraction.from_float(z.imag))
+                for z in self.values.tolist()]
+
+    def __len__(self):
+        return len(self.real) if self.exact else len(self.values)
+
+    def __getitem__(self, item):
+        if self.exact:
+            if isinstance(item, int | np.integer):
+                return Complex._from_parts(self.real[item], self.imagine[item])
+            return self.__class__(self.real[item], self.imagine[item])
+        if isinstance(item, int | np.integer):
+            value = self.values[item]
+            return Complex._from_parts(Fraction.from_float(float(value.real)), Fraction.from_float(float(value.imag)))
+        return self.from_numpy(self.values[item])
+
+    def __str__(self):
+        return f"[{', '.join(str(z) for z in self.to_complexes())}]"
+
+    def __repr__(self):
+        mode = 'exact' if self.exact else 'complex128'
+        return f"{self.__class__.__name__}({self}, {mode})"
+
+    @staticmethod
+    def _parts(other):
+        """(real, imagine) для точной арифметики или None, если операнд нужно считать во float"""
+        if isinstance(other, ComplexArray) and other.exact:
+            return other.real, other.imagine
+        if isinstance(other, Complex):
+            return other.real, other.imagine
+        if isinstance(other, int | Fraction):
+            return other, 0
+        return None
+
+    def _fast_operand(self, other):
+        if isinstance(other, ComplexArray):
+            return other.to_numpy()
+        if isinstance(other, Complex):
+            return complex(float(other.real), float(other.imagine))
+        if isinstance(other, int | float | complex | Fraction):
+            return complex(other)
+        return None
+
+    def _binary(self, other, exact_kernel, fast_kernel):
+        if self.exact:
+            parts = self._parts(other)
+            if parts is not None:
+                return self.__class__(*exact_kernel(self.real, self.imagine, *parts))
+        operand = self._fast_operand(other)
+        if operand is None:
+            return NotImplemented
+        return self.from_numpy(fast_kernel(self.to_numpy(), operand))
+
+    def __add__(self, other):
+        return self._binary(other, lambda a, b, c, d: (a + c, b + d), np.add)
+
+    def __sub__(self, other):
+        return self._binary(other, lambda a, b, c, d: (a - c, b - d), np.subtract)
+
+    def __mul__(self, other):
+        return self._binary(other, lambda a, b, c, d: (a * c - b * d, a * d + b * c), np.multiply)
+
+    def __truediv__(self, other):
+        return self._binary(other, _complex_div, _checked_div)
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+    def __rsub__(self, other):
+        return (-self).__add__(other)
+
+    def __rtruediv__(self, other):
+        if self.exact:
+            parts = self._parts(other)
+            if parts is not None:
+                return self.__class__(*_complex_div(*parts, self.real, self.imagine))
+        operand = self._fast_operand(other)
+        if operand is None:
+            return NotImplemented
+        return self.from_numpy(_checked_div(operand, self.to_numpy()))
+
+    def __neg__(self):
+        if self.exact:
+            return self.__class__(-self.real, -self.imagine)
+        return self.from_numpy(-self.values)
+
+    def conjugate(self):
+        if self.exact:
+            return self.__class__(self.real, -self.imagine)
+        return self.from_numpy(np.conjugate(self.values))
+
+    def abs2(self):
+        """Квадрат модуля; в точном режиме — FractionArray"""
+        if self.exact:
+            return self.real * self.real + self.imagine * self.imagine
+        return self.values.real ** 2 + self.values.imag ** 2
+
+    def __abs__(self):
+        if self.exact:
+            return np.sqrt(self.abs2().to_numpy())
+        return np.abs(self.values)
+
+    def arg(self):
+        if self.exact:
+            return np.arctan2(self.imagine.to_numpy(), self.real.to_numpy())
+        return np.angle(self.values)
+
+    def _ufunc(self, ufunc):
+        """Поэлементная функция в complex128: точный массив переводится один раз, результат быстрый"""
+        return self.from_numpy(ufunc(self.to_numpy()))
+
+    def exp(self):
+        return self._ufunc(np.exp)
+
+    def log(self):
+        return self._ufunc(np.log)
+
+    def sqrt(self):
+        return self._ufunc(np.sqrt)
+
+    def sin(self):
+        return self._ufunc(np.sin)
+
+    def cos(self):
+        return self._ufunc(np.cos)
+
+    def sum(self):
+        """Complex в точном режиме, встроенный complex в быстром"""
+        if self.exact:
+            return Complex._from_parts(self.real.sum(), self.imagine.sum())
+        return complex(self.values.sum())
+
+    def dot(self, other):
+        """Сумма попарных произведений (без сопряжения, как numpy.dot)"""
+        if not isinstance(other, ComplexArray):
+            raise TypeError(f"unsupported operand type: {type(other).__name__}")
+        if self.exact and other.exact:
+            return (self * other).sum()
+        return complex(np.dot(self.to_numpy(), other.to_numpy()))
+
+
+def _complex_div(a, b, c, d):
+    norm = c * c + d * d
+    return (a * c + b * d) / norm, (b * c - a * d) / norm
+
+
+def _checked_div(x, y):
+    if np.any(np.asarray(y) == 0):
+        raise ZeroDivisionError
+    return np.divide(x, y)
@@ -0,0 +1,605 @@
+import math
+import random
+import subprocess
+import sys
+import timeit
+import tracemalloc
+
+from classes import *
+
+
+def _per_call(func, number):
+    """Среднее время одного вызова func в микросекундах"""
+    best = min(timeit.repeat(func, number=number, repeat=3))
+    return best / number * 1e6
+
+
+def _alloc_per_item(factory, count):
+    """Средний объём памяти (в байтах) на один объект, созданный factory"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # список тоже занимает память: по одному указателю на элемент
+    return (after - before) / len(items) - 8
+
+
+def bench_fraction_ops(number=200_000):
+    a, b = Fraction(355, 113), Fraction(22, 7)
+    print('Fraction ops, мкс/операция')
+    print(f'  Fraction(3, 4)      {_per_call(lambda: Fraction(3, 4), number):.3f}')
+    print(f'  a + b               {_per_call(lambda: a + b, number):.3f}')
+    print(f'  a - b               {_per_call(lambda: a - b, number):.3f}')
+    print(f'  a * b               {_per_call(lambda: a * b, number):.3f}')
+    print(f'  a / b               {_per_call(lambda: a / b, number):.3f}')
+    print(f'  a + 1               {_per_call(lambda: a + 1, number):.3f}')
+
+    size = _alloc_per_item(lambda i: Fraction(i, 7), 100_000)
+    print(f'Память на экземпляр: {size:.1f} байт (sys.getsizeof: {sys.getsizeof(a)})')
+
+
+def bench_fraction_array(size=200_000):
+    from arrays import FractionArray
+
+    values = [Fraction(random.randint(-1000, 1000), random.randint(1, 1000)) for _ in range(size)]
+    other = [Fraction(random.randint(-1000, 1000), random.randint(1, 1000)) for _ in range(size)]
+    array, other_array = FractionArray.from_fractions(values), FractionArray.from_fractions(other)
+
+    def list_sum():
+        total = Fraction(0)
+        for value in values:
+            total = total + value
+        return total
+
+    print(f'FractionArray, {size} элементов, мс')
+    print(f'  list a * b          {_per_call(lambda: [x * y for x, y in zip(values, other)], 1) / 1000:.1f}')
+    print(f'  array a * b         {_per_call(lambda: array * other_array, 1) / 1000:.1f}')
+    print(f'  list sum            {_per_call(list_sum, 1) / 1000:.1f}')
+    print(f'  array sum           {_per_call(array.sum, 1) / 1000:.1f}')
+
+
+def bench_fraction_sum(size=1_000_000):
+    values = [Fraction(random.randint(-10_000, 10_000), random.choice((1, 2, 4, 5, 10, 20, 25, 100)))
+              for _ in range(size)]
+
+    def chain():
+        total = Fraction(0)
+        for value in values:
+            total = total + value
+        return total
+
+    print(f'Сумма {size} дробей, мс')
+    print(f'  цепочка +           {_per_call(chain, 1) / 1000:.1f}')
+    print(f'  Fraction.accumulate {_per_call(lambda: Fraction.accumulate(values), 1) / 1000:.1f}')
+
+
+def _str_float_to_fraction(num):
+    """Исходный перевод float через str(), для сравнения"""
+    if num.is_integer():
+        return int(num), 1
+    sign = -1 if num < 0 else 1
+    num = abs(num)
+    denom = 10 ** len(str(num).split('.')[-1])
+    numerator = round(num * denom)
+    gcd_val = math.gcd(numerator, denom)
+    return sign * numerator // gcd_val, denom // gcd_val
+
+
+def bench_float_conversion(size=1_000_000):
+    floats = [random.uniform(-1000, 1000) for _ in range(size)]
+    prices = [round(x, 2) for x in floats]
+    exact = [Fraction.from_float(x) for x in floats[:size // 10]]
+
+    def construct(values):
+        return [Fraction(x) for x in values]
+
+    def with_str_path(values):
+        current = Fraction.__dict__['_float_to_fraction']
+        Fraction._float_to_fraction = staticmethod(_str_float_to_fraction)
+        try:
+            return _per_call(lambda: construct(values), 1) / 1000
+        finally:
+            Fraction._float_to_fraction = current
+
+    print(f'float -> Fraction, {size} чисел, мс')
+    print(f'  Fraction(x), случайные, через str()  {with_str_path(floats):8.1f}')
+    print(f'  Fraction(x), случайные, через repr() {_per_call(lambda: construct(floats), 1) / 1000:8.1f}')
+    print(f'  Fraction(x), 2 знака, через str()    {with_str_path(prices):8.1f}')
+    print(f'  Fraction(x), 2 знака, через repr()   {_per_call(lambda: construct(prices), 1) / 1000:8.1f}')
+    print(f'  Fraction.from_float(x)               {_per_call(lambda: [Fraction.from_float(x) for x in floats], 1) / 1000:8.1f}')
+    print(f'  limit_denominator(1000), {len(exact)} чисел '
+          f'{_per_call(lambda: [f.limit_denominator(1000) for f in exact], 1) / 1000:.1f}')
+
+
+def bench_hash_cache(size=1_000_000):
+    pairs = [(random.randint(0, 100), 100) for _ in range(size)]
+    values = [Fraction(num, denom) for num, denom in pairs]
+
+    print(f'Дедупликация и кэш, {size} значений, мс')
+    print(f'  set(str(f))         {_per_call(lambda: set(map(str, values)), 1) / 1000:.1f}')
+    print(f'  set(f)              {_per_call(lambda: set(values), 1) / 1000:.1f}')
+    print(f'  Fraction(n, d)      {_per_call(lambda: [Fraction(n, d) for n, d in pairs], 1) / 1000:.1f}')
+    print(f'  Fraction.interned   {_per_call(lambda: [Fraction.interned(n, d) for n, d in pairs], 1) / 1000:.1f}')
+
+    cache = FractionCache()
+    size_plain = _alloc_per_item(lambda i: Fraction(*pairs[i]), 100_000)
+    size_cached = _alloc_per_item(lambda i: cache.get(*pairs[i]), 100_000)
+    print(f'Память на значение: {size_plain:.1f} -> {size_cached:.1f} байт, {cache!r}')
+
+
+def bench_pow(number=2_000):
+    rate = Fraction(10_035, 10_000)
+    print('Степени, мкс/операция')
+    for n in (12, 365, -365):
+        print(f'  rate ** {n:<12} {_per_call(lambda: rate ** n, number):.3f}')
+    print(f'  pow(rate, 365, m)   {_per_call(lambda: pow(rate, 365, 1_000_000_007), number):.3f}')
+    print(f'  Fraction(2).sqrt()  {_per_call(lambda: Fraction(2).sqrt(), number):.3f}')
+
+
+def bench_mixed_operands(size=100_000):
+    values = [Fraction(random.randint(-1000, 1000), random.choice((1, 2, 4, 5, 10, 20, 25, 100)))
+              for _ in range(size)]
+    print(f'Смешанные операнды, {size} дробей, мс')
+    print(f'  sum(values)         {_per_call(lambda: sum(values), 1) / 1000:.1f}')
+    print(f'  [3 * f]             {_per_call(lambda: [3 * f for f in values], 1) / 1000:.1f}')
+    print(f'  [f / 3]             {_per_call(lambda: [f / 3 for f in values], 1) / 1000:.1f}')
+    print(f'  [f + 1]             {_per_call(lambda: [f + 1 for f in values], 1) / 1000:.1f}')
+
+
+def bench_serialization(size=1_000_000):
+    import pickle
+
+    from serialization import decode_batch, encode_batch
+
+    values = [Fraction(random.randint(-10 ** 6, 10 ** 6), random.randint(1, 10 ** 6)) for _ in range(size)]
+    pickled, packed = pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL), encode_batch(values)
+
+    varint = encode_batch(values, varint=True)
+    # числитель и знаменатель случайны: ~41 бит информации на дробь, меньше без потерь не упаковать
+    bound = size * (math.log2(2 * 10 ** 6 + 1) + math.log2(10 ** 6)) / 8
+
+    print(f'Сериализация {size} дробей')
+    print(f'  размер pickle       {len(pickled) / 2 ** 20:.1f} МБ')
+    print(f'  размер batch        {len(packed) / 2 ** 20:.1f} МБ  (в {len(pickled) / len(packed):.1f} раза меньше pickle)')
+    print(f'  размер batch varint {len(varint) / 2 ** 20:.1f} МБ  (в {len(pickled) / len(varint):.1f} раза меньше pickle)')
+    print(f'  нижняя граница      {bound / 2 ** 20:.1f} МБ  (в {len(pickled) / bound:.1f} раза меньше pickle)')
+    print(f'  pickle.dumps        {_per_call(lambda: pickle.dumps(values, protocol=5), 1) / 1000:.1f} мс')
+    print(f'  encode_batch        {_per_call(lambda: encode_batch(values), 1) / 1000:.1f} мс')
+    print(f'  encode_batch varint {_per_call(lambda: encode_batch(values, varint=True), 1) / 1000:.1f} мс')
+    print(f'  pickle.loads        {_per_call(lambda: pickle.loads(pickled), 1) / 1000:.1f} мс')
+    print(f'  decode_batch        {_per_call(lambda: decode_batch(packed), 1) / 1000:.3f} мс')
+    print(f'  decode + to_fractions {_per_call(lambda: decode_batch(packed).to_fractions(), 1) / 1000:.1f} мс')
+
+
+def bench_parse(size=1_000_000):
+    import fractions
+
+    texts = [random.choice((f'{random.randint(-10 ** 6, 10 ** 6) / 100:.2f}',
+                            f'{random.randint(1, 1000)}/{random.randint(1, 1000)}',
+                            f'{random.randint(1, 999)}e-{random.randint(1, 9)}'))
+             for _ in range(size)]
+    print(f'Разбор {size} строк, мс')
+    print(f'  fractions.Fraction  {_per_call(lambda: [fractions.Fraction(t) for t in texts], 1) / 1000:.1f}')
+    print(f'  Fraction.from_str   {_per_call(lambda: [Fraction.from_str(t) for t in texts], 1) / 1000:.1f}')
+    print(f'  Fraction.parse_many {_per_call(lambda: Fraction.parse_many(texts), 1) / 1000:.1f}')
+    column = [f'{random.randint(0, 10_000) / 100:.2f}' for _ in range(size)]
+    print(f'  столбец цен: fractions.Fraction {_per_call(lambda: [fractions.Fraction(t) for t in column], 1) / 1000:.1f}')
+    print(f'  столбец цен: parse_many         {_per_call(lambda: Fraction.parse_many(column), 1) / 1000:.1f}')
+
+
+def bench_sort(size=1_000_000):
+    import heapq
+
+    values = [Fraction(random.randint(-10 ** 6, 10 ** 6), random.randint(1, 10 ** 6)) for _ in range(size)]
+    print(f'Сортировка {size} дробей, мс')
+    print(f'  sorted(values)             {_per_call(lambda: sorted(values), 1) / 1000:.1f}')
+    print(f'  sorted_fractions(values)   {_per_call(lambda: sorted_fractions(values), 1) / 1000:.1f}')
+    print(f'  heapq.nsmallest(100)       {_per_call(lambda: heapq.nsmallest(100, values), 1) / 1000:.1f}')
+    print(f'  nsmallest(100)             {_per_call(lambda: nsmallest(100, values), 1) / 1000:.1f}')
+
+
+def bench_complex_pow(number=20_000):
+    z = Complex(Fraction(3, 5), Fraction(4, 5))
+    print('Степени Complex, мкс/операция')
+    print(f'  z ** 40             {_per_call(lambda: z ** 40, number):.3f}')
+    print(f'  z ** -3             {_per_call(lambda: z ** -3, number):.3f}')
+    print(f'  z.power(40, exact=False) {_per_call(lambda: z.power(40, exact=False), number):.3f}')
+
+
+def bench_complex_ops(size=1_000_000):
+    values = [Complex(Fraction(random.randint(-100, 100), random.randint(1, 10)), random.randint(-100, 100))
+              for _ in range(size)]
+    z = Complex(Fraction(1, 2), 3)
+
+    print(f'Complex, {size} элементов, мс')
+    print(f'  [x + z]             {_per_call(lambda: [x + z for x in values], 1) / 1000:.1f}')
+    print(f'  [x * z]             {_per_call(lambda: [x * z for x in values], 1) / 1000:.1f}')
+    print(f'  [x / z]             {_per_call(lambda: [x / z for x in values], 1) / 1000:.1f}')
+    print(f'  [abs(x)]            {_per_call(lambda: [abs(x) for x in values], 1) / 1000:.1f}')
+
+    size = _alloc_per_item(lambda i: Complex(i, 7), 100_000)
+    print(f'Память на экземпляр: {size:.1f} байт (sys.getsizeof: {sys.getsizeof(z)})')
+
+
+def bench_complex_array(size=100_000):
+    from arrays import ComplexArray
+
+    values = [Complex(random.randint(-100, 100), random.randint(-100, 100)) for _ in range(size)]
+    other = [Complex(random.randint(-100, 100), random.randint(1, 100)) for _ in range(size)]
+    exact, other_exact = ComplexArray.from_complexes(values), ComplexArray.from_complexes(other)
+    fast, other_fast = ComplexArray.from_complexes(values, exact=False), ComplexArray.from_complexes(other, exact=False)
+
+    print(f'ComplexArray, {size} элементов, мс')
+    for name, op in (('*', lambda x, y: x * y), ('/', lambda x, y: x / y)):
+        print(f'  list a {name} b          {_per_call(lambda: [op(x, y) for x, y in zip(values, other)], 1) / 1000:.1f}')
+        print(f'  exact a {name} b         {_per_call(lambda: op(exact, other_exact), 1) / 1000:.1f}')
+        print(f'  complex128 a {name} b    {_per_call(lambda: op(fast, other_fast), 1) / 1000:.2f}')
+
+
+def _traced(func):
+    """(время в мс, пиковая память под tracemalloc в КБ)"""
+    tracemalloc.start()
+    start = timeit.default_timer()
+    func()
+    elapsed = timeit.default_timer() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed * 1000, peak / 1024
+
+
+def bench_complex_accumulate(size=1_000_000):
+    samples = [Complex(Fraction(random.randint(-10 ** 4, 10 ** 4), random.choice((1, 2, 4, 5, 10, 100))),
+                       Fraction(random.randint(-10 ** 4, 10 ** 4), random.choice((1, 2, 4, 5, 10, 100))))
+               for _ in range(size)]
+
+    def plus():
+        total = Complex(0)
+        for sample in samples:
+            total = total + sample
+        return total
+
+    def inplace():
+        total = Complex(0)
+        for sample in samples:
+            total += sample
+        return total
+
+    print(f'Накопление суммы {size} Complex: мс, пик tracemalloc КБ')
+    for name, func in (('total = total + z', plus), ('total += z', inplace),
+                       ('ComplexAccumulator', lambda: ComplexAccumulator(samples).value())):
+        elapsed, peak = _traced(func)
+        print(f'  {name:<20} {elapsed:10.1f} {peak:10.1f}')
+
+
+def bench_polynomial(degree=1000, points=100):
+    from polynomial import Polynomial
+
+    def coefficients():
+        return [Fraction(random.randint(-100, 100), random.randint(1, 12)) for _ in range(degree + 1)]
+
+    a, b = coefficients(), coefficients()
+    p, q = Polynomial(a), Polynomial(b)
+    xs = [Fraction(random.randint(-9, 9), random.randint(9, 20)) for _ in range(points)]
+    zs = [Complex(Fraction(random.randint(-9, 9), 7), Fraction(random.randint(-9, 9), 5)) for _ in range(points)]
+
+    def horner(coefficients, x):
+        result = x - x
+        for c in reversed(coefficients):
+            result = result * x + c
+        return result
+
+    def naive_product():
+        result = [Fraction(0)] * (len(a) + len(b) - 1)
+        for i, x in enumerate(a):
+            for j, y in enumerate(b):
+                result[i + j] += x * y
+        return result
+
+    print(f'Многочлен степени {degree}, мс')
+    print(f'  Горнер на Fraction, {points} точек      {_per_call(lambda: [horner(a, x) for x in xs], 1) / 1000:10.1f}')
+    print(f'  evaluate_many, {points} точек           {_per_call(lambda: p.evaluate_many(xs), 1) / 1000:10.1f}')
+    print(f'  Горнер на Complex, {points} точек       {_per_call(lambda: [horner(a, z) for z in zs], 1) / 1000:10.1f}')
+    print(f'  evaluate_many Complex, {points} точек   {_per_call(lambda: p.evaluate_many(zs), 1) / 1000:10.1f}')
+    print(f'  evaluate_many exact=False            {_per_call(lambda: p.evaluate_many(xs, exact=False), 1) / 1000:10.2f}')
+    print(f'  произведение циклами                 {_per_call(naive_product, 1) / 1000:10.1f}')
+    print(f'  произведение Карацубой               {_per_call(lambda: p * q, 1) / 1000:10.1f}')
+    print(f'  корни (Аберт)                        {_per_call(p.roots, 1) / 1000:10.1f}')
+
+
+def bench_matrix(n=100):
+    from matrix import FractionMatrix
+
+    rows = [[Fraction(random.randint(-100, 100), random.randint(1, 12)) for _ in range(n)] for _ in range(n)]
+    b = [Fraction(random.randint(-100, 100), random.randint(1, 12)) for _ in range(n)]
+    a = FractionMatrix(rows)
+
+    def naive_matmul():
+        columns = list(zip(*rows))
+        return [[sum((x * y for x, y in zip(row, column)), Fraction(0)) for column in columns] for row in rows]
+
+    def naive_solve():
+        m = [row + [v] for row, v in zip(rows, b)]
+        for k in range(n):
+            pivot = next(i for i in range(k, n) if m[i][k] != 0)
+            m[k], m[pivot] = m[pivot], m[k]
+            for i in range(k + 1, n):
+                factor = m[i][k] / m[k][k]
+                m[i] = [x - factor * y for x, y in zip(m[i], m[k])]
+        x = [Fraction(0)] * n
+        for i in range(n - 1, -1, -1):
+            x[i] = (m[i][n] - sum((m[i][j] * x[j] for j in range(i + 1, n)), Fraction(0))) / m[i][i]
+        return x
+
+    print(f'Матрица {n}x{n} из Fraction, мс')
+    print(f'  списки: произведение       {_per_call(naive_matmul, 1) / 1000:10.1f}')
+    print(f'  FractionMatrix @            {_per_call(lambda: a @ a, 1) / 1000:10.1f}')
+    print(f'  FractionMatrix Штрассен     {_per_call(lambda: a.matmul(a, strassen=True), 1) / 1000:10.1f}')
+    print(f'  FractionMatrix 4 процесса   {_per_call(lambda: a.matmul(a, processes=4), 1) / 1000:10.1f}')
+    print(f'  списки: решение Гауссом    {_per_call(naive_solve, 1) / 1000:10.1f}')
+    print(f'  FractionMatrix.solve        {_per_call(lambda: a.solve(b), 1) / 1000:10.1f}')
+    print(f'  FractionMatrix.det          {_per_call(a.det, 1) / 1000:10.1f}')
+    print(f'  FractionMatrix.inverse      {_per_call(a.inverse, 1) / 1000:10.1f}')
+
+
+def bench_stdlib(size=100_000):
+    import fractions
+    from decimal import Decimal
+
+    pairs = [(random.randint(-1000, 1000), random.choice((1, 2, 4, 5, 10, 20, 25, 100))) for _ in range(size)]
+    ours = [Fraction(n, d) for n, d in pairs]
+    stdlib = [fractions.Fraction(n, d) for n, d in pairs]
+    decimals = [Decimal(n) / d for n, d in pairs]
+    complexes = [Complex(n, d) for n, d in pairs]
+    builtins = [complex(n, d) for n, d in pairs]
+
+    def dot(xs, ys):
+        return sum(x * y for x, y in zip(xs, ys))
+
+    print(f'Типы стандартной библиотеки, {size} значений, мс')
+    print(f'  sum fractions.Fraction          {_per_call(lambda: sum(stdlib), 1) / 1000:10.1f}')
+    print(f'  sum Fraction                    {_per_call(lambda: sum(ours), 1) / 1000:10.1f}')
+    print(f'  dot fractions.Fraction          {_per_call(lambda: dot(stdlib, stdlib), 1) / 1000:10.1f}')
+    print(f'  dot Fraction                    {_per_call(lambda: dot(ours, ours), 1) / 1000:10.1f}')
+    print(f'  Fraction + fractions.Fraction   {_per_call(lambda: [x + y for x, y in zip(ours, stdlib)], 1) / 1000:10.1f}')
+    print(f'  то же через str()               '
+          f'{_per_call(lambda: [x + Fraction.from_str(str(y)) for x, y in zip(ours, stdlib)], 1) / 1000:10.1f}')
+    print(f'  Fraction + Decimal              {_per_call(lambda: [x + y for x, y in zip(ours, decimals)], 1) / 1000:10.1f}')
+    print(f'  to_stdlib()                     {_per_call(lambda: [x.to_stdlib() for x in ours], 1) / 1000:10.1f}')
+    print(f'  fractions.Fraction(n, d)        '
+          f'{_per_call(lambda: [fractions.Fraction(x.numerator, x.denominator) for x in ours], 1) / 1000:10.1f}')
+    print(f'  from_stdlib()                   {_per_call(lambda: [Fraction.from_stdlib(x) for x in stdlib], 1) / 1000:10.1f}')
+    print(f'  complex * complex               {_per_call(lambda: [x * x for x in builtins], 1) / 1000:10.1f}')
+    print(f'  Complex * Complex               {_per_call(lambda: [x * x for x in complexes], 1) / 1000:10.1f}')
+    print(f'  Complex * complex               {_per_call(lambda: [x * y for x, y in zip(complexes, builtins)], 1) / 1000:10.1f}')
+
+
+def bench_complex_functions(size=100_000):
+    import cmath
+    from arrays import ComplexArray
+
+    phasors = [Complex(Fraction(random.randint(-300, 300), 100), Fraction(random.randint(-628, 628), 100))
+               for _ in range(size)]
+    array = ComplexArray.from_complexes(phasors, exact=False)
+
+    print(f'exp для {size} Complex, мс')
+    print(f'  через complex и cmath вручную     '
+          f'{_per_call(lambda: [cmath.exp(complex(float(z.real), float(z.imagine))) for z in phasors], 1) / 1000:10.1f}')
+    print(f'  z.exp()                           {_per_call(lambda: [z.exp() for z in phasors], 1) / 1000:10.1f}')
+    print(f"  Complex.evaluate_many('exp')      {_per_call(lambda: Complex.evaluate_many('exp', phasors), 1) / 1000:10.1f}")
+    print(f'  ComplexArray.exp (complex128)     {_per_call(array.exp, 1) / 1000:10.2f}')
+    few = phasors[:1000]
+    for name, precision in (('1e-6', Fraction(1, 10 ** 6)), ('1e-30', Fraction(1, 10 ** 30))):
+        label = f'z.exp({name}), мкс/вызов'
+        print(f'  {label:<34}{_per_call(lambda: [z.exp(precision) for z in few], 1) / len(few):10.1f}')
+
+
+def bench_precision(steps=2000):
+    values = [Fraction(random.randint(900, 1100), random.randint(900, 1100)) for _ in range(steps)]
+
+    def chain():
+        result = Fraction(1)
+        for x in values:
+            result = result * x + Fraction(1, 7)
+        return result
+
+    def bounded(**bounds):
+        with precision(**bounds) as stats:
+            chain()
+        return stats
+
+    exact = chain()
+    print(f'Цепочка r = r * x + 1/7 из {steps} шагов')
+    print(f'  точно, мс                          {_per_call(chain, 1) / 1000:10.1f}'
+          f'   бит в результате: {exact.denominator.bit_length()}')
+    for label, bounds in (('precision() без ограничений', {}),
+                          ('max_denominator=10**6', {'max_denominator': 10 ** 6}),
+                          ('max_denominator=10**30', {'max_denominator': 10 ** 30}),
+                          ('tolerance=1e-12', {'tolerance': Fraction(1, 10 ** 12)})):
+        stats = bounded(**bounds)
+        print(f'  {label:<33}{_per_call(lambda: bounded(**bounds), 1) / 1000:10.1f}'
+              f'   max_bits={stats.max_bits}, mean_bits={stats.mean_bits:.0f}, max_error={stats.max_error:.2g}')
+
+
+def _import_time(statement):
+    """Суммарное время импорта (мс) по python -X importtime и список загруженных модулей верхнего уровня"""
+    code = f'import sys; {statement}; print(" ".join(sorted({{m.partition(".")[0] for m in sys.modules}})))'
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True, check=True)
+    total = 0
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package; модули верхнего уровня без отступа
+        fields = line.split('|')
+        if len(fields) == 3 and fields[1].strip().isdigit() and not fields[2].startswith('  '):
+            total += int(fields[1])
+    return total / 1000, set(result.stdout.split())
+
+
+def bench_import():
+    heavy = ('sklearn', 'matplotlib', 'seaborn', 'tensorflow', 'torch')
+    print('Время импорта (python -X importtime), мс')
+    for statement in ('import pandas', 'import dataset_hw', 'import dataset_hw; from sklearn import preprocessing',
+                      'import dataset_hw; import seaborn'):
+        total, modules = _import_time(statement)
+        loaded = ', '.join(name for name in heavy if name in modules) or '-'
+        print(f'  {statement:<55}{total:8.0f}   загружены: {loaded}')
+
+
+def bench_streaming(rows=2_000_000, chunksize=100_000):
+    import os
+    import tempfile
+
+    import numpy as np
+    import pandas as pd
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, 'data.csv')
+        generator = np.random.default_rng(0)
+        for start in range(0, rows, chunksize):
+            x = generator.normal(size=chunksize)
+            x[generator.random(chunksize) < 0.1] = np.nan
+            chunk = pd.DataFrame({'x': x, 'y': generator.integers(0, 1000, chunksize),
+                                  'kind': generator.choice(['a', 'b', 'c'], chunksize)})
+            chunk.to_csv(source, mode='a', header=start == 0, index=False)
+
+        # каждый режим в отдельном процессе, чтобы пиковая память (ru_maxrss) не смешивалась
+        template = '''
+import resource, time
+from dataset_hw import Dataset
+start = time.perf_counter()
+dataset = Dataset.from_csv({source!r}, chunksize={chunksize})
+{body}
+print(time.perf_counter() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024)
+'''
+        in_memory = '''dataset.df = dataset.df.fillna({'x': dataset.df['x'].mean()})
+dataset.remove_outliers('x')
+dataset.check_categorical(10)
+dataset.df.to_csv(%r, index=False)''' % os.path.join(directory, 'out.csv')
+        streaming = '''dataset.fill_missing('mean')
+dataset.remove_outliers('x')
+dataset.check_categorical(10)
+dataset.write(%r)''' % os.path.join(directory, 'out.csv')
+
+        size = os.path.getsize(source) / 2 ** 20
+        print(f'CSV {rows} строк ({size:.0f} МБ): заполнение, выбросы, категории, запись')
+        for label, size_of_chunk, body in (('Dataset в памяти', None, in_memory),
+                                           (f'StreamingDataset, chunksize={chunksize}', chunksize, streaming)):
+            code = template.format(source=source, chunksize=size_of_chunk, body=body)
+            result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+            seconds, peak = map(float, result.stdout.split())
+            print(f'  {label:<38}{seconds:8.1f} с   пик RSS {peak:8.0f} МБ')
+
+
+def bench_dataset_cache(rows=1_000_000):
+    import os
+    import tempfile
+
+    import numpy as np
+    import pandas as pd
+    from dataset_hw import Dataset, DatasetCache
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, 'data.csv')
+        generator = np.random.default_rng(0)
+        pd.DataFrame({'x': generator.normal(size=rows), 'y': generator.integers(0, 1000, rows),
+                      'kind': generator.choice(['a', 'b', 'c'], rows)}).to_csv(source, index=False)
+        cache = DatasetCache(os.path.join(directory, 'cache'))
+
+        print(f'Загрузка CSV из {rows} строк, мс')
+        print(f'  Dataset(path)                      {_per_call(lambda: Dataset(source), 1) / 1000:10.1f}')
+        print(f'  первая загрузка с кэшем (промах)   {_per_call(lambda: (cache.clear(), Dataset(source, cache)), 1) / 1000:10.1f}')
+        print(f'  повторная загрузка (попадание)     {_per_call(lambda: Dataset(source, cache), 1) / 1000:10.1f}')
+        print(f'  {cache!r}')
+
+
+def bench_fill_missing(rows=500_000, columns=20):
+    import numpy as np
+    import pandas as pd
+    from dataset_hw import Dataset, apply_fill
+
+    generator = np.random.default_rng(0)
+    data = generator.normal(size=(rows, columns))
+    data[generator.random((rows, columns)) < 0.05] = np.nan
+    df = pd.DataFrame(data, columns=[f'c{i}' for i in range(columns)])
+    df['key'] = generator.integers(0, 100, rows)
+
+    def fill(strategy, **options):
+        dataset = Dataset.__new__(Dataset)
+        dataset.df = df
+        dataset.fill_missing(strategy, **options)
+        return dataset
+
+    fill_values = fill('mean').fill_values
+    print(f'fill_missing, {rows} строк x {columns} столбцов, мс')
+    for label, call in (('mean', lambda: fill('mean')), ('median', lambda: fill('median')),
+                        ('mode', lambda: fill('mode')), ('ffill', lambda: fill('ffill')),
+                        ("group_mean по 'key'", lambda: fill('group_mean', by='key')),
+                        ('apply_fill с готовыми значениями', lambda: apply_fill(df, fill_values))):
+        print(f'  {label:<34}{_per_call(call, 1) / 1000:10.1f}')
+
+
+def bench_preprocessor(rows=100_000):
+    import os
+    import tempfile
+
+    import numpy as np
+    import pandas as pd
+    from dataset_hw import Dataset, Preprocessor
+
+    generator = np.random.default_rng(0)
+    train = pd.DataFrame({'x': generator.normal(size=rows), 'kind': generator.choice(['a', 'b', 'c', 'd'], rows),
+                          'level': generator.integers(0, 10, rows)})
+    train.loc[generator.random(rows) < 0.1, 'x'] = np.nan
+    request, batch = train.sample(1, random_state=1), train.sample(1000, random_state=2)
+
+    def refit(df):
+        # как раньше: обучение на всех данных при каждой обработке
+        dataset = Dataset.from_frame(pd.concat([train, df]))
+        dataset.preparation(threshold_of_num_cat=10)
+        return dataset.df.iloc[-len(df):]
+
+    preprocessor = Preprocessor(threshold_of_num_cat=10).fit(train)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'preprocessor.pkl')
+        preprocessor.save(path)
+
+        print(f'Предобработка, обучение на {rows} строках, мс')
+        print(f'  preparation заново на каждый запрос  {_per_call(lambda: refit(request), 1) / 1000:10.2f}')
+        print(f'  Preprocessor.load                    {_per_call(lambda: Preprocessor.load(path), 10) / 1000:10.2f}')
+        print(f'  transform, 1 строка                  {_per_call(lambda: preprocessor.transform(request), 100) / 1000:10.2f}')
+        print(f'  transform, 1000 строк                {_per_call(lambda: preprocessor.transform(batch), 10) / 1000:10.2f}')
+
+
+BENCHMARKS = {
+    'fraction_ops': bench_fraction_ops,
+    'fraction_array': bench_fraction_array,
+    'fraction_sum': bench_fraction_sum,
+    'float_conversion': bench_float_conversion,
+    'hash_cache': bench_hash_cache,
+    'pow': bench_pow,
+    'mixed_operands': bench_mixed_operands,
+    'serialization': bench_serialization,
+    'parse': bench_parse,
+    'sort': bench_sort,
+    'complex_pow': bench_complex_pow,
+    'complex_ops': bench_complex_ops,
+    'complex_array': bench_complex_array,
+    'complex_accumulate': bench_complex_accumulate,
+    'polynomial': bench_polynomial,
+    'matrix': bench_matrix,
+    'stdlib': bench_stdlib,
+    'complex_functions': bench_complex_functions,
+    'precision': bench_precision,
+    'import': bench_import,
+    'streaming': bench_streaming,
+    'dataset_cache': bench_dataset_cache,
+    'fill_missing': bench_fill_missing,
+    'preprocessor': bench_preprocessor,
+}
+
+
+if __name__ == '__main__':
+    random.seed(0)
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        BENCHMARKS[name]()
+        print()
@@ -1,18 +1,329 @@
+import cmath
+import contextvars
+import fractions
+import heapq
 import math
+import numbers
+import operator
+import re
+import sys
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from decimal import Decimal
+from itertools import count
+
+_HASH_MODULUS = sys.hash_info.modulus
+_HASH_INF = sys.hash_info.inf
+# "3/4", "-1.25", "2e-3", ".5", "+7"
+_RATIONAL_FORMAT = re.compile(r"""
+    \A\s*
+    (?P<sign>[-+]?)
+    (?=\d|\.\d)
+    (?P<num>\d*)
+    (?:
+        /(?P<denom>\d+)
+    |
+        (?:\.(?P<decimal>\d*))?
+        (?:[eE](?P<exp>[-+]?\d+))?
+    )
+    \s*\Z
+""", re.VERBOSE)
+# обратные по модулю для частых знаменателей: pow(d, -1, m) дороже самого хэширования
+_hash_inverses = {}
+
+# fractions.Fraction из уже сокращённой пары без повторного gcd (в 3.12+ — _from_coprime_ints)
+_stdlib_from_coprime_ints = getattr(fractions.Fraction, '_from_coprime_ints', None)
+_ORDERINGS = (operator.lt, operator.le, operator.gt, operator.ge)
+
+# активный PrecisionContext, см. precision; счётчик открытых контекстов позволяет
+# обычной арифметике не обращаться к ContextVar, пока ни одного контекста нет.
+# Счётчик общий для всех потоков, поэтому изменяется только под блокировкой
+_precision_context = contextvars.ContextVar('precision', default=None)
+_bounded_contexts = 0
+_bounded_lock = threading.Lock()
+
+
+def _write_varint(out, value):
+    """Беззнаковый LEB128: по 7 бит на байт, старший бит — признак продолжения"""
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos):
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _zigzag(value):
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+def _unzigzag(value):
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+# Точные приближения трансцендентных функций считаются с фиксированной точкой:
+# целое v при масштабе p означает v / 2**p. Ряды идут по модулю аргумента, потому что
+# сдвиг и // отрицательных чисел округляют вниз и член ряда застревал бы на -1.
+# Константы хранятся с наибольшей уже посчитанной точностью: {имя: (p, значение)}
+_fixed_constants = {}
+
+
+def _fixed_constant(name, p, compute):
+    bits, value = _fixed_constants.get(name, (-1, 0))
+    if bits < p:
+        bits = p + 64
+        value = compute(bits)
+        _fixed_constants[name] = bits, value
+    return value >> (bits - p)
+
+
+def _to_fixed(value, p):
+    return (value.numerator << p) // value.denominator
+
+
+def _fixed_atan_inverse(n, p):
+    """atan(1 / n) для целого n > 1"""
+    total = power = (1 << p) // n
+    n2, k, sign = n * n, 3, -1
+    while power:
+        power //= n2
+        total += sign * (power // k)
+        k, sign = k + 2, -sign
+    return total
+
+
+def _fixed_pi(p):
+    # формула Мэчина: pi = 16 atan(1/5) - 4 atan(1/239)
+    return _fixed_constant('pi', p, lambda bits: (16 * _fixed_atan_inverse(5, bits + 8)
+                                                  - 4 * _fixed_atan_inverse(239, bits + 8)) >> 8)
+
+
+def _fixed_atanh(t, p):
+    """atanh(t) для 0 <= t <= 1/3"""
+    total = power = t
+    t2, k = t * t >> p, 3
+    while power:
+        power = power * t2 >> p
+        total += power // k
+        k += 2
+    return total
+
+
+def _fixed_ln2(p):
+    return _fixed_constant('ln2', p, lambda bits: _fixed_atanh((1 << bits + 8) // 3, bits + 8) >> 7)
+
+
+def _fixed_exp(x, p):
+    """e**x с относительной погрешностью в несколько единиц 2**-p"""
+    if x < 0:
+        return (1 << 2 * p) // _fixed_exp(-x, p)
+    # ряд считается для x / 2**m < 1/8, затем результат m раз возводится в квадрат
+    m = max(0, x.bit_length() - p + 3)
+    q = p + m + 16
+    r = (x << q - p) >> m
+    total = term = 1 << q
+    k = 1
+    while term:
+        term = term * r // (k << q)
+        total += term
+        k += 1
+    for _ in range(m):
+        total = total * total >> q
+    return total >> q - p
+
+
+def _fixed_expi(y, p):
+    """(cos y, sin y): ряд для e**(ir) после приведения y к [-pi, pi]"""
+    q = p + max(0, y.bit_length() - p) + 16
+    pi = _fixed_pi(q)
+    r = (y << q - p) % (2 * pi)
+    if r > pi:
+        r -= 2 * pi
+    negative, r = r < 0, abs(r)
+    cos, sin = term, _ = 1 << q, 0
+    k = 1
+    while term:
+        term = term * r // (k << q)
+        # i**k: 1, i, -1, -i
+        phase = k % 4
+        if phase == 1:
+            sin += term
+        elif phase == 2:
+            cos -= term
+        elif phase == 3:
+            sin -= term
+        else:
+            cos += term
+        k += 1
+    if negative:
+        sin = -sin
+    return cos >> q - p, sin >> q - p
+
+
+def _fixed_ln(num, den, p):
+    """ln(num / den) для положительной дроби: e ln 2 + 2 atanh((f - 1) / (f + 1)), f в (1/2, 2)"""
+    e = num.bit_length() - den.bit_length()
+    a, b = (num, den << e) if e >= 0 else (num << -e, den)
+    q = p + e.bit_length() + 16
+    t = ((a - b) << q) // (a + b)
+    ln_f = 2 * _fixed_atanh(abs(t), q)
+    return (e * _fixed_ln2(q) + (ln_f if t >= 0 else -ln_f)) >> q - p
+
+
+def _fixed_atan(t, p):
+    """atan(t) для 0 <= t <= 1: два раза atan(t) = 2 atan(t / (1 + sqrt(1 + t**2))), потом ряд"""
+    one = 1 << p
+    for _ in range(2):
+        t = (t << p) // (one + math.isqrt((one << p) + t * t))
+    total = power = t
+    t2, k, sign = t * t >> p, 3, -1
+    while power:
+        power = power * t2 >> p
+        total += sign * (power // k)
+        k, sign = k + 2, -sign
+    return 4 * total
+
+
+def _fixed_atan2(y, x, p):
+    """Аргумент точки (x, y) с рациональными координатами, как у cmath.phase"""
+    if not y and not x:
+        return 0
+    q = p + 16
+    ay, ax = abs(y), abs(x)
+    if ay <= ax:
+        angle = _fixed_atan((ay.numerator * ax.denominator << q) // (ay.denominator * ax.numerator), q)
+    else:
+        angle = (_fixed_pi(q) >> 1) - _fixed_atan((ax.numerator * ay.denominator << q) // (ax.denominator * ay.numerator), q)
+    if x < 0:
+        angle = _fixed_pi(q) - angle
+    if y < 0:
+        angle = -angle
+    return angle >> q - p
+
+
+def _as_precision(precision):
+    if not isinstance(precision, int | float | Fraction):
+        raise TypeError("precision must be a number")
+    precision = precision if isinstance(precision, Fraction) else Fraction(precision)
+    if precision <= 0:
+        raise ValueError("precision must be positive")
+    return precision
+
+
+def _precision_bits(precision):
+    """p, при котором 2**-p меньше precision / 16: запас на ошибки округления в рядах"""
+    precision = _as_precision(precision)
+    return (-(-precision.denominator // precision.numerator)).bit_length() + 4
 
 
 class Fraction:
+    __slots__ = ('numerator', 'denominator')
+
     def __init__(self, num, denom=1):
         if denom == 0:
             raise ValueError("Denominator cannot be zero")
 
-        if isinstance(num, Fraction) or isinstance(denom, Fraction):
+        if type(num) is int and type(denom) is int:
+            self.numerator = num
+            self.denominator = denom
+        elif isinstance(num, Fraction) or isinstance(denom, Fraction):
             self._handle_fraction_input(num, denom)
         else:
             self._handle_float_input(num, denom)
 
         self._simplify()
 
+    @classmethod
+    def accumulate(cls, values):
+        """Точная сумма values с одним сокращением в конце, см. FractionSum"""
+        return FractionSum(values).value()
+
+    @classmethod
+    def from_str(cls, text):
+        """Точный разбор строки: Fraction.from_str("-1.25") == Fraction(-5, 4)"""
+        match = _RATIONAL_FORMAT.match(text)
+        if match is None:
+            raise ValueError(f"invalid literal for Fraction: {text!r}")
+        return cls._from_groups(*match.groups())
+
+    @classmethod
+    def parse_many(cls, texts, errors='raise'):
+        """Разбор последовательности строк. Ошибочные строки собираются по номерам:
+        errors='raise' — FractionParseError со списком (номер, строка) после разбора всех строк,
+        errors='ignore' — на их месте в результате стоит None"""
+        if errors not in ('raise', 'ignore'):
+            raise ValueError("errors must be 'raise' or 'ignore'")
+        match_format = _RATIONAL_FORMAT.match
+        from_groups = cls._from_groups
+        result = []
+        append = result.append
+        bad_rows = []
+        # в столбцах CSV значения часто повторяются: одинаковые строки разбираются один раз
+        seen = {}
+        for index, text in enumerate(texts):
+            value = seen.get(text) if isinstance(text, str) else None
+            if value is not None:
+                append(value)
+                continue
+            match = match_format(text) if isinstance(text, str) else None
+            if match is not None:
+                try:
+                    value = seen[text] = from_groups(*match.groups())
+                    append(value)
+                    continue
+                except ValueError:
+                    # нулевой знаменатель
+                    pass
+            bad_rows.append((index, text))
+            append(None)
+        if bad_rows and errors == 'raise':
+            raise FractionParseError(bad_rows)
+        return result
+
+    @classmethod
+    def _from_groups(cls, sign, num, denom, decimal, exp):
+        """Дробь из групп _RATIONAL_FORMAT"""
+        num = int(num) if num else 0
+        if denom:
+            denom = int(denom)
+            if denom == 0:
+                raise ValueError("Denominator cannot be zero")
+        else:
+            denom = 1
+            if decimal:
+                denom = 10 ** len(decimal)
+                num = num * denom + int(decimal)
+            if exp:
+                exp = int(exp)
+                if exp >= 0:
+                    num *= 10 ** exp
+                else:
+                    denom *= 10 ** -exp
+        if sign == '-':
+            num = -num
+        gcd_val = math.gcd(num, denom)
+        if gcd_val == 1:
+            return cls._from_normalized(num, denom)
+        return cls._from_normalized(num // gcd_val, denom // gcd_val)
+
+    @classmethod
+    def _from_normalized(cls, num, denom=1):
+        """Создание без проверок: num и denom — целые, взаимно простые, denom > 0"""
+        obj = object.__new__(cls)
+        obj.numerator = num
+        obj.denominator = denom
+        return obj
+
     def _handle_fraction_input(self, num, denom):
         """num или denom — это объект Fraction"""
         if isinstance(num, Fraction) and isinstance(denom, Fraction):
@@ -60,21 +371,108 @@ class Fraction:
             self.numerator = -self.numerator
             self.denominator = -self.denominator
 
-    def _float_to_fraction(self, num):
+    @staticmethod
+    def _float_to_fraction(num):
+        """Десятичная дробь из repr(num) — кратчайшей записи, которая округляется в num;
+        целые float переводятся в int точно"""
         if num.is_integer():
             return int(num), 1
+        text = repr(num)
+        if 'e' not in text and 'n' not in text:
+            # обычная запись '-123.456': цифры без точки и есть числитель
+            whole, _, decimal = text.partition('.')
+            numerator, denom = int(whole + decimal), 10 ** len(decimal)
+            gcd_val = math.gcd(numerator, denom)
+            return numerator // gcd_val, denom // gcd_val
+        match = _RATIONAL_FORMAT.match(text)
+        if match is None:
+            raise ValueError(f"cannot convert {num!r} to Fraction")
+        value = Fraction._from_groups(*match.groups())
+        return value.numerator, value.denominator
 
-        sign = -1 if num < 0 else 1
-        num = abs(num)
-        decimal_places = len(str(num).split('.')[-1])
-        denom = 10 ** decimal_places
-        numerator = round(num * denom)
+    @classmethod
+    def from_float(cls, num):
+        """Точное значение двоичного представления float: Fraction.from_float(0.5) == 1/2"""
+        return cls._from_normalized(*num.as_integer_ratio())
+
+    @classmethod
+    def from_stdlib(cls, value):
+        """Fraction из fractions.Fraction, Decimal, int или float без потери точности.
+        Числитель и знаменатель numbers.Rational уже несократимы и только переводятся в int
+        (у целых numpy они numpy-скаляры фиксированной ширины), float — как в конструкторе"""
+        if isinstance(value, float):
+            return cls(value)
+        if isinstance(value, numbers.Rational):
+            return cls._from_normalized(operator.index(value.numerator), operator.index(value.denominator))
+        if isinstance(value, Decimal):
+            return cls._from_normalized(*value.as_integer_ratio())
+        raise TypeError(f"cannot convert {type(value).__name__} to Fraction")
+
+    def to_stdlib(self):
+        """fractions.Fraction с теми же числителем и знаменателем, без повторного сокращения"""
+        if _stdlib_from_coprime_ints is not None:
+            return _stdlib_from_coprime_ints(self.numerator, self.denominator)
+        return fractions.Fraction(self.numerator, self.denominator, _normalize=False)
 
-        gcd_val = math.gcd(numerator, denom)
-        numerator //= gcd_val
-        denom //= gcd_val
+    def _mixed(self, other, op, reflected=False):
+        """Операнд из стандартной библиотеки (fractions.Fraction, Decimal, complex) точно приводится
+        к Fraction или Complex, и операция выполняется уже над ними"""
+        other = _from_stdlib(other)
+        if other is None:
+            return NotImplemented
+        this = self
+        if isinstance(other, Complex):
+            if op in _ORDERINGS:
+                # комплексные числа не упорядочены
+                return NotImplemented
+            this = Complex._from_parts(self, Fraction._from_normalized(0))
+        return op(other, this) if reflected else op(this, other)
+
+    def limit_denominator(self, max_denominator=1_000_000):
+        """Ближайшая дробь со знаменателем не больше max_denominator"""
+        if max_denominator < 1:
+            raise ValueError("max_denominator should be at least 1")
+        if self.denominator <= max_denominator:
+            return self
+
+        p0, q0, p1, q1 = 0, 1, 1, 0
+        num, denom = self.numerator, self.denominator
+        while True:
+            a = num // denom
+            q2 = q0 + a * q1
+            if q2 > max_denominator:
+                break
+            p0, q0, p1, q1 = p1, q1, p0 + a * p1, q2
+            num, denom = denom, num - a * denom
+
+        k = (max_denominator - q0) // q1
+        # из двух кандидатов выбираем ближайший к self
+        if 2 * denom * (q0 + k * q1) <= self.denominator:
+            return Fraction._from_normalized(p1, q1)
+        return Fraction._from_normalized(p0 + k * p1, q0 + k * q1)
 
-        return sign * numerator, denom
+    def to_bytes(self):
+        """Числитель (zigzag) и знаменатель в формате varint: 1/2 -> b'\\x02\\x02'"""
+        out = bytearray()
+        _write_varint(out, _zigzag(self.numerator))
+        _write_varint(out, self.denominator)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        try:
+            num, pos = _read_varint(data, 0)
+            denom, pos = _read_varint(data, pos)
+        except IndexError:
+            raise ValueError("truncated Fraction data") from None
+        if pos != len(data):
+            raise ValueError("trailing data after Fraction")
+        if denom == 0:
+            raise ValueError("zero denominator in Fraction data")
+        return cls(_unzigzag(num), denom)
+
+    def __reduce__(self):
+        return self.__class__, (self.numerator, self.denominator)
 
     def __str__(self):
         if self.denominator == 1:
@@ -85,85 +483,270 @@ class Fraction:
         return f"{self.__class__.__name__}(numerator={self.numerator}, denominator={self.denominator})"
 
     def __add__(self, other):
-        if isinstance(other, int):
-            other = Fraction(other)
         if isinstance(other, Fraction):
-            new_numerator = self.numerator * other.denominator + other.numerator * self.denominator
-            new_denominator = self.denominator * other.denominator
-            return Fraction(new_numerator, new_denominator)
-        return NotImplemented
+            return self._add(self.numerator, self.denominator, other.numerator, other.denominator)
+        if isinstance(other, int):
+            # (n + k*d, d) остаётся несократимой
+            return Fraction._from_normalized(self.numerator + other * self.denominator, self.denominator)
+        if isinstance(other, float):
+            return self._add(self.numerator, self.denominator, *other.as_integer_ratio())
+        return self._mixed(other, operator.add)
+
+    __radd__ = __add__
 
     def __sub__(self, other):
-        if isinstance(other, int):
-            other = Fraction(other)
         if isinstance(other, Fraction):
-            new_numerator = self.numerator * other.denominator - other.numerator * self.denominator
-            new_denominator = self.denominator * other.denominator
-            return Fraction(new_numerator, new_denominator)
-        return NotImplemented
+            return self._add(self.numerator, self.denominator, -other.numerator, other.denominator)
+        if isinstance(other, int):
+            return Fraction._from_normalized(self.numerator - other * self.denominator, self.denominator)
+        if isinstance(other, float):
+            num, denom = other.as_integer_ratio()
+            return self._add(self.numerator, self.denominator, -num, denom)
+        return self._mixed(other, operator.sub)
 
-    def __mul__(self, other):
+    def __rsub__(self, other):
         if isinstance(other, int):
-            other = Fraction(other)
+            return Fraction._from_normalized(other * self.denominator - self.numerator, self.denominator)
+        if isinstance(other, float):
+            return self._add(*other.as_integer_ratio(), -self.numerator, self.denominator)
+        return self._mixed(other, operator.sub, reflected=True)
+
+    def __mul__(self, other):
         if isinstance(other, Fraction):
-            new_numerator = self.numerator * other.numerator
-            new_denominator = self.denominator * other.denominator
-            return Fraction(new_numerator, new_denominator)
-        return NotImplemented
+            return self._mul(self.numerator, self.denominator, other.numerator, other.denominator)
+        if isinstance(other, int):
+            gcd_val = math.gcd(other, self.denominator)
+            return Fraction._from_normalized(self.numerator * (other // gcd_val), self.denominator // gcd_val)
+        if isinstance(other, float):
+            return self._mul(self.numerator, self.denominator, *other.as_integer_ratio())
+        return self._mixed(other, operator.mul)
 
-    def __pow__(self, n):
-        if isinstance(n, int | float):
-            return Fraction(self.numerator ** n, self.denominator ** n)
+    __rmul__ = __mul__
+
+    @staticmethod
+    def _add(na, da, nb, db):
+        """Сумма двух несократимых дробей; gcd считается только от знаменателей"""
+        g = math.gcd(da, db)
+        if g == 1:
+            num, denom = na * db + nb * da, da * db
+        else:
+            s = da // g
+            t = na * (db // g) + nb * s
+            g2 = math.gcd(t, g)
+            num, denom = (t, s * db) if g2 == 1 else (t // g2, s * (db // g2))
+        if _bounded_contexts:
+            return _bounded(num, denom)
+        return Fraction._from_normalized(num, denom)
+
+    @staticmethod
+    def _mul(na, da, nb, db):
+        """Произведение двух несократимых дробей с перекрёстным сокращением"""
+        g1 = math.gcd(na, db)
+        if g1 > 1:
+            na //= g1
+            db //= g1
+        g2 = math.gcd(nb, da)
+        if g2 > 1:
+            nb //= g2
+            da //= g2
+        if _bounded_contexts:
+            return _bounded(na * nb, da * db)
+        return Fraction._from_normalized(na * nb, da * db)
+
+    def __pow__(self, n, modulo=None):
+        if isinstance(n, Fraction) and n.denominator == 1:
+            n = n.numerator
+        if modulo is not None:
+            return self._pow_mod(n, modulo)
+        if isinstance(n, int):
+            # возведение в степень сохраняет взаимную простоту, поэтому gcd не нужен
+            if n >= 0:
+                num, denom = self.numerator ** n, self.denominator ** n
+            elif self.numerator == 0:
+                raise ZeroDivisionError
+            elif self.numerator < 0:
+                num, denom = (-self.denominator) ** -n, (-self.numerator) ** -n
+            else:
+                num, denom = self.denominator ** -n, self.numerator ** -n
+            if _bounded_contexts:
+                return _bounded(num, denom)
+            return Fraction._from_normalized(num, denom)
+        if isinstance(n, float | Fraction):
+            # дробная степень в общем случае иррациональна, точный корень — см. root
+            return float(self) ** float(n)
         return NotImplemented
 
+    def _pow_mod(self, n, modulo):
+        """pow(a/b, n, m) == a**n * b**(-n) mod m, требует gcd(b, m) == 1"""
+        if not isinstance(n, int) or not isinstance(modulo, int):
+            raise TypeError("pow() 3rd argument not allowed unless all arguments are integers")
+        return pow(self.numerator, n, modulo) * pow(self.denominator, -n, modulo) % modulo
+
+    @staticmethod
+    def _iroot(x, k):
+        """Целая часть корня k-й степени из x >= 0 (метод Ньютона)"""
+        if k == 2:
+            return math.isqrt(x)
+        if x < 2:
+            return x
+        root = 1 << -(-x.bit_length() // k)
+        while True:
+            next_root = ((k - 1) * root + x // root ** (k - 1)) // k
+            if next_root >= root:
+                return root
+            root = next_root
+
+    def root(self, k=2, tolerance=None):
+        """Корень k-й степени: точный, если числитель и знаменатель — точные степени,
+        иначе приближение с погрешностью меньше tolerance (по умолчанию 1e-12)"""
+        if not isinstance(k, int) or k < 1:
+            raise ValueError("k must be a positive integer")
+        num, denom = self.numerator, self.denominator
+        if num < 0 and k % 2 == 0:
+            raise ValueError("even root of a negative number")
+        sign = -1 if num < 0 else 1
+        num = abs(num)
+
+        num_root, denom_root = self._iroot(num, k), self._iroot(denom, k)
+        if num_root ** k == num and denom_root ** k == denom:
+            return Fraction._from_normalized(sign * num_root, denom_root)
+
+        tolerance = Fraction(1, 10 ** 12) if tolerance is None else Fraction(tolerance)
+        if tolerance <= 0:
+            raise ValueError("tolerance must be positive")
+        # floor(root * scale) / scale отличается от корня меньше чем на 1 / scale <= tolerance
+        scale = -(-tolerance.denominator // tolerance.numerator)
+        scaled_root = self._iroot(num * scale ** k // denom, k)
+        return Fraction(sign * scaled_root, scale)
+
+    def sqrt(self, tolerance=None):
+        return self.root(2, tolerance)
+
     def __truediv__(self, other):
-        if isinstance(other, int):
-            other = Fraction(other)
         if isinstance(other, Fraction):
-            if other.numerator == 0:
+            return self._div(self.numerator, self.denominator, other.numerator, other.denominator)
+        if isinstance(other, int):
+            if other == 0:
                 raise ZeroDivisionError
-            new_numerator = self.numerator * other.denominator
-            new_denominator = self.denominator * other.numerator
-            return Fraction(new_numerator, new_denominator)
-        return NotImplemented
+            gcd_val = math.gcd(self.numerator, other)
+            if other < 0:
+                gcd_val = -gcd_val
+            if _bounded_contexts:
+                return _bounded(self.numerator // gcd_val, self.denominator * (other // gcd_val))
+            return Fraction._from_normalized(self.numerator // gcd_val, self.denominator * (other // gcd_val))
+        if isinstance(other, float):
+            return self._div(self.numerator, self.denominator, *other.as_integer_ratio())
+        return self._mixed(other, operator.truediv)
+
+    def __rtruediv__(self, other):
+        if isinstance(other, int):
+            return self._div(other, 1, self.numerator, self.denominator)
+        if isinstance(other, float):
+            return self._div(*other.as_integer_ratio(), self.numerator, self.denominator)
+        return self._mixed(other, operator.truediv, reflected=True)
+
+    @staticmethod
+    def _div(na, da, nb, db):
+        if nb == 0:
+            raise ZeroDivisionError
+        if nb < 0:
+            return Fraction._mul(na, da, -db, -nb)
+        return Fraction._mul(na, da, db, nb)
 
     def __eq__(self, other):
         if isinstance(other, Fraction):
             return self.numerator == other.numerator and self.denominator == other.denominator
-        return NotImplemented
+        if isinstance(other, int):
+            return self.denominator == 1 and self.numerator == other
+        if isinstance(other, float):
+            if not math.isfinite(other):
+                return False
+            num, denom = other.as_integer_ratio()
+            return self.numerator == num and self.denominator == denom
+        return self._mixed(other, operator.eq)
 
     def __ne__(self, other):
-        if isinstance(other, Fraction):
-            return self.numerator != other.numerator or self.denominator != other.denominator
-        return NotImplemented
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __hash__(self):
+        """Тот же алгоритм, что у int, float и fractions.Fraction: hash(Fraction(1, 2)) == hash(0.5)"""
+        denom = self.denominator
+        if denom == 1:
+            return hash(self.numerator)
+        inverse = _hash_inverses.get(denom)
+        if inverse is None:
+            try:
+                inverse = pow(denom, -1, _HASH_MODULUS)
+            except ValueError:
+                # знаменатель кратен модулю
+                inverse = 0
+            if len(_hash_inverses) < 4096:
+                _hash_inverses[denom] = inverse
+        result = hash(hash(abs(self.numerator)) * inverse) if inverse else _HASH_INF
+        if self.numerator < 0:
+            result = -result
+        return -2 if result == -1 else result
+
+    @classmethod
+    def interned(cls, num, denom=1):
+        """Общий экземпляр из кэша по умолчанию, см. FractionCache"""
+        return _default_cache.get(num, denom)
+
+    def _compare_float(self, other, op):
+        """Сравнение с точным двоичным значением float, как в ==, арифметике и hash"""
+        if math.isfinite(other):
+            num, denom = other.as_integer_ratio()
+            return op(self.numerator * denom, num * self.denominator)
+        # любая дробь сравнивается с inf и nan так же, как 0
+        return op(0, other)
 
     def __lt__(self, other):
         if isinstance(other, Fraction):
             return self.numerator * other.denominator < other.numerator * self.denominator
-        elif isinstance(other, int | float):
+        elif isinstance(other, int):
             return self.numerator < other * self.denominator
-        return NotImplemented
+        elif isinstance(other, float):
+            return self._compare_float(other, operator.lt)
+        return self._mixed(other, operator.lt)
 
     def __le__(self, other):
         if isinstance(other, Fraction):
             return self.numerator * other.denominator <= other.numerator * self.denominator
-        elif isinstance(other, int | float):
+        elif isinstance(other, int):
             return self.numerator <= other * self.denominator
-        return NotImplemented
+        elif isinstance(other, float):
+            return self._compare_float(other, operator.le)
+        return self._mixed(other, operator.le)
 
     def __gt__(self, other):
         if isinstance(other, Fraction):
             return self.numerator * other.denominator > other.numerator * self.denominator
-        elif isinstance(other, int | float):
+        elif isinstance(other, int):
             return self.numerator > other * self.denominator
-        return NotImplemented
+        elif isinstance(other, float):
+            return self._compare_float(other, operator.gt)
+        return self._mixed(other, operator.gt)
 
     def __ge__(self, other):
         if isinstance(other, Fraction):
             return self.numerator * other.denominator >= other.numerator * self.denominator
-        elif isinstance(other, int | float):
+        elif isinstance(other, int):
             return self.numerator >= other * self.denominator
-        return NotImplemented
+        elif isinstance(other, float):
+            return self._compare_float(other, operator.ge)
+        return self._mixed(other, operator.ge)
+
+    def sort_key(self):
+        """Ключ сортировки (float-приближение, сама дробь): деление int / int округляется корректно
+        и поэтому монотонно, так что дроби сравниваются точно только при равных приближениях"""
+        try:
+            approx = self.numerator / self.denominator
+        except OverflowError:
+            approx = math.inf if self.numerator > 0 else -math.inf
+        return approx, self
 
     def __round__(self, n=None):
         if n is None:
@@ -176,182 +759,873 @@ class Fraction:
     def __float__(self):
         return self.numerator / self.denominator
 
+    def __complex__(self):
+        return complex(self.numerator / self.denominator)
+
     def __int__(self):
         return self.numerator // self.denominator
 
+    def __bool__(self):
+        return self.numerator != 0
+
+    def __trunc__(self):
+        if self.numerator < 0:
+            return -(-self.numerator // self.denominator)
+        return self.numerator // self.denominator
+
+    def __floor__(self):
+        return self.numerator // self.denominator
+
+    def __ceil__(self):
+        return -(-self.numerator // self.denominator)
+
+    def __floordiv__(self, other):
+        if isinstance(other, Fraction | int):
+            return self.numerator * other.denominator // (self.denominator * other.numerator)
+        return self._mixed(other, operator.floordiv)
+
+    def __rfloordiv__(self, other):
+        if isinstance(other, int):
+            return other * self.denominator // self.numerator
+        return self._mixed(other, operator.floordiv, reflected=True)
+
+    def __mod__(self, other):
+        if isinstance(other, Fraction | int):
+            denom = self.denominator * other.denominator
+            return Fraction(self.numerator * other.denominator % (other.numerator * self.denominator), denom)
+        return self._mixed(other, operator.mod)
+
+    def __rmod__(self, other):
+        if isinstance(other, int):
+            return Fraction(other * self.denominator % self.numerator, self.denominator)
+        return self._mixed(other, operator.mod, reflected=True)
+
+    def __rpow__(self, other):
+        if isinstance(other, int) and self.denominator == 1:
+            return Fraction._from_normalized(other) ** self.numerator
+        if isinstance(other, int | float):
+            return other ** float(self)
+        return NotImplemented
+
+    @property
+    def real(self):
+        return self
+
+    @property
+    def imag(self):
+        return 0
+
+    def conjugate(self):
+        return self
+
+    def __pos__(self):
+        return self
+
     def __neg__(self):
-        return Fraction(-self.numerator, self.denominator)
+        return Fraction._from_normalized(-self.numerator, self.denominator)
 
     def __abs__(self):
-        return Fraction(abs(self.numerator), abs(self.denominator))
+        return Fraction._from_normalized(abs(self.numerator), self.denominator)
+
+
+class FractionParseError(ValueError):
+    """Ошибки Fraction.parse_many: rows — список пар (номер строки, строка)"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        shown = ', '.join(f"{index}: {text!r}" for index, text in rows[:10])
+        more = f" and {len(rows) - 10} more" if len(rows) > 10 else ""
+        super().__init__(f"cannot parse {len(rows)} value(s) as Fraction: {shown}{more}")
+
+
+def sorted_fractions(values, reverse=False):
+    return sorted(values, key=Fraction.sort_key, reverse=reverse)
+
+
+def nsmallest(n, values):
+    top = FractionTopK(n)
+    top.extend(values)
+    return top.result()
+
+
+def nlargest(n, values):
+    top = FractionTopK(n, largest=True)
+    top.extend(values)
+    return top.result()
+
+
+class FractionTopK:
+    """Потоковый top-k дробей на куче размера k: значения можно добавлять сколько угодно,
+    при равенстве остаются более ранние, как в heapq.nsmallest/nlargest"""
+    __slots__ = ('k', 'largest', '_heap', '_counter')
+
+    def __init__(self, k, largest=False):
+        self.k = k
+        self.largest = largest
+        self._heap = []
+        self._counter = count()
+
+    def push(self, value):
+        try:
+            approx = value.numerator / value.denominator
+        except OverflowError:
+            approx = value.sort_key()[0]
+        # куча хранит ключи так, что в корне — худший из отобранных
+        key = approx if self.largest else -approx
+        heap = self._heap
+        full = len(heap) >= self.k
+        if full and (not heap or key < heap[0][0]):
+            return
+        if self.largest:
+            entry = (key, value, -next(self._counter), value)
+        else:
+            entry = (key, -value, -next(self._counter), value)
+        if full:
+            if entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+        else:
+            heapq.heappush(heap, entry)
+
+    def extend(self, values):
+        for value in values:
+            self.push(value)
+
+    def result(self):
+        """Текущие k значений по порядку (по возрастанию или, для largest, по убыванию)"""
+        return [entry[3] for entry in sorted(self._heap, reverse=True)]
+
+    def __len__(self):
+        return len(self._heap)
+
+
+class FractionCache:
+    """LRU-кэш часто встречающихся дробей (0, 1, 1/2, проценты, копейки):
+    повторное создание возвращает уже существующий объект, в том числе для несокращённой пары"""
+    __slots__ = ('maxsize', 'hits', 'misses', '_items')
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+
+    def get(self, num, denom=1):
+        key = (num, denom)
+        items = self._items
+        value = items.get(key)
+        if value is not None:
+            self.hits += 1
+            items.move_to_end(key)
+            return value
+        # несократимая пара — общий ключ для get(2, 4) и get(1, 2); исходная пара запоминается как синоним
+        value = Fraction(num, denom)
+        reduced = (value.numerator, value.denominator)
+        shared = items.get(reduced)
+        if shared is None:
+            self.misses += 1
+            items[reduced] = value
+        else:
+            self.hits += 1
+            items.move_to_end(reduced)
+            value = shared
+        if key != reduced:
+            items[key] = value
+        while len(items) > self.maxsize:
+            items.popitem(last=False)
+        return value
+
+    def clear(self):
+        self._items.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}(maxsize={self.maxsize}, size={len(self)}, "
+                f"hits={self.hits}, misses={self.misses})")
+
+
+_default_cache = FractionCache()
+
+
+def _simplest_between(ln, ld, hn, hd):
+    """Дробь с наименьшим знаменателем на отрезке [ln/ld, hn/hd], 0 <= ln/ld <= hn/hd:
+    общее начало цепных дробей концов, затем наименьшее целое между остатками"""
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    while True:
+        a = ln // ld
+        if a * ld == ln:
+            break
+        if (a + 1) * hd <= hn:
+            a += 1
+            break
+        p0, q0, p1, q1 = p1, q1, a * p1 + p0, a * q1 + q0
+        # оба конца в (a, a + 1): переходим к обратным величинам дробных частей, концы меняются местами
+        ln, ld, hn, hd = hd, hn - a * hd, ld, ln - a * ld
+    return a * p1 + p0, a * q1 + q0
+
+
+class PrecisionContext:
+    """Параметры и статистика режима ограниченной точности, см. precision.
+
+    operations — число операций с результатом, rounded — сколько из них округлено,
+    max_bits и mean_bits — длина в битах большего из числителя и знаменателя результата до округления,
+    max_error — наибольшая относительная погрешность округления"""
+    __slots__ = ('max_denominator', 'tolerance', 'operations', 'rounded', 'max_bits', 'total_bits', 'max_error')
+
+    def __init__(self, max_denominator=None, tolerance=None):
+        if max_denominator is not None and max_denominator < 1:
+            raise ValueError("max_denominator should be at least 1")
+        if tolerance is not None:
+            tolerance = tolerance if isinstance(tolerance, Fraction) else Fraction(tolerance)
+            if not 0 < tolerance < 1:
+                raise ValueError("tolerance must be between 0 and 1")
+        self.max_denominator = max_denominator
+        self.tolerance = tolerance
+        self.operations = self.rounded = self.max_bits = self.total_bits = 0
+        self.max_error = 0.0
+
+    @property
+    def mean_bits(self):
+        return self.total_bits / self.operations if self.operations else 0.0
+
+    def _round(self, num, denom):
+        """Результат операции num / denom (несократимая, denom > 0) после округления"""
+        bits = max(num.bit_length(), denom.bit_length())
+        self.operations += 1
+        self.total_bits += bits
+        if bits > self.max_bits:
+            self.max_bits = bits
+
+        p, q = num, denom
+        if self.tolerance is not None and q > 1 and p:
+            # простейшая дробь в пределах относительной погрешности
+            tn, td = self.tolerance.numerator, self.tolerance.denominator
+            a, b = abs(p), q * td
+            p, q = _simplest_between(a * (td - tn), b, a * (td + tn), b)
+            if num < 0:
+                p = -p
+        if self.max_denominator is not None and q > self.max_denominator:
+            rounded = Fraction._from_normalized(p, q).limit_denominator(self.max_denominator)
+            p, q = rounded.numerator, rounded.denominator
+        if q == denom:
+            return Fraction._from_normalized(num, denom)
+
+        self.rounded += 1
+        error = abs(p * denom - num * q) / (q * abs(num)) if num else 0.0
+        if error > self.max_error:
+            self.max_error = error
+        return Fraction._from_normalized(p, q)
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}(max_denominator={self.max_denominator}, tolerance={self.tolerance}, "
+                f"operations={self.operations}, rounded={self.rounded}, max_bits={self.max_bits}, "
+                f"mean_bits={self.mean_bits:.1f}, max_error={self.max_error:.3g})")
+
+
+@contextmanager
+def precision(max_denominator=None, tolerance=None):
+    """Режим ограниченной точности для арифметики Fraction и Complex в текущем контексте (contextvars):
+
+        with precision(max_denominator=10 ** 6) as stats:
+            ...
+        print(stats.max_bits, stats.rounded)
+
+    Результат каждой операции, которая может увеличить знаменатель (умножение, деление, сложение дробей,
+    степень), заменяется лучшим приближением со знаменателем не больше max_denominator и/или простейшей
+    дробью с относительной погрешностью не больше tolerance (при обоих ограничениях знаменатель важнее).
+    Без ограничений контекст только собирает статистику длины чисел."""
+    global _bounded_contexts
+    context = PrecisionContext(max_denominator, tolerance)
+    token = _precision_context.set(context)
+    with _bounded_lock:
+        _bounded_contexts += 1
+    try:
+        yield context
+    finally:
+        with _bounded_lock:
+            _bounded_contexts -= 1
+        _precision_context.reset(token)
+
+
+def _bounded(num, denom):
+    """Fraction из несократимой пары с учётом активного контекста precision"""
+    context = _precision_context.get()
+    if context is None:
+        return Fraction._from_normalized(num, denom)
+    return context._round(num, denom)
+
+
+class FractionSum:
+    """Накопитель суммы дробей: числители суммируются по знаменателям без gcd,
+    сведение к общему знаменателю (через lcm) — только по запросу или при превышении threshold;
+    float берётся точно (as_integer_ratio), как в скалярном +"""
+    __slots__ = ('_partials', '_numerator', '_denominator', 'threshold')
+
+    def __init__(self, values=(), threshold=1024):
+        self._partials = {}
+        self._numerator = 0
+        self._denominator = 1
+        self.threshold = threshold
+        self.extend(values)
+
+    def add(self, value):
+        if isinstance(value, Fraction):
+            denom, num = value.denominator, value.numerator
+        elif isinstance(value, int):
+            denom, num = 1, value
+        elif isinstance(value, float):
+            num, denom = value.as_integer_ratio()
+        else:
+            raise TypeError(f"unsupported operand type: {type(value).__name__}")
+        partials = self._partials
+        partials[denom] = partials.get(denom, 0) + num
+        if len(partials) > self.threshold:
+            self._fold()
+
+    def sub(self, value):
+        if isinstance(value, Fraction):
+            denom, num = value.denominator, value.numerator
+        elif isinstance(value, int):
+            denom, num = 1, value
+        elif isinstance(value, float):
+            num, denom = value.as_integer_ratio()
+        else:
+            raise TypeError(f"unsupported operand type: {type(value).__name__}")
+        partials = self._partials
+        partials[denom] = partials.get(denom, 0) - num
+        if len(partials) > self.threshold:
+            self._fold()
+
+    def extend(self, values):
+        partials = self._partials
+        get = partials.get
+        threshold = self.threshold
+        for value in values:
+            if isinstance(value, Fraction):
+                denom = value.denominator
+                partials[denom] = get(denom, 0) + value.numerator
+            elif isinstance(value, int):
+                partials[1] = get(1, 0) + value
+            elif isinstance(value, float):
+                num, denom = value.as_integer_ratio()
+                partials[denom] = get(denom, 0) + num
+            else:
+                raise TypeError(f"unsupported operand type: {type(value).__name__}")
+            if len(partials) > threshold:
+                self._fold()
+
+    def _fold(self):
+        """Сведение накопленных числителей к общему знаменателю и одно сокращение"""
+        num, den = self._numerator, self._denominator
+        for denom, partial in self._partials.items():
+            if den % denom == 0:
+                num += partial * (den // denom)
+            else:
+                lcm = den // math.gcd(den, denom) * denom
+                num = num * (lcm // den) + partial * (lcm // denom)
+                den = lcm
+        self._partials.clear()
+        gcd_val = math.gcd(num, den)
+        self._numerator, self._denominator = num // gcd_val, den // gcd_val
+
+    def value(self):
+        if self._partials:
+            self._fold()
+        return Fraction._from_normalized(self._numerator, self._denominator)
+
+    def __iadd__(self, other):
+        if isinstance(other, FractionSum):
+            other = other.value()
+        if not isinstance(other, Fraction | int | float):
+            return NotImplemented
+        self.add(other)
+        return self
+
+    def __eq__(self, other):
+        if isinstance(other, FractionSum):
+            other = other.value()
+        # int, float и типы стандартной библиотеки сравниваются по правилам Fraction.__eq__
+        return self.value().__eq__(other)
+
+    __hash__ = None
+
+    def __float__(self):
+        return float(self.value())
+
+    def __str__(self):
+        return str(self.value())
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.value()})"
 
 
 class Complex:
+    __slots__ = ('_real', '_imagine', '_norm')
+
     def __init__(self, real: Fraction | int | float, imagine: Fraction | int | float = 0):
-        self._real = Fraction(real)
-        self._imagine = Fraction(imagine)
+        self._real = real if isinstance(real, Fraction) else Fraction(real)
+        self._imagine = imagine if isinstance(imagine, Fraction) else Fraction(imagine)
+        self._norm = None
+
+    @classmethod
+    def _from_parts(cls, real, imagine):
+        """Создание без проверок: real и imagine — уже Fraction"""
+        obj = object.__new__(cls)
+        obj._real = real
+        obj._imagine = imagine
+        obj._norm = None
+        return obj
+
+    @classmethod
+    def from_stdlib(cls, value):
+        """Complex из встроенного complex (части — как float в конструкторе) или из рационального числа"""
+        if isinstance(value, complex):
+            return cls(value.real, value.imag)
+        return cls._from_parts(Fraction.from_stdlib(value), Fraction._from_normalized(0))
+
+    def to_stdlib(self):
+        return complex(self)
+
+    def _mixed(self, other, op, reflected=False):
+        """Операнд из стандартной библиотеки точно приводится к Fraction или Complex, см. Fraction._mixed"""
+        other = _from_stdlib(other)
+        if other is None:
+            return NotImplemented
+        return op(other, self) if reflected else op(self, other)
 
     @property
     def real(self):
-        if isinstance(self._real, Fraction):
-            if self._real.denominator == 1:
-                self._real = self._real.numerator
-
         return self._real
 
     @real.setter
     def real(self, value):
-        self._real = value
+        self._real = value if isinstance(value, Fraction) else Fraction(value)
+        self._norm = None
 
     @property
     def imagine(self):
-        if isinstance(self._imagine, Fraction):
-            if self._imagine.denominator == 1:
-                self._imagine = self._imagine.numerator
         return self._imagine
 
     @imagine.setter
     def imagine(self, value):
-        self._imagine = value
+        self._imagine = value if isinstance(value, Fraction) else Fraction(value)
+        self._norm = None
+
+    @property
+    def imag(self):
+        """Мнимая часть под именем из numbers.Complex"""
+        return self._imagine
+
+    def _squared_norm(self):
+        """real**2 + imagine**2, считается один раз на объект"""
+        norm = self._norm
+        if norm is None:
+            norm = self._norm = self._real * self._real + self._imagine * self._imagine
+        return norm
 
     def __str__(self):
-        if self.imagine.numerator == 0:
-            return f'{self.real}'
-        if self.imagine.numerator < 0:
-            return f'{self.real} - {-self.imagine}i'
-        return f'{self.real} + {self.imagine}i'
+        if self._imagine.numerator == 0:
+            return f'{self._real}'
+        if self._imagine.numerator < 0:
+            return f'{self._real} - {-self._imagine}i'
+        return f'{self._real} + {self._imagine}i'
 
     def __repr__(self):
-        return f'{self.__class__.__name__}(real={self.real}, imagine={self.imagine})'
+        return f'{self.__class__.__name__}(real={self._real}, imagine={self._imagine})'
 
     def __add__(self, other):
         if isinstance(other, self.__class__):
-            return self.__class__(self.real + other.real, self.imagine + other.imagine)
+            return self._from_parts(self._real + other._real, self._imagine + other._imagine)
         if isinstance(other, int | float | Fraction):
-            return self.__class__(self.real + other, self.imagine)
-        return NotImplemented
+            return self._from_parts(self._real + other, self._imagine)
+        return self._mixed(other, operator.add)
+
+    __radd__ = __add__
 
     def __sub__(self, other):
         if isinstance(other, self.__class__):
-            return self.__class__(self.real - other.real, self.imagine - other.imagine)
+            return self._from_parts(self._real - other._real, self._imagine - other._imagine)
         if isinstance(other, int | float | Fraction):
-            return self.__class__(self.real - other, self.imagine)
-        return NotImplemented
+            return self._from_parts(self._real - other, self._imagine)
+        return self._mixed(other, operator.sub)
+
+    def __rsub__(self, other):
+        if isinstance(other, int | float | Fraction):
+            return self._from_parts(other - self._real, -self._imagine)
+        return self._mixed(other, operator.sub, reflected=True)
 
     def __mul__(self, other):
         if isinstance(other, self.__class__):
-            real = self.real * other.real - self.imagine * other.imagine
-            imagine = self.real * other.imagine + self.imagine * other.real
-            return self.__class__(real, imagine)
+            a, b, c, d = self._real, self._imagine, other._real, other._imagine
+            return self._from_parts(a * c - b * d, a * d + b * c)
         if isinstance(other, int | float | Fraction):
-            return self.__class__(self.real * other, self.imagine * other)
-        return NotImplemented
+            return self._from_parts(self._real * other, self._imagine * other)
+        return self._mixed(other, operator.mul)
+
+    __rmul__ = __mul__
+
+    def _integer_parts(self):
+        """(a, b, d) в целых числах: self == (a + bi) / d"""
+        real, imagine = self._real, self._imagine
+        p, q = real.denominator, imagine.denominator
+        if p == q:
+            return real.numerator, imagine.numerator, p
+        d = p // math.gcd(p, q) * q
+        return real.numerator * (d // p), imagine.numerator * (d // q), d
 
     def __truediv__(self, other):
         if isinstance(other, self.__class__):
-            denom = other.real ** 2 + other.imagine ** 2
-            if denom == 0:
+            # (a + bi)/d1 : (c + di)/d2 = (a + bi)(c - di) * d2 / ((c² + d²) * d1) — в целых числах,
+            # по одному gcd на каждую часть результата
+            a, b, d1 = self._integer_parts()
+            c, d, d2 = other._integer_parts()
+            norm = c * c + d * d
+            if norm == 0:
                 raise ZeroDivisionError
-            real = (self.real * other.real + self.imagine * other.imagine) / denom
-            imagine = (self.imagine * other.real - self.real * other.imagine) / denom
-            return self.__class__(real, imagine)
+            denom = norm * d1
+            real, imagine = Fraction((a * c + b * d) * d2, denom), Fraction((b * c - a * d) * d2, denom)
+            if _bounded_contexts:
+                real = _bounded(real.numerator, real.denominator)
+                imagine = _bounded(imagine.numerator, imagine.denominator)
+            return self._from_parts(real, imagine)
         if isinstance(other, int | float | Fraction):
             if other == 0:
                 raise ZeroDivisionError
-            return self.__class__(self.real / other, self.imagine / other)
-        return NotImplemented
+            return self._from_parts(self._real / other, self._imagine / other)
+        return self._mixed(other, operator.truediv)
+
+    def __rtruediv__(self, other):
+        if isinstance(other, float):
+            other = Fraction.from_float(other)
+        if isinstance(other, int | Fraction):
+            return Complex(other) / self
+        return self._mixed(other, operator.truediv, reflected=True)
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            return self.real == other.real and self.imagine == other.imagine
-        return NotImplemented
+            return self._real == other._real and self._imagine == other._imagine
+        if isinstance(other, int | float | Fraction):
+            return self._imagine.numerator == 0 and self._real == other
+        return self._mixed(other, operator.eq)
 
     def __ne__(self, other):
-        if isinstance(other, self.__class__):
-            return self.real != other.real or self.imagine != other.imagine
-        return NotImplemented
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __complex__(self):
+        real, imagine = self._real, self._imagine
+        return complex(real.numerator / real.denominator, imagine.numerator / imagine.denominator)
+
+    def __bool__(self):
+        return self._real.numerator != 0 or self._imagine.numerator != 0
+
+    def conjugate(self):
+        return self._from_parts(self._real, -self._imagine)
+
+    def abs2(self):
+        """Точный квадрат модуля"""
+        return self._squared_norm()
+
+    def abs(self, precision=None):
+        """Модуль: float полной точности или, если задана precision, Fraction с погрешностью меньше precision
+        (точный, если квадрат модуля — полный квадрат)"""
+        norm = self._squared_norm()
+        if precision is not None:
+            return norm.sqrt(precision)
+        num, denom = norm.numerator, norm.denominator
+        try:
+            return math.sqrt(num / denom)
+        except OverflowError:
+            # квадрат модуля вне диапазона float, сам модуль может в него попадать
+            half = (num.bit_length() - denom.bit_length()) // 2
+            return math.sqrt(num / (denom << 2 * half)) * 2.0 ** half
 
     def __abs__(self):
-        return round((self.real ** 2 + self.imagine ** 2) ** 0.5, 4)
+        return self.abs()
 
     def __pow__(self, n):
         if isinstance(n, int):
-            r = math.sqrt(self.real ** 2 + self.imagine ** 2)
-            theta = math.atan2(self.imagine, self.real)
-
-            r_n = r ** n
-            theta_n = theta * n
+            return self.power(n)
+        return NotImplemented
 
-            real = round(r_n * math.cos(theta_n), 4)
-            imagine = round(r_n * math.sin(theta_n), 4)
-            if real.is_integer():
-                real = int(real)
-            if imagine.is_integer():
-                imagine = int(imagine)
+    def power(self, n, exact=True):
+        """Целая степень. exact=True — точно, бинарным возведением в степень в арифметике Fraction
+        (отрицательная степень — через сопряжённое и норму); exact=False — встроенный complex без округления"""
+        if not isinstance(n, int):
+            raise TypeError("exponent must be an integer")
+        if not exact:
+            return complex(float(self._real), float(self._imagine)) ** n
 
-            return self.__class__(real, imagine)
+        a, b = self._real, self._imagine
+        if n < 0:
+            norm = self._squared_norm()
+            if norm == 0:
+                raise ZeroDivisionError
+            a, b = a / norm, -b / norm
+            n = -n
 
-        return NotImplemented
+        result_real, result_imagine = 1, 0
+        while n:
+            if n & 1:
+                result_real, result_imagine = (result_real * a - result_imagine * b,
+                                               result_real * b + result_imagine * a)
+            n >>= 1
+            if n:
+                a, b = (a + b) * (a - b), 2 * a * b
+        if isinstance(result_real, int):
+            # n == 0
+            return self._from_parts(Fraction._from_normalized(1), Fraction._from_normalized(0))
+        return self._from_parts(result_real, result_imagine)
 
     def __iadd__(self, other):
         if isinstance(other, self.__class__):
-            self._real += other._real
-            self._imagine += other._imagine
+            self._real = self._real + other._real
+            self._imagine = self._imagine + other._imagine
         elif isinstance(other, int | float | Fraction):
-            self._real += Fraction(other)
-            self._imagine += Fraction(other)
+            self._real = self._real + other
         else:
             return NotImplemented
+        self._norm = None
         return self
 
     def __isub__(self, other):
         if isinstance(other, self.__class__):
-            self._real -= other._real
-            self._imagine -= other._imagine
+            self._real = self._real - other._real
+            self._imagine = self._imagine - other._imagine
         elif isinstance(other, int | float | Fraction):
-            self._real -= Fraction(other)
-            self._imagine -= Fraction(other)
+            self._real = self._real - other
         else:
             return NotImplemented
+        self._norm = None
         return self
 
     def __imul__(self, other):
         if isinstance(other, self.__class__):
-            real = self._real * other._real - self._imagine * other._imagine
-            imagine = self._real * other._imagine + self._imagine * other._real
-            self._real = real
-            self._imagine = imagine
+            a, b, c, d = self._real, self._imagine, other._real, other._imagine
+            self._real = a * c - b * d
+            self._imagine = a * d + b * c
         elif isinstance(other, int | float | Fraction):
-            self._real *= Fraction(other)
-            self._imagine *= Fraction(other)
+            self._real = self._real * other
+            self._imagine = self._imagine * other
         else:
             return NotImplemented
+        self._norm = None
         return self
 
-    def __idiv__(self, other):
-        if isinstance(other, self.__class__):
-            denom = other.real ** 2 + other.imagine ** 2
-            if denom == 0:
-                raise ZeroDivisionError
-            real = (self.real * other.real + self.imagine * other.imagine) / denom
-            imagine = (self.imagine * other.real - self.real * other.imagine) / denom
-            self.real = real
-            self.imagine = imagine
-            return self
-        elif isinstance(other, int | float | Fraction):
-            if other == 0:
-                raise ZeroDivisionError
-            self.real = Fraction(self.real)
-            self.imagine = Fraction(self.imagine)
-            self.real /= Fraction(other)
-            self.imagine /= Fraction(other)
-            return self
-        return NotImplemented
+    def __itruediv__(self, other):
+        result = self.__truediv__(other)
+        if result is NotImplemented:
+            return result
+        self._real, self._imagine = result._real, result._imagine
+        self._norm = None
+        return self
+
+    __idiv__ = __itruediv__
 
     def __neg__(self):
-        return self.__class__(-self.real, -self.imagine)
+        return self._from_parts(-self._real, -self._imagine)
+
+    def __pos__(self):
+        return self
 
-    def arg(self):
-        return math.atan2(float(self.imagine), float(self.real))
+    def arg(self, precision=None):
+        """Аргумент: float или, если задана precision, Fraction с погрешностью меньше precision"""
+        if precision is None:
+            return math.atan2(float(self._imagine), float(self._real))
+        p = _precision_bits(precision)
+        return Fraction(_fixed_atan2(self._imagine, self._real, p), 1 << p)
 
+    def polar(self, precision=None):
+        """(модуль, аргумент), см. abs и arg"""
+        return self.abs(precision), self.arg(precision)
 
+    @classmethod
+    def from_polar(cls, modulus, phase, precision=None):
+        """Число по модулю и аргументу: встроенный complex или, если задана precision,
+        Complex с погрешностью каждой части меньше precision"""
+        if precision is None:
+            return cmath.rect(float(modulus), float(phase))
+        modulus = modulus if isinstance(modulus, Fraction) else Fraction(modulus)
+        phase = phase if isinstance(phase, Fraction) else Fraction(phase)
+        # погрешность cos и sin умножается на модуль
+        q = _precision_bits(precision) + (abs(modulus.numerator) // modulus.denominator).bit_length()
+        cos, sin = _fixed_expi(_to_fixed(phase, q), q)
+        num, den = modulus.numerator, modulus.denominator
+        return cls._from_fixed(num * cos // den, num * sin // den, q)
+
+    @classmethod
+    def _from_fixed(cls, real, imagine, p):
+        return cls._from_parts(Fraction(real, 1 << p), Fraction(imagine, 1 << p))
+
+    def exp(self, precision=None):
+        """e**self: встроенный complex (cmath) или, если задана precision,
+        Complex с погрешностью каждой части меньше precision"""
+        if precision is None:
+            return cmath.exp(complex(self))
+        x = self._real
+        # абсолютная погрешность растёт вместе с e**x, поэтому точность добавляется на целую часть x
+        q = _precision_bits(precision) + 2 * max(0, x.numerator // x.denominator)
+        magnitude = _fixed_exp(_to_fixed(x, q), q)
+        cos, sin = _fixed_expi(_to_fixed(self._imagine, q), q)
+        return self._from_fixed(magnitude * cos >> q, magnitude * sin >> q, q)
+
+    def log(self, precision=None):
+        """Натуральный логарифм (главная ветвь): ln|z| = ln(abs2) / 2, мнимая часть — аргумент"""
+        if precision is None:
+            return cmath.log(complex(self))
+        norm = self._squared_norm()
+        if not norm:
+            raise ValueError("math domain error")
+        p = _precision_bits(precision)
+        real = _fixed_ln(norm.numerator, norm.denominator, p + 1)
+        return self._from_parts(Fraction(real, 1 << p + 2),
+                                Fraction(_fixed_atan2(self._imagine, self._real, p), 1 << p))
+
+    def sqrt(self, precision=None):
+        """Главный квадратный корень: sqrt((|z| + x) / 2) + i sign(y) sqrt((|z| - x) / 2).
+        С precision части — Fraction с погрешностью меньше precision (точные для полных квадратов)"""
+        if precision is None:
+            return cmath.sqrt(complex(self))
+        precision = _as_precision(precision)
+        zero = Fraction._from_normalized(0)
+        # |sqrt(a) - sqrt(b)| <= sqrt(|a - b|), поэтому модуль нужен с погрешностью precision**2 / 8
+        modulus = self.abs(precision * precision / 8)
+        half_sum, half_difference = (modulus + self._real) / 2, (modulus - self._real) / 2
+        real = half_sum.sqrt(precision / 4) if half_sum > 0 else zero
+        imagine = half_difference.sqrt(precision / 4) if half_difference > 0 else zero
+        return self._from_parts(real, -imagine if self._imagine < 0 else imagine)
+
+    def _sin_cos(self, precision):
+        """sin(x + iy) = sin x ch y + i cos x sh y, cos(x + iy) = cos x ch y - i sin x sh y
+        с фиксированной точкой: (sin, cos, масштаб)"""
+        y = self._imagine
+        q = _precision_bits(precision) + 2 * (abs(y.numerator) // y.denominator)
+        cos, sin = _fixed_expi(_to_fixed(self._real, q), q)
+        # e**|y| и обратное к нему: обратное к маленькому e**-|y| потеряло бы точность
+        grow = _fixed_exp(_to_fixed(abs(y), q), q)
+        shrink = (1 << 2 * q) // grow
+        cosh, sinh = (grow + shrink) >> 1, (grow - shrink) >> 1
+        if y < 0:
+            sinh = -sinh
+        return (sin * cosh >> q, cos * sinh >> q), (cos * cosh >> q, -(sin * sinh) >> q), q
+
+    def sin(self, precision=None):
+        if precision is None:
+            return cmath.sin(complex(self))
+        (real, imagine), _, q = self._sin_cos(precision)
+        return self._from_fixed(real, imagine, q)
+
+    def cos(self, precision=None):
+        if precision is None:
+            return cmath.cos(complex(self))
+        _, (real, imagine), q = self._sin_cos(precision)
+        return self._from_fixed(real, imagine, q)
+
+    @classmethod
+    def evaluate_many(cls, function, values, precision=None):
+        """function ('exp', 'log', 'sqrt', 'sin' или 'cos') для каждого из values.
+        Без precision каждое значение один раз переводится в complex и передаётся прямо в cmath;
+        для ComplexArray есть векторные методы с теми же именами"""
+        if function not in _CMATH_FUNCTIONS:
+            raise ValueError(f"unknown function: {function!r}")
+        if precision is None:
+            kernel = _CMATH_FUNCTIONS[function]
+            # части Complex переводятся во float напрямую, без __complex__ и Fraction.__float__
+            return [kernel(complex(value._real.numerator / value._real.denominator,
+                                   value._imagine.numerator / value._imagine.denominator)
+                           if isinstance(value, Complex) else complex(value))
+                    for value in values]
+        method = getattr(cls, function)
+        return [method(value if isinstance(value, Complex) else cls.from_stdlib(value), precision)
+                for value in values]
+
+
+def _from_stdlib(value):
+    """Точный Fraction или Complex для чисел стандартной библиотеки; None для остальных типов"""
+    # проверка точного типа заметно дешевле isinstance с ABC
+    value_type = type(value)
+    if value_type is fractions.Fraction:
+        return Fraction._from_normalized(value.numerator, value.denominator)
+    if value_type is Decimal:
+        return Fraction._from_normalized(*value.as_integer_ratio())
+    if isinstance(value, complex):
+        # в операциях части complex, как и float, берутся точно (см. Fraction.__add__)
+        return Complex._from_parts(Fraction.from_float(value.real), Fraction.from_float(value.imag))
+    if isinstance(value, numbers.Rational | Decimal):
+        return Fraction.from_stdlib(value)
+    return None
+
+
+numbers.Rational.register(Fraction)
+numbers.Complex.register(Complex)
+
+_CMATH_FUNCTIONS = {'exp': cmath.exp, 'log': cmath.log, 'sqrt': cmath.sqrt, 'sin': cmath.sin, 'cos': cmath.cos}
+
+
+class ComplexAccumulator:
+    """Изменяемый накопитель суммы Complex: части копятся в двух FractionSum,
+    поэтому сложение не создаёт новых Fraction и не считает gcd до запроса значения"""
+    __slots__ = ('_real', '_imagine')
+
+    def __init__(self, values=(), threshold=1024):
+        self._real = FractionSum(threshold=threshold)
+        self._imagine = FractionSum(threshold=threshold)
+        for value in values:
+            self.add(value)
+
+    def add(self, value):
+        if isinstance(value, Complex):
+            self._real.add(value._real)
+            self._imagine.add(value._imagine)
+        elif isinstance(value, int | Fraction | float):
+            self._real.add(value)
+        elif isinstance(value, complex):
+            self._real.add(value.real)
+            self._imagine.add(value.imag)
+        else:
+            raise TypeError(f"unsupported operand type: {type(value).__name__}")
+
+    def sub(self, value):
+        if isinstance(value, Complex):
+            self._real.sub(value._real)
+            self._imagine.sub(value._imagine)
+        elif isinstance(value, int | Fraction | float):
+            self._real.sub(value)
+        elif isinstance(value, complex):
+            self._real.sub(value.real)
+            self._imagine.sub(value.imag)
+        else:
+            raise TypeError(f"unsupported operand type: {type(value).__name__}")
+
+    def __iadd__(self, other):
+        if not isinstance(other, Complex | int | Fraction | float | complex):
+            return NotImplemented
+        self.add(other)
+        return self
+
+    def __isub__(self, other):
+        if not isinstance(other, Complex | int | Fraction | float | complex):
+            return NotImplemented
+        self.sub(other)
+        return self
+
+    def value(self):
+        return Complex._from_parts(self._real.value(), self._imagine.value())
+
+    def __eq__(self, other):
+        if isinstance(other, ComplexAccumulator):
+            other = other.value()
+        return self.value().__eq__(other)
+
+    __hash__ = None
+
+    def __str__(self):
+        return str(self.value())
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.value()})"
@@ -1,17 +1,187 @@
+import glob
+import hashlib
+import json
+import os
+import pickle
+import time
+
+import numpy as np
 import pandas as pd
-from matplotlib import pyplot as plt
-from sklearn import *
-from sklearn import preprocessing
-import seaborn as sns
-import tensorflow as tf
-import torch
 
+# sklearn, matplotlib, seaborn, tensorflow и torch импортируются при первом использовании:
+# fill_missing и preparation не должны платить за их загрузку
+
+
+class QuantileSketch:
+    """Приближённые квантили потока чисел в ограниченной памяти (компакторы KLL).
+
+    Уровень i хранит не больше capacity значений с весом 2 ** i; переполненный уровень сортируется,
+    и каждое второе значение (со случайным сдвигом) переходит на следующий уровень.
+    Погрешность ранга порядка n * log2(n / capacity) / capacity в худшем случае"""
+
+    def __init__(self, capacity=8192, seed=0):
+        self.capacity = capacity
+        self.count = 0
+        self._levels = [np.empty(0)]
+        self._random = np.random.default_rng(seed)
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        self.count += len(values)
+        self._levels[0] = np.concatenate((self._levels[0], values))
+        level = 0
+        while level < len(self._levels) and len(self._levels[level]) > self.capacity:
+            items = np.sort(self._levels[level])
+            # при нечётном числе значений наибольшее остаётся на уровне
+            rest = len(items) % 2
+            self._levels[level] = items[len(items) - rest:]
+            if level + 1 == len(self._levels):
+                self._levels.append(np.empty(0))
+            promoted = items[self._random.integers(2):len(items) - rest:2]
+            self._levels[level + 1] = np.concatenate((self._levels[level + 1], promoted))
+            level += 1
+
+    def quantile(self, q):
+        if not self.count:
+            return np.nan
+        values = np.concatenate(self._levels)
+        weights = np.concatenate([np.full(len(items), 2.0 ** i) for i, items in enumerate(self._levels)])
+        order = np.argsort(values, kind='stable')
+        values, ranks = values[order], np.cumsum(weights[order])
+        # линейная интерполяция между соседними значениями, как в pandas.Series.quantile
+        position = q * (ranks[-1] - 1) + 1
+        return float(np.interp(position, ranks - weights[order] / 2 + 0.5, values))
+
+
+def _common_dtype(a, b):
+    """Тип столбца, прочитанного по частям с типами a и b; None — часть, где столбец состоит только из пропусков"""
+    if a is None or a == b:
+        return b
+    if b is None:
+        return a
+    if isinstance(a, np.dtype) and isinstance(b, np.dtype) and a.kind in 'iuf' and b.kind in 'iuf':
+        return np.result_type(a, b)
+    return np.dtype(object)
+
+
+class DatasetCache:
+    """Кэш разобранных CSV на диске в формате Arrow IPC (Feather v2 без сжатия).
+
+    Ключ — абсолютный путь, время изменения и размер файла и параметры чтения: изменённый файл читается заново,
+    а старые записи для него удаляются. Рядом с данными хранится схема (типы pandas), по которой
+    восстанавливаются типы столбцов. Повторная загрузка отображает файл в память (mmap) без разбора CSV"""
+
+    def __init__(self, directory: str = '.dataset_cache'):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self.load_time = 0.0
+
+    def _prefix(self, path):
+        return os.path.join(self.directory, hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:16])
+
+    def _entry(self, path, read_options):
+        stat = os.stat(path)
+        options = hashlib.sha1(repr(sorted(read_options.items())).encode()).hexdigest()[:8]
+        return f'{self._prefix(path)}-{stat.st_mtime_ns}-{stat.st_size}-{options}'
+
+    def load(self, path: str, **read_options):
+        """DataFrame из кэша или, при промахе, из pd.read_csv(path, **read_options) с сохранением в кэш"""
+        import pyarrow as pa
+
+        start = time.perf_counter()
+        entry = self._entry(path, read_options)
+        try:
+            with open(entry + '.json', encoding='utf-8') as file:
+                schema = json.load(file)
+            # буферы таблицы сами держат отображение файла, поэтому дескриптор можно закрыть сразу
+            with pa.memory_map(entry + '.arrow') as source:
+                table = pa.ipc.open_file(source).read_all()
+        except FileNotFoundError:
+            self.misses += 1
+            df = pd.read_csv(path, **read_options)
+            self._store(path, entry, df)
+        else:
+            self.hits += 1
+            df = table.to_pandas(split_blocks=True)
+            dtypes = {column: dtype for column, dtype in schema['dtypes'].items() if str(df.dtypes[column]) != dtype}
+            if dtypes:
+                df = df.astype(dtypes)
+        self.load_time += time.perf_counter() - start
+        return df
+
+    def _store(self, path, entry, df):
+        import pyarrow.feather as feather
+
+        # записи для прежних версий файла больше не понадобятся
+        version = entry.rsplit('-', 1)[0] + '-'
+        for name in glob.glob(self._prefix(path) + '-*'):
+            if not name.startswith(version):
+                os.remove(name)
+        os.makedirs(self.directory, exist_ok=True)
+        schema = {'path': os.path.abspath(path), 'rows': len(df),
+                  'dtypes': {column: str(dtype) for column, dtype in df.dtypes.items()}}
+        # запись во временные файлы и os.replace: прерванная запись не оставит битую запись кэша
+        feather.write_feather(df, entry + '.arrow.tmp', compression='uncompressed')
+        with open(entry + '.json.tmp', 'w', encoding='utf-8') as file:
+            json.dump(schema, file, ensure_ascii=False)
+        os.replace(entry + '.arrow.tmp', entry + '.arrow')
+        os.replace(entry + '.json.tmp', entry + '.json')
+
+    def invalidate(self, path: str = None):
+        """Удаляет записи для path (все версии файла) или, если path не задан, весь кэш"""
+        pattern = (self._prefix(path) if path is not None else os.path.join(self.directory, '')) + '*'
+        for name in glob.glob(pattern):
+            if name.endswith(('.arrow', '.json', '.tmp')):
+                os.remove(name)
+
+    def clear(self):
+        self.invalidate()
+        self.hits = 0
+        self.misses = 0
+        self.load_time = 0.0
+
+    def __len__(self):
+        return len(glob.glob(os.path.join(self.directory, '*.json')))
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}(directory={self.directory!r}, size={len(self)}, "
+                f"hits={self.hits}, misses={self.misses}, load_time={self.load_time:.3f})")
+
+
+def apply_fill(df, fill_values):
+    """Новый DataFrame с пропусками, заполненными значениями из Dataset.fit_missing"""
+    strategy = fill_values['strategy']
+    if strategy == 'ffill':
+        df = df.ffill()
+    elif strategy == 'group_mean':
+        groups = fill_values['groups']
+        # таблица значений той же формы, что df: строка среднего для группы каждой строки
+        filled = groups.reindex(df[fill_values['by']]).set_axis(df.index)
+        df = df.fillna(filled[[column for column in groups.columns if column in df.columns]])
+    values = {column: value for column, value in fill_values['values'].items() if column in df.columns}
+    return df.fillna(values) if values else df
 
 
 class Dataset:
-    def __init__(self, path: str):
+    def __init__(self, path: str, cache: DatasetCache = None):
         self.path = path
-        self.df = pd.read_csv(self.path)
+        self.df = pd.read_csv(self.path) if cache is None else cache.load(self.path)
+
+    @classmethod
+    def from_frame(cls, df, path: str = None):
+        """Dataset для уже загруженного DataFrame"""
+        dataset = cls.__new__(cls)
+        dataset.path, dataset.df = path, df
+        return dataset
+
+    @classmethod
+    def from_csv(cls, path: str, chunksize: int = None, cache: DatasetCache = None):
+        """Dataset целиком в памяти или, если задан chunksize, StreamingDataset, читающий файл по частям"""
+        if chunksize is None:
+            return cls(path, cache)
+        return StreamingDataset(path, chunksize)
 
     def print_info(self):
         info = {
@@ -23,15 +193,53 @@ class Dataset:
     def _missing_values(self):
         return self.df.isnull().sum()
 
-    def fill_missing(self, strategy='mean', value=None):
-        for column in self.df.select_dtypes(include=['float64', 'int64']).columns:
-            if self.df[column].isnull().sum() > 0:
-                if strategy == 'mean':
-                    self.df[column].fillna(self.df[column].mean(), inplace=True)
-                elif strategy == 'median':
-                    self.df[column].fillna(self.df[column].median(), inplace=True)
-                elif strategy == 'constant' and value is not None:
-                    self.df[column].fillna(value, inplace=True)
+    def fit_missing(self, strategy='mean', value=None, by=None):
+        """Значения для заполнения пропусков, посчитанные по df одним вызовом на все столбцы.
+
+        mean, median, constant и group_mean (среднее по группам столбца by, для неизвестных групп —
+        общее среднее) относятся к числовым столбцам, mode и ffill — ко всем. Для ffill запоминаются
+        последние известные значения: ими заполняются пропуски в начале следующей порции данных"""
+        numeric = self.df.select_dtypes(include=['float64', 'int64']).columns
+        groups = None
+        if strategy == 'mean':
+            values = self.df[numeric].mean()
+        elif strategy == 'median':
+            values = self.df[numeric].median()
+        elif strategy == 'constant':
+            values = pd.Series(value, index=numeric, dtype=object if value is None else None)
+        elif strategy == 'mode':
+            modes = self.df.mode()
+            values = modes.iloc[0] if len(modes) else pd.Series(dtype=object)
+        elif strategy == 'ffill':
+            values = self._last_values(self.df.ffill())
+        elif strategy == 'group_mean':
+            if by is None:
+                raise ValueError("strategy 'group_mean' requires the key column 'by'")
+            numeric = numeric.drop(by, errors='ignore')
+            groups = self.df.groupby(by)[numeric].mean()
+            values = self.df[numeric].mean()
+        else:
+            raise ValueError("strategy must be 'mean', 'median', 'constant', 'mode', 'ffill' or 'group_mean'")
+        return {'strategy': strategy, 'by': by, 'values': values.dropna().to_dict(), 'groups': groups}
+
+    @staticmethod
+    def _last_values(filled):
+        """Последние известные значения столбцов по уже заполненному ffill DataFrame"""
+        return filled.iloc[-1] if len(filled) else pd.Series(dtype=object)
+
+    def fill_missing(self, strategy='mean', value=None, by=None, fill_values=None):
+        """Заполняет пропуски значениями fit_missing или ранее сохранёнными fill_values без пересчёта.
+        Использованные значения сохраняются в self.fill_values"""
+        if fill_values is None and strategy == 'ffill':
+            # один проход ffill: последние значения берутся из уже заполненной порции
+            self.df = self.df.ffill()
+            values = self._last_values(self.df)
+            self.fill_values = {'strategy': strategy, 'by': by, 'values': values.dropna().to_dict(), 'groups': None}
+            return
+        if fill_values is None:
+            fill_values = self.fit_missing(strategy, value, by)
+        self.df = apply_fill(self.df, fill_values)
+        self.fill_values = fill_values
 
     def remove_outliers(self, column_name: str):
         q = self.df[column_name].quantile(q=0.99)
@@ -50,31 +258,23 @@ class Dataset:
             # other datatypes: 'int64', 'float64', 'timedelta[ns]'
             return len(column.unique()) <= threshold_of_num_cat
 
-        categorical_names = [column for column in self.df.columns if is_categorical(column)]
+        categorical_names = [column for column in self.df.columns if is_categorical(self.df[column])]
         return categorical_names
 
     def eval_categorical(self, categorical_names, strategy='Onehot') -> None:
-        if strategy == 'Onehot':
-            encoder = preprocessing.OneHotEncoder()  # TODO: узнать про sparse=False
-            for col in categorical_names:
-                sub = encoder.fit_transform(self.df[col].to_numpy().reshape(-1, 1))
-                df_encoded = pd.DataFrame(sub, columns=encoder.get_feature_names_out([col]))
-                self.df = pd.concat([self.df, df_encoded], axis=1)
-
-        elif strategy == 'Label':
-            encoder = preprocessing.LabelEncoder()
-            for col in categorical_names:
-                self.df[col + '_labeled'] = encoder.fit_transform(self.df[col].to_numpy().reshape(-1, 1))
+        """Кодирует столбцы categorical_names через Preprocessor, пропуски не заполняются"""
+        preprocessor = Preprocessor(strategy=strategy, fill_strategy=None, categorical=categorical_names)
+        self.df = preprocessor.fit(self.df).transform(self.df)
 
-        else:
-            raise ValueError("strategy must be 'Onehot' or 'Label'")
-
-    def preparation(self, threshold_of_num_cat: int = None, strategy='Onehot') -> None:
-        self.fill_missing(strategy='mean')
-        categorical = self.check_categorical(threshold_of_num_cat=threshold_of_num_cat)
-        self.eval_categorical(categorical, strategy)
+    def preparation(self, threshold_of_num_cat: int = None, strategy='Onehot', fill_strategy='mean', by=None) -> None:
+        """Заполнение пропусков и кодирование категорий; обученный Preprocessor сохраняется в self.preprocessor
+        и применяется к новым данным без повторного обучения"""
+        self.preprocessor = Preprocessor(threshold_of_num_cat, strategy, fill_strategy, by).fit(self.df)
+        self.df = self.preprocessor.transform(self.df)
 
     def display(self, plot_type='Hist', column=None):
+        from matplotlib import pyplot as plt
+
         if column:
             self._display_column_plot(plot_type, column)
         else:
@@ -82,6 +282,9 @@ class Dataset:
         plt.show()
 
     def _display_column_plot(self, plot_type, column):
+        from matplotlib import pyplot as plt
+        import seaborn as sns
+
         if plot_type == 'Hist':
             self.df[column].plot(kind='hist', title=f'Histogram of {column}')
         elif plot_type == 'Box':
@@ -91,6 +294,9 @@ class Dataset:
             raise ValueError
 
     def _display_all_columns_plot(self, plot_type):
+        from matplotlib import pyplot as plt
+        import seaborn as sns
+
         if plot_type == 'Hist':
             self.df.hist(figsize=(10, 8))
         elif plot_type == 'Box':
@@ -101,11 +307,304 @@ class Dataset:
 
     def transform_to_tensor(self, framework='tensorflow'):
         if framework == 'tensorflow':
+            import tensorflow as tf
             return tf.convert_to_tensor(self.df.values)
         elif framework == 'pytorch':
+            import torch
             return torch.tensor(self.df.values)
         elif framework == 'numpy':
             return self.df.values
 
         raise ValueError("framework must be 'tensorflow', 'pytorch', or 'numpy'")
 
+
+class Preprocessor:
+    """Обучаемая предобработка из Dataset.preparation: значения для пропусков, список категориальных
+    столбцов и кодировщики считаются один раз в fit, а transform применяет их к новым порциям данных.
+
+    Столбцы результата transform всегда те же, что и при обучении: неизвестные категории дают
+    нули в one-hot и -1 в метках (целые Int64, пропуск остаётся <NA>). by — ключевой столбец
+    для fill_strategy='group_mean', fill_strategy=None отключает заполнение; categorical задаёт
+    кодируемые столбцы явно вместо check_categorical. Обученный объект сохраняется на диск через save и load"""
+
+    def __init__(self, threshold_of_num_cat: int = None, strategy='Onehot', fill_strategy='mean', by=None,
+                 categorical=None):
+        if strategy not in ('Onehot', 'Label'):
+            raise ValueError("strategy must be 'Onehot' or 'Label'")
+        self.threshold_of_num_cat = threshold_of_num_cat
+        self.strategy = strategy
+        self.fill_strategy = fill_strategy
+        self.by = by
+        self.fill_values = None
+        self.categorical = None if categorical is None else list(categorical)
+        self._fixed_categorical = categorical is not None
+        self.encoder = None
+        self.columns = None
+
+    def fit(self, df):
+        from sklearn import preprocessing
+
+        dataset = Dataset.from_frame(df)
+        if self.fill_strategy is None:
+            self.fill_values = {'strategy': None, 'by': None, 'values': {}, 'groups': None}
+        else:
+            dataset.fill_missing(self.fill_strategy, by=self.by)
+            self.fill_values = dataset.fill_values
+        if not self._fixed_categorical:
+            self.categorical = dataset.check_categorical(threshold_of_num_cat=self.threshold_of_num_cat)
+        # один кодировщик на все категориальные столбцы вместо нового на каждый столбец
+        if self.strategy == 'Onehot':
+            self.encoder = preprocessing.OneHotEncoder(handle_unknown='ignore', sparse_output=False)
+        else:
+            self.encoder = preprocessing.OrdinalEncoder(handle_unknown='use_encoded_value', unknown_value=-1)
+        if self.categorical:
+            self.encoder.fit(self._categories(dataset.df))
+        self.columns = None
+        self.columns = list(self.transform(dataset.df.iloc[:0]).columns)
+        return self
+
+    def _categories(self, df):
+        return df[self.categorical].astype(object)
+
+    def transform(self, df):
+        if self.fill_values is None:
+            raise ValueError("Preprocessor is not fitted")
+        df = apply_fill(df, self.fill_values)
+        if self.categorical:
+            encoded = self.encoder.transform(self._categories(df)) if len(df) else None
+            if self.strategy == 'Onehot':
+                names = self.encoder.get_feature_names_out(self.categorical)
+            else:
+                names = [column + '_labeled' for column in self.categorical]
+            if encoded is None:
+                encoded = np.empty((0, len(names)))
+            encoded = pd.DataFrame(encoded, columns=names, index=df.index)
+            if self.strategy == 'Label':
+                # OrdinalEncoder возвращает float-коды
+                encoded = encoded.astype('Int64')
+            df = pd.concat([df, encoded], axis=1)
+        return df if self.columns is None else df.reindex(columns=self.columns)
+
+    def transform_batches(self, batches):
+        """transform для каждой порции, например из StreamingDataset.chunks()"""
+        for batch in batches:
+            yield self.transform(batch)
+
+    def save(self, path: str):
+        with open(path, 'wb') as file:
+            pickle.dump(self, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str):
+        with open(path, 'rb') as file:
+            preprocessor = pickle.load(file)
+        if not isinstance(preprocessor, cls):
+            raise TypeError(f"{path} does not contain a {cls.__name__}")
+        return preprocessor
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}(threshold_of_num_cat={self.threshold_of_num_cat}, "
+                f"strategy={self.strategy!r}, fill_strategy={self.fill_strategy!r}, by={self.by!r}, "
+                f"categorical={self.categorical})")
+
+
+class StreamingDataset:
+    """Dataset для CSV, который не помещается в память.
+
+    Файл читается частями по chunksize строк; в памяти одновременно находится одна часть и статистики.
+    fill_missing и remove_outliers считают статистики отдельным проходом и добавляют шаг обработки,
+    который применяется к каждой части при следующих проходах и при записи результата в write"""
+
+    def __init__(self, path: str, chunksize: int = 100_000):
+        if chunksize < 1:
+            raise ValueError("chunksize must be positive")
+        self.path = path
+        self.chunksize = chunksize
+        self._steps = []
+        self._dtypes = None
+        self._parsed = []
+
+    @property
+    def dtypes(self):
+        """Типы столбцов всего файла: типы частей, выведенные pandas, приводятся к общему"""
+        if self._dtypes is None:
+            dtypes, has_missing = None, set()
+            for chunk in pd.read_csv(self.path, chunksize=self.chunksize):
+                missing = chunk.isna().all()
+                has_missing.update(missing.index[missing])
+                # часть только из пропусков pandas читает как float64, о настоящем типе она ничего не говорит
+                types = {column: None if missing[column] else dtype for column, dtype in chunk.dtypes.items()}
+                for column in chunk.columns[chunk.dtypes == object]:
+                    # часть bool-столбца с пропусками читается как object со значениями True/False
+                    values = chunk[column].dropna()
+                    if len(values) and values.map(type).eq(bool).all():
+                        types[column] = np.dtype(bool)
+                        has_missing.add(column)
+                if dtypes is None:
+                    dtypes = types
+                else:
+                    dtypes = {column: _common_dtype(dtype, types[column]) for column, dtype in dtypes.items()}
+            self._parsed = []
+            for column, dtype in dtypes.items():
+                if dtype is None:
+                    dtypes[column] = np.dtype('float64')
+                elif column in has_missing and dtype == bool:
+                    # bool с пропусками pandas хранит как object со значениями True/False, а не строками:
+                    # такие столбцы читаются без заданного типа и приводятся к object после чтения
+                    dtypes[column] = np.dtype(object)
+                    self._parsed.append(column)
+                elif column in has_missing and dtype.kind in 'iu':
+                    dtypes[column] = np.dtype('float64')
+            self._dtypes = pd.Series(dtypes, dtype=object)
+        return self._dtypes
+
+    def chunks(self):
+        """Части файла с едиными типами столбцов после всех добавленных шагов обработки"""
+        dtypes = self.dtypes.drop(self._parsed).to_dict()
+        chunks = pd.read_csv(self.path, chunksize=self.chunksize, dtype=dtypes)
+        if self._parsed:
+            chunks = (chunk.astype(dict.fromkeys(self._parsed, object)) for chunk in chunks)
+        for step in self._steps:
+            chunks = step(chunks)
+        yield from chunks
+
+    def _add_step(self, func):
+        """Шаг обработки, применяемый к каждой части независимо от остальных"""
+        self._steps.append(lambda chunks: map(func, chunks))
+
+    def print_info(self):
+        info = {
+            'Типы данных': self.dtypes,
+            'Количество пропущенных значений': self._missing_values()
+        }
+        return info
+
+    def _missing_values(self):
+        missing = pd.Series(0, index=self.dtypes.index)
+        for chunk in self.chunks():
+            missing += chunk.isnull().sum()
+        return missing
+
+    def _numeric_columns(self):
+        return [column for column, dtype in self.dtypes.items() if dtype in ('float64', 'int64')]
+
+    def fill_missing(self, strategy='mean', value=None, by=None):
+        """Стратегии те же, что в Dataset.fit_missing: статистики считаются отдельным проходом по частям,
+        а ffill переносит последние известные значения из части в следующую"""
+        columns = self._numeric_columns()
+        if strategy == 'constant':
+            if value is None:
+                return
+            values = dict.fromkeys(columns, value)
+        elif strategy in ('mean', 'median'):
+            # первый проход: суммы и количества или квантильные скетчи по каждому столбцу
+            sums, counts = dict.fromkeys(columns, 0.0), dict.fromkeys(columns, 0)
+            sketches = {column: QuantileSketch() for column in columns}
+            for chunk in self.chunks():
+                for column in columns:
+                    if strategy == 'mean':
+                        sums[column] += chunk[column].sum()
+                        counts[column] += chunk[column].count()
+                    else:
+                        sketches[column].update(chunk[column].to_numpy())
+            if strategy == 'mean':
+                values = {column: sums[column] / counts[column] for column in columns if counts[column]}
+            else:
+                values = {column: sketches[column].quantile(0.5) for column in columns if sketches[column].count}
+        elif strategy == 'mode':
+            # частоты значений каждого столбца, при равенстве частот берётся меньшее значение, как в DataFrame.mode
+            frequencies = {column: pd.Series(dtype='float64') for column in self.dtypes.index}
+            for chunk in self.chunks():
+                for column in frequencies:
+                    frequencies[column] = frequencies[column].add(chunk[column].value_counts(), fill_value=0)
+            values = {column: counts[counts == counts.max()].sort_index().index[0]
+                      for column, counts in frequencies.items() if len(counts)}
+        elif strategy == 'ffill':
+            self._steps.append(self._forward_fill)
+            return
+        elif strategy == 'group_mean':
+            if by is None:
+                raise ValueError("strategy 'group_mean' requires the key column 'by'")
+            columns = [column for column in columns if column != by]
+            sums = counts = None
+            totals, sizes = pd.Series(0.0, index=columns), pd.Series(0, index=columns)
+            for chunk in self.chunks():
+                grouped = chunk.groupby(by)[columns]
+                if sums is None:
+                    sums, counts = grouped.sum(), grouped.count()
+                else:
+                    sums, counts = sums.add(grouped.sum(), fill_value=0), counts.add(grouped.count(), fill_value=0)
+                totals += chunk[columns].sum()
+                sizes += chunk[columns].count()
+            fill_values = {'strategy': strategy, 'by': by, 'values': (totals / sizes).dropna().to_dict(),
+                           'groups': sums / counts}
+            self._add_step(lambda chunk: apply_fill(chunk, fill_values))
+            return
+        else:
+            raise ValueError("strategy must be 'mean', 'median', 'constant', 'mode', 'ffill' or 'group_mean'")
+        self._add_step(lambda chunk: chunk.fillna(values))
+
+    @staticmethod
+    def _forward_fill(chunks):
+        """ffill по частям: пропуски в начале части заполняются последними значениями предыдущей"""
+        last = {}
+        for chunk in chunks:
+            chunk = chunk.ffill()
+            if last:
+                chunk = chunk.fillna(last)
+            if len(chunk):
+                last = chunk.iloc[-1].dropna().to_dict()
+            yield chunk
+
+    def remove_outliers(self, column_name: str):
+        sketch = QuantileSketch()
+        for chunk in self.chunks():
+            sketch.update(chunk[column_name].to_numpy())
+        q = sketch.quantile(0.99)
+        self._add_step(lambda chunk: chunk[chunk[column_name] <= q])
+
+    def check_categorical(self, threshold_of_num_cat: int = None):
+        if not threshold_of_num_cat:
+            # как и в Dataset, по умолчанию граница равна числу строк, а уникальных значений не больше строк
+            return list(self.dtypes.index)
+
+        def values(column):
+            if column.dtype == 'object':
+                return column.astype(str)
+            elif column.dtype == 'float64':
+                return column.round(10)
+            return column
+
+        # для каждого столбца храним не больше threshold_of_num_cat + 1 уникальных значений
+        seen = {column: pd.Series(dtype=object) for column in self.dtypes.index}
+        for chunk in self.chunks():
+            for column in list(seen):
+                unique = pd.concat([seen[column], values(chunk[column]).drop_duplicates()]).drop_duplicates()
+                if len(unique) > threshold_of_num_cat:
+                    del seen[column]
+                else:
+                    seen[column] = unique
+        return [column for column in self.dtypes.index if column in seen]
+
+    def write(self, path: str):
+        """Записывает обработанный файл по частям: в Parquet, если path оканчивается на .parquet, иначе в CSV"""
+        if path.endswith('.parquet'):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            writer = None
+            try:
+                for chunk in self.chunks():
+                    table = pa.Table.from_pandas(chunk, preserve_index=False)
+                    if writer is None:
+                        writer = pq.ParquetWriter(path, table.schema)
+                    writer.write_table(table.cast(writer.schema))
+            finally:
+                if writer is not None:
+                    writer.close()
+        else:
+            header = True
+            for chunk in self.chunks():
+                chunk.to_csv(path, mode='w' if header else 'a', header=header, index=False)
+                header = False
+
@@ -0,0 +1,490 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from itertools import repeat
+from operator import mul
+
+from classes import Complex, Fraction
+
+# ниже этого размера Штрассен не окупает лишние сложения
+_STRASSEN_THRESHOLD = 64
+
+
+def _matmul(a, b):
+    """Произведение целочисленных матриц (списки строк)"""
+    columns = list(zip(*b))
+    return [[sum(map(mul, row, column)) for column in columns] for row in a]
+
+
+def _matmul_rows(a, b, processes):
+    """Построчно-параллельное произведение: каждый процесс считает свой блок строк a"""
+    size = -(-len(a) // processes)
+    chunks = [a[i:i + size] for i in range(0, len(a), size)]
+    with ProcessPoolExecutor(processes) as executor:
+        return [row for block in executor.map(_matmul, chunks, repeat(b)) for row in block]
+
+
+def _add(a, b):
+    return [[x + y for x, y in zip(r, s)] for r, s in zip(a, b)]
+
+
+def _sub(a, b):
+    return [[x - y for x, y in zip(r, s)] for r, s in zip(a, b)]
+
+
+def _strassen(a, b):
+    """Штрассен для квадратных матриц; нечётный размер дополняется нулями"""
+    n = len(a)
+    if n <= _STRASSEN_THRESHOLD:
+        return _matmul(a, b)
+    if n % 2:
+        a = [row + [0] for row in a] + [[0] * (n + 1)]
+        b = [row + [0] for row in b] + [[0] * (n + 1)]
+        return [row[:n] for row in _strassen(a, b)[:n]]
+
+    h = n // 2
+    a11, a12 = [r[:h] for r in a[:h]], [r[h:] for r in a[:h]]
+    a21, a22 = [r[:h] for r in a[h:]], [r[h:] for r in a[h:]]
+    b11, b12 = [r[:h] for r in b[:h]], [r[h:] for r in b[:h]]
+    b21, b22 = [r[:h] for r in b[h:]], [r[h:] for r in b[h:]]
+
+    m1 = _strassen(_add(a11, a22), _add(b11, b22))
+    m2 = _strassen(_add(a21, a22), b11)
+    m3 = _strassen(a11, _sub(b12, b22))
+    m4 = _strassen(a22, _sub(b21, b11))
+    m5 = _strassen(_add(a11, a12), b22)
+    m6 = _strassen(_sub(a21, a11), _add(b11, b12))
+    m7 = _strassen(_sub(a12, a22), _add(b21, b22))
+
+    c11 = _add(_sub(_add(m1, m4), m5), m7)
+    c12 = _add(m3, m5)
+    c21 = _add(m2, m4)
+    c22 = _add(_add(_sub(m1, m2), m3), m6)
+    return [r + s for r, s in zip(c11, c12)] + [r + s for r, s in zip(c21, c22)]
+
+
+def _product(a, b, strassen, processes):
+    if processes:
+        return _matmul_rows(a, b, processes)
+    if strassen and len(a) == len(a[0]) == len(b[0]):
+        return _strassen(a, b)
+    return _matmul(a, b)
+
+
+def _bareiss(m, n):
+    """Безделительное исключение Барейса над целыми числами, на месте.
+
+    Все промежуточные значения — миноры исходной матрицы, поэтому деление на предыдущий
+    ведущий элемент точное и ничего не сокращается. Обновляются только столбцы правее ведущего,
+    под диагональю остаются старые значения. Возвращает определитель левого блока n×n."""
+    sign, previous = 1, 1
+    for k in range(n):
+        if not m[k][k]:
+            swap = next((i for i in range(k + 1, n) if m[i][k]), None)
+            if swap is None:
+                return 0
+            m[k], m[swap] = m[swap], m[k]
+            sign = -sign
+        pivot_row = m[k]
+        pivot = pivot_row[k]
+        tail = pivot_row[k + 1:]
+        for i in range(k + 1, n):
+            row = m[i]
+            factor = row[k]
+            if factor:
+                row[k + 1:] = [(pivot * x - factor * y) // previous for x, y in zip(row[k + 1:], tail)]
+            elif pivot != previous:
+                row[k + 1:] = [pivot * x // previous for x in row[k + 1:]]
+        previous = pivot
+    return sign * previous
+
+
+def _back_substitute(m, n):
+    """Обратный ход после _bareiss: det·x — целые (по Крамеру), поэтому деления точные.
+    Возвращает det·X для правых столбцов m, где det — последний ведущий элемент"""
+    det = m[n - 1][n - 1]
+    solution = [None] * n
+    for i in range(n - 1, -1, -1):
+        row = m[i]
+        solution[i] = [(det * row[n + c] - sum(row[j] * solution[j][c] for j in range(i + 1, n))) // row[i]
+                       for c in range(len(row) - n)]
+    return solution, det
+
+
+def _gaussian_divide(x, y):
+    """Точное деление гауссовых целых"""
+    (xr, xi), (yr, yi) = x, y
+    norm = yr * yr + yi * yi
+    return (xr * yr + xi * yi) // norm, (xi * yr - xr * yi) // norm
+
+
+def _gaussian_bareiss(m, n):
+    """То же исключение Барейса над гауссовыми целыми (пары (re, im))"""
+    sign, previous = 1, (1, 0)
+    for k in range(n):
+        if m[k][k] == (0, 0):
+            swap = next((i for i in range(k + 1, n) if m[i][k] != (0, 0)), None)
+            if swap is None:
+                return 0, 0
+            m[k], m[swap] = m[swap], m[k]
+            sign = -sign
+        pivot_row = m[k]
+        pr, pi = pivot_row[k]
+        qr, qi = previous
+        norm = qr * qr + qi * qi
+        tail = pivot_row[k + 1:]
+        for i in range(k + 1, n):
+            row = m[i]
+            fr, fi = row[k]
+            new_tail = []
+            for (xr, xi), (yr, yi) in zip(row[k + 1:], tail):
+                # (pivot·x - factor·y) / previous, деление — умножение на сопряжённое
+                nr = pr * xr - pi * xi - fr * yr + fi * yi
+                ni = pr * xi + pi * xr - fr * yi - fi * yr
+                new_tail.append(((nr * qr + ni * qi) // norm, (ni * qr - nr * qi) // norm))
+            row[k + 1:] = new_tail
+        previous = pivot_row[k]
+    return sign * previous[0], sign * previous[1]
+
+
+def _gaussian_back_substitute(m, n):
+    dr, di = det = m[n - 1][n - 1]
+    solution = [None] * n
+    for i in range(n - 1, -1, -1):
+        row = m[i]
+        solution[i] = []
+        for c in range(len(row) - n):
+            br, bi = row[n + c]
+            sr, si = dr * br - di * bi, dr * bi + di * br
+            for j in range(i + 1, n):
+                (ar, ai), (xr, xi) = row[j], solution[j][c]
+                sr -= ar * xr - ai * xi
+                si -= ar * xi + ai * xr
+            solution[i].append(_gaussian_divide((sr, si), row[i]))
+    return solution, det
+
+
+def _scale(rows, factor):
+    return [[x * factor for x in row] for row in rows]
+
+
+def _common_denominator(values):
+    return reduce(math.lcm, (v.denominator for v in values), 1)
+
+
+class FractionMatrix:
+    """Матрица из Fraction: целочисленные числители над общим знаменателем.
+
+    Умножение, определитель, обращение и решение систем идут в целых числах (исключение Барейса),
+    сокращение — один раз для результата."""
+    __slots__ = ('_rows', '_denominator')
+
+    def __init__(self, rows):
+        rows = [[v if isinstance(v, Fraction) else Fraction(v) for v in row] for row in rows]
+        if len({len(row) for row in rows}) > 1:
+            raise ValueError("rows must have the same length")
+        denominator = _common_denominator(v for row in rows for v in row)
+        self._set([[v.numerator * (denominator // v.denominator) for v in row] for row in rows], denominator)
+
+    @classmethod
+    def _from_integers(cls, rows, denominator):
+        obj = object.__new__(cls)
+        obj._set(rows, denominator)
+        return obj
+
+    def _set(self, rows, denominator):
+        if denominator < 0:
+            rows, denominator = [[-x for x in row] for row in rows], -denominator
+        g = reduce(math.gcd, (x for row in rows for x in row), denominator)
+        if g > 1:
+            rows = [[x // g for x in row] for row in rows]
+            denominator //= g
+        self._rows, self._denominator = rows, denominator
+
+    @classmethod
+    def identity(cls, n):
+        return cls._from_integers([[int(i == j) for j in range(n)] for i in range(n)], 1)
+
+    @property
+    def shape(self):
+        return len(self._rows), len(self._rows[0]) if self._rows else 0
+
+    def to_fractions(self):
+        denominator = self._denominator
+        return [[Fraction(x, denominator) for x in row] for row in self._rows]
+
+    def __getitem__(self, index):
+        i, j = index
+        return Fraction(self._rows[i][j], self._denominator)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({[[str(v) for v in row] for row in self.to_fractions()]})"
+
+    def __eq__(self, other):
+        if isinstance(other, FractionMatrix):
+            return self._rows == other._rows and self._denominator == other._denominator
+        return NotImplemented
+
+    __hash__ = None
+
+    def transpose(self):
+        return self._from_integers([list(column) for column in zip(*self._rows)], self._denominator)
+
+    def _combine(self, other, sign):
+        if not isinstance(other, FractionMatrix):
+            return NotImplemented
+        if self.shape != other.shape:
+            raise ValueError("matrix shapes do not match")
+        denominator = math.lcm(self._denominator, other._denominator)
+        k1, k2 = denominator // self._denominator, sign * (denominator // other._denominator)
+        rows = [[x * k1 + y * k2 for x, y in zip(r, s)] for r, s in zip(self._rows, other._rows)]
+        return self._from_integers(rows, denominator)
+
+    def __add__(self, other):
+        return self._combine(other, 1)
+
+    def __sub__(self, other):
+        return self._combine(other, -1)
+
+    def __neg__(self):
+        return self._from_integers(_scale(self._rows, -1), self._denominator)
+
+    def __mul__(self, other):
+        if isinstance(other, int):
+            other = Fraction._from_normalized(other)
+        if not isinstance(other, Fraction):
+            return NotImplemented
+        return self._from_integers(_scale(self._rows, other.numerator), self._denominator * other.denominator)
+
+    __rmul__ = __mul__
+
+    def matmul(self, other, strassen=False, processes=None):
+        """Произведение матриц; strassen=True — алгоритм Штрассена для квадратных матриц,
+        processes=k — строки считаются в k процессах"""
+        if isinstance(other, ComplexMatrix):
+            return ComplexMatrix.from_fraction_matrix(self).matmul(other, strassen, processes)
+        if not isinstance(other, FractionMatrix):
+            raise TypeError(f"unsupported operand type: {type(other).__name__}")
+        if self.shape[1] != other.shape[0]:
+            raise ValueError("matrix shapes do not match")
+        rows = _product(self._rows, other._rows, strassen, processes)
+        return self._from_integers(rows, self._denominator * other._denominator)
+
+    def __matmul__(self, other):
+        if not isinstance(other, FractionMatrix):
+            return NotImplemented
+        return self.matmul(other)
+
+    def _check_square(self):
+        n, m = self.shape
+        if n != m:
+            raise ValueError("matrix must be square")
+        return n
+
+    def det(self):
+        n = self._check_square()
+        det = _bareiss([list(row) for row in self._rows], n)
+        return Fraction(det, self._denominator ** n)
+
+    def _eliminate(self, right):
+        """Решение N·X = right в целых числах, где A = N / D: возвращает (det·X, det)"""
+        n = self._check_square()
+        m = [row + extra for row, extra in zip(self._rows, right)]
+        if not _bareiss(m, n):
+            raise ZeroDivisionError("matrix is singular")
+        return _back_substitute(m, n)
+
+    def inverse(self):
+        n = self._check_square()
+        solution, det = self._eliminate([[int(i == j) for j in range(n)] for i in range(n)])
+        return self._from_integers(_scale(solution, self._denominator), det)
+
+    def solve(self, b):
+        """Решение A·x = b; b — FractionMatrix или последовательность чисел (тогда x — список Fraction)"""
+        vector = not isinstance(b, FractionMatrix)
+        if vector:
+            b = FractionMatrix([[v] for v in b])
+        if b.shape[0] != self.shape[0]:
+            raise ValueError("matrix shapes do not match")
+        solution, det = self._eliminate(b._rows)
+        x = self._from_integers(_scale(solution, self._denominator), det * b._denominator)
+        return [row[0] for row in x.to_fractions()] if vector else x
+
+
+class ComplexMatrix:
+    """Матрица из Complex: целочисленные числители действительных и мнимых частей над общим знаменателем"""
+    __slots__ = ('_real', '_imagine', '_denominator')
+
+    def __init__(self, rows):
+        rows = [[v if isinstance(v, Complex) else Complex(v) for v in row] for row in rows]
+        if len({len(row) for row in rows}) > 1:
+            raise ValueError("rows must have the same length")
+        values = [v for row in rows for v in row]
+        denominator = _common_denominator([v.real for v in values] + [v.imagine for v in values])
+        self._set([[v.real.numerator * (denominator // v.real.denominator) for v in row] for row in rows],
+                  [[v.imagine.numerator * (denominator // v.imagine.denominator) for v in row] for row in rows],
+                  denominator)
+
+    @classmethod
+    def _from_integers(cls, real, imagine, denominator):
+        obj = object.__new__(cls)
+        obj._set(real, imagine, denominator)
+        return obj
+
+    @classmethod
+    def _from_gaussian(cls, rows, denominator):
+        return cls._from_integers([[x for x, _ in row] for row in rows],
+                                  [[y for _, y in row] for row in rows], denominator)
+
+    @classmethod
+    def from_fraction_matrix(cls, matrix):
+        return cls._from_integers(matrix._rows, [[0] * len(row) for row in matrix._rows], matrix._denominator)
+
+    def _set(self, real, imagine, denominator):
+        if denominator < 0:
+            real, imagine, denominator = _scale(real, -1), _scale(imagine, -1), -denominator
+        g = reduce(math.gcd, (x for row in real + imagine for x in row), denominator)
+        if g > 1:
+            real = [[x // g for x in row] for row in real]
+            imagine = [[x // g for x in row] for row in imagine]
+            denominator //= g
+        self._real, self._imagine, self._denominator = real, imagine, denominator
+
+    @classmethod
+    def identity(cls, n):
+        return cls.from_fraction_matrix(FractionMatrix.identity(n))
+
+    @property
+    def shape(self):
+        return len(self._real), len(self._real[0]) if self._real else 0
+
+    def _gaussian(self):
+        return [list(zip(r, s)) for r, s in zip(self._real, self._imagine)]
+
+    def to_complexes(self):
+        d = self._denominator
+        return [[Complex._from_parts(Fraction(x, d), Fraction(y, d)) for x, y in zip(r, s)]
+                for r, s in zip(self._real, self._imagine)]
+
+    def __getitem__(self, index):
+        i, j = index
+        d = self._denominator
+        return Complex._from_parts(Fraction(self._real[i][j], d), Fraction(self._imagine[i][j], d))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({[[str(v) for v in row] for row in self.to_complexes()]})"
+
+    def __eq__(self, other):
+        if isinstance(other, FractionMatrix):
+            other = self.from_fraction_matrix(other)
+        if isinstance(other, ComplexMatrix):
+            return (self._real, self._imagine, self._denominator) == \
+                (other._real, other._imagine, other._denominator)
+        return NotImplemented
+
+    __hash__ = None
+
+    def _coerce(self, other):
+        if isinstance(other, FractionMatrix):
+            return self.from_fraction_matrix(other)
+        if isinstance(other, ComplexMatrix):
+            return other
+        return None
+
+    def transpose(self):
+        return self._from_integers([list(c) for c in zip(*self._real)], [list(c) for c in zip(*self._imagine)],
+                                   self._denominator)
+
+    def conjugate(self):
+        return self._from_integers(self._real, _scale(self._imagine, -1), self._denominator)
+
+    def _combine(self, other, sign):
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        if self.shape != other.shape:
+            raise ValueError("matrix shapes do not match")
+        denominator = math.lcm(self._denominator, other._denominator)
+        k1, k2 = denominator // self._denominator, sign * (denominator // other._denominator)
+
+        def combine(a, b):
+            return [[x * k1 + y * k2 for x, y in zip(r, s)] for r, s in zip(a, b)]
+
+        return self._from_integers(combine(self._real, other._real), combine(self._imagine, other._imagine),
+                                   denominator)
+
+    def __add__(self, other):
+        return self._combine(other, 1)
+
+    def __sub__(self, other):
+        return self._combine(other, -1)
+
+    def __radd__(self, other):
+        return self._combine(other, 1)
+
+    def __rsub__(self, other):
+        return (-self)._combine(other, 1)
+
+    def __neg__(self):
+        return self._from_integers(_scale(self._real, -1), _scale(self._imagine, -1), self._denominator)
+
+    def matmul(self, other, strassen=False, processes=None):
+        """Произведение матриц: три целочисленных произведения вместо четырёх"""
+        coerced = self._coerce(other)
+        if coerced is None:
+            raise TypeError(f"unsupported operand type: {type(other).__name__}")
+        other = coerced
+        if self.shape[1] != other.shape[0]:
+            raise ValueError("matrix shapes do not match")
+        ar, ai, br, bi = self._real, self._imagine, other._real, other._imagine
+        real = _product(ar, br, strassen, processes)
+        both_imagine = _product(ai, bi, strassen, processes)
+        mixed = _product(_add(ar, ai), _add(br, bi), strassen, processes)
+        return self._from_integers(_sub(real, both_imagine), _sub(_sub(mixed, real), both_imagine),
+                                   self._denominator * other._denominator)
+
+    def __matmul__(self, other):
+        if self._coerce(other) is None:
+            return NotImplemented
+        return self.matmul(other)
+
+    def __rmatmul__(self, other):
+        if not isinstance(other, FractionMatrix):
+            return NotImplemented
+        return self.from_fraction_matrix(other).matmul(self)
+
+    def _check_square(self):
+        n, m = self.shape
+        if n != m:
+            raise ValueError("matrix must be square")
+        return n
+
+    def det(self):
+        n = self._check_square()
+        real, imagine = _gaussian_bareiss(self._gaussian(), n)
+        denominator = self._denominator ** n
+        return Complex._from_parts(Fraction(real, denominator), Fraction(imagine, denominator))
+
+    def _solve(self, right, right_denominator):
+        """X = A^-1 · right / right_denominator; деление на гауссов det — умножением на сопряжённый"""
+        n = self._check_square()
+        m = [row + extra for row, extra in zip(self._gaussian(), right)]
+        if _gaussian_bareiss(m, n) == (0, 0):
+            raise ZeroDivisionError("matrix is singular")
+        solution, (dr, di) = _gaussian_back_substitute(m, n)
+        d = self._denominator
+        rows = [[((x * dr + y * di) * d, (y * dr - x * di) * d) for x, y in row] for row in solution]
+        return self._from_gaussian(rows, (dr * dr + di * di) * right_denominator)
+
+    def inverse(self):
+        n = self._check_square()
+        return self._solve([[(int(i == j), 0) for j in range(n)] for i in range(n)], 1)
+
+    def solve(self, b):
+        """Решение A·x = b; b — матрица или последовательность чисел (тогда x — список Complex)"""
+        vector = self._coerce(b) is None
+        b = ComplexMatrix([[v] for v in b]) if vector else self._coerce(b)
+        if b.shape[0] != self.shape[0]:
+            raise ValueError("matrix shapes do not match")
+        x = self._solve(b._gaussian(), b._denominator)
+        return [row[0] for row in x.to_complexes()] if vector else x
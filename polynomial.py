@@ -0,0 +1,364 @@
+import cmath
+import math
+from functools import reduce
+
+from classes import Complex, Fraction
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# ниже этой длины умножение «в столбик» быстрее Карацубы
+_KARATSUBA_THRESHOLD = 32
+
+
+def _schoolbook(a, b):
+    result = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                result[i + j] += x * y
+    return result
+
+
+def _add_lists(a, b):
+    if len(a) < len(b):
+        a, b = b, a
+    result = list(a)
+    for i, y in enumerate(b):
+        result[i] += y
+    return result
+
+
+def _add_into(target, source, shift, sign=1):
+    for i, y in enumerate(source):
+        target[i + shift] += sign * y
+
+
+def _karatsuba(a, b):
+    """Произведение целочисленных многочленов (списки коэффициентов от младшего)"""
+    if not a or not b:
+        return []
+    if min(len(a), len(b)) <= _KARATSUBA_THRESHOLD:
+        return _schoolbook(a, b)
+    m = max(len(a), len(b)) // 2
+    a0, a1 = a[:m], a[m:]
+    b0, b1 = b[:m], b[m:]
+    z0 = _karatsuba(a0, b0)
+    z2 = _karatsuba(a1, b1)
+    z1 = _karatsuba(_add_lists(a0, a1), _add_lists(b0, b1))
+    _add_into(z1, z0, 0, -1)
+    _add_into(z1, z2, 0, -1)
+
+    result = [0] * (len(a) + len(b) - 1)
+    _add_into(result, z0, 0)
+    _add_into(result, z1, m)
+    _add_into(result, z2, 2 * m)
+    return result
+
+
+def _power(cache, base, exponent):
+    value = cache.get(exponent)
+    if value is None:
+        value = cache[exponent] = base ** exponent
+    return value
+
+
+def _homogeneous(coefficients, a, d, d_powers=None):
+    """sum(c_k a^k d^(n-k)) делением пополам: произведения больших чисел выходят сбалансированными,
+    а степени a и d на каждом уровне одни и те же и считаются один раз.
+    d_powers — кэш степеней d, общий для точек с одним знаменателем"""
+    a_powers = {}
+    if d_powers is None:
+        d_powers = {}
+
+    def split(lo, hi):
+        if hi - lo <= _KARATSUBA_THRESHOLD:
+            acc, scale = coefficients[hi - 1], 1
+            for k in range(hi - 2, lo - 1, -1):
+                scale *= d
+                acc = acc * a + coefficients[k] * scale
+            return acc
+        mid = (lo + hi) // 2
+        return split(lo, mid) * _power(d_powers, d, hi - mid) + split(mid, hi) * _power(a_powers, a, mid - lo)
+
+    return split(0, len(coefficients))
+
+
+def _parts(value):
+    """(действительная, мнимая) часть коэффициента в виде Fraction"""
+    if isinstance(value, Complex):
+        return value.real, value.imagine
+    if isinstance(value, complex):
+        return Fraction(value.real), Fraction(value.imag)
+    if isinstance(value, Fraction):
+        return value, Fraction._from_normalized(0)
+    return Fraction(value), Fraction._from_normalized(0)
+
+
+class Polynomial:
+    """Многочлен с коэффициентами Fraction или Complex (от младшей степени к старшей).
+
+    Хранится как целочисленные числители действительных и мнимых частей над общим знаменателем,
+    поэтому сложение, умножение (Карацуба) и вычисление по Горнеру идут в целых числах."""
+    __slots__ = ('_real', '_imagine', '_denominator')
+
+    def __init__(self, coefficients):
+        parts = [_parts(c) for c in coefficients]
+        denominator = reduce(math.lcm, (p.denominator for pair in parts for p in pair), 1)
+        real = [r.numerator * (denominator // r.denominator) for r, _ in parts]
+        imagine = [i.numerator * (denominator // i.denominator) for _, i in parts]
+        self._set(real, imagine, denominator)
+
+    @classmethod
+    def _from_integers(cls, real, imagine, denominator):
+        obj = object.__new__(cls)
+        obj._set(real, imagine, denominator)
+        return obj
+
+    def _set(self, real, imagine, denominator):
+        """Приведение к каноническому виду: без старших нулей, без общего множителя"""
+        if imagine is not None and not any(imagine):
+            imagine = None
+        size = len(real)
+        while size and not real[size - 1] and (imagine is None or not imagine[size - 1]):
+            size -= 1
+        real = real[:size]
+        if imagine is not None:
+            imagine = imagine[:size]
+        g = reduce(math.gcd, real, denominator)
+        if imagine is not None:
+            g = reduce(math.gcd, imagine, g)
+        if g > 1:
+            real = [x // g for x in real]
+            if imagine is not None:
+                imagine = [x // g for x in imagine]
+            denominator //= g
+        self._real, self._imagine, self._denominator = real, imagine, denominator
+
+    @property
+    def degree(self):
+        """Степень; у нулевого многочлена -1"""
+        return len(self._real) - 1
+
+    @property
+    def coefficients(self):
+        real = [Fraction(x, self._denominator) for x in self._real]
+        if self._imagine is None:
+            return real
+        return [Complex._from_parts(r, Fraction(i, self._denominator)) for r, i in zip(real, self._imagine)]
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}([{', '.join(str(c) for c in self.coefficients)}])"
+
+    def __eq__(self, other):
+        if isinstance(other, Polynomial):
+            return (self._real, self._imagine, self._denominator) == \
+                (other._real, other._imagine, other._denominator)
+        return NotImplemented
+
+    __hash__ = None
+
+    @staticmethod
+    def _coerce(other):
+        if isinstance(other, Polynomial):
+            return other
+        if isinstance(other, int | float | complex | Fraction | Complex):
+            return Polynomial([other])
+        return None
+
+    def _imagine_or_zeros(self):
+        return self._imagine if self._imagine is not None else [0] * len(self._real)
+
+    def _combine(self, other, sign):
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        d1, d2 = self._denominator, other._denominator
+        denominator = math.lcm(d1, d2)
+        k1, k2 = denominator // d1, denominator // d2
+        size = max(len(self._real), len(other._real))
+
+        def scaled(values, k):
+            return [x * k for x in values] + [0] * (size - len(values))
+
+        real = [x + sign * y for x, y in zip(scaled(self._real, k1), scaled(other._real, k2))]
+        imagine = None
+        if self._imagine is not None or other._imagine is not None:
+            imagine = [x + sign * y for x, y in zip(scaled(self._imagine_or_zeros(), k1),
+                                                    scaled(other._imagine_or_zeros(), k2))]
+        return self._from_integers(real, imagine, denominator)
+
+    def __add__(self, other):
+        return self._combine(other, 1)
+
+    def __sub__(self, other):
+        return self._combine(other, -1)
+
+    __radd__ = __add__
+
+    def __rsub__(self, other):
+        return (-self).__add__(other)
+
+    def __neg__(self):
+        imagine = None if self._imagine is None else [-x for x in self._imagine]
+        return self._from_integers([-x for x in self._real], imagine, self._denominator)
+
+    def __mul__(self, other):
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        denominator = self._denominator * other._denominator
+        a, b = self._real, other._real
+        real = _karatsuba(a, b)
+        if self._imagine is None and other._imagine is None:
+            return self._from_integers(real, None, denominator)
+        # (a + ai·i)(b + bi·i): три умножения вместо четырёх
+        ai, bi = self._imagine_or_zeros(), other._imagine_or_zeros()
+        both_imagine = _karatsuba(ai, bi)
+        mixed = _karatsuba(_add_lists(a, ai), _add_lists(b, bi))
+        imagine = list(mixed)
+        _add_into(imagine, real, 0, -1)
+        _add_into(imagine, both_imagine, 0, -1)
+        _add_into(real, both_imagine, 0, -1)
+        return self._from_integers(real, imagine, denominator)
+
+    __rmul__ = __mul__
+
+    def derivative(self):
+        real = [k * x for k, x in enumerate(self._real)][1:]
+        imagine = None if self._imagine is None else [k * x for k, x in enumerate(self._imagine)][1:]
+        return self._from_integers(real, imagine, self._denominator)
+
+    def __call__(self, x):
+        return self.evaluate(x)
+
+    def evaluate(self, x):
+        """Значение в точке: точное для int, Fraction и Complex, float/complex — в числах с плавающей точкой"""
+        if isinstance(x, float | complex):
+            return self._evaluate_float(self._float_coefficients(), x)
+        return self._evaluate_exact(x)
+
+    def evaluate_many(self, points, exact=True):
+        """Список значений в нескольких точках. exact=True — точки с общим знаменателем
+        делят кэш степеней этого знаменателя; exact=False — значения complex,
+        при наличии numpy схема Горнера векторизуется по точкам"""
+        if exact:
+            shared = {}
+            return [self._evaluate_exact(x, shared) for x in points]
+        coefficients = self._float_coefficients()
+        if np is not None and coefficients:
+            return np.polyval(coefficients[::-1], np.asarray(points, dtype=np.complex128)).tolist()
+        return [complex(self._evaluate_float(coefficients, complex(x))) for x in points]
+
+    def _float_coefficients(self):
+        denominator = self._denominator
+        if self._imagine is None:
+            return [r / denominator for r in self._real]
+        return [complex(r / denominator, i / denominator) for r, i in zip(self._real, self._imagine)]
+
+    @staticmethod
+    def _evaluate_float(coefficients, x):
+        result = 0
+        for c in reversed(coefficients):
+            result = result * x + c
+        return result
+
+    def _evaluate_exact(self, x, shared=None):
+        """Однородная схема Горнера в целых гауссовых числах:
+        для x = (a + bi) / d считается sum(c_k (a + bi)^k d^(n-k)), деление — один раз в конце.
+        shared — словарь d -> кэш степеней d, общий для нескольких точек"""
+        x_real, x_imagine = _parts(x)
+        d = math.lcm(x_real.denominator, x_imagine.denominator)
+        a = x_real.numerator * (d // x_real.denominator)
+        b = x_imagine.numerator * (d // x_imagine.denominator)
+        if not self._real:
+            return Fraction._from_normalized(0)
+
+        d_powers = {} if shared is None else shared.setdefault(d, {})
+        real, imagine = self._real, self._imagine
+        n = len(real) - 1
+        if b == 0 and imagine is None:
+            return Fraction(_homogeneous(real, a, d, d_powers), self._denominator * _power(d_powers, d, n))
+
+        acc_real, acc_imagine = real[n], (imagine[n] if imagine is not None else 0)
+        power = 1
+        for k in range(n - 1, -1, -1):
+            # d^(n-k) из кэша или домножением предыдущей степени
+            cached = d_powers.get(n - k)
+            if cached is None:
+                cached = d_powers[n - k] = power * d
+            power = cached
+            acc_real, acc_imagine = (acc_real * a - acc_imagine * b + real[k] * power,
+                                     acc_real * b + acc_imagine * a + (imagine[k] * power if imagine else 0))
+        denominator = self._denominator * _power(d_powers, d, n)
+        return Complex._from_parts(Fraction(acc_real, denominator), Fraction(acc_imagine, denominator))
+
+    def roots(self, tolerance=1e-12, max_iterations=500):
+        """Все комплексные корни методом Аберта–Эрлиха в числах с плавающей точкой"""
+        coefficients = self._float_coefficients()
+        n = len(coefficients) - 1
+        if n < 1:
+            return []
+        leading = coefficients[-1]
+        monic = [c / leading for c in coefficients]
+        # начальные приближения — на окружности радиуса среднего геометрического модулей корней
+        radius = abs(monic[0]) ** (1 / n) or 1.0
+        roots = [radius * cmath.exp(1j * (2 * math.pi * k / n + 0.4)) for k in range(n)]
+        if np is not None:
+            return self._aberth_numpy(monic, roots, tolerance, max_iterations)
+
+        derivative = [k * c for k, c in enumerate(monic)][1:]
+        reversed_derivative = [(n - k) * c for k, c in enumerate(monic)][:-1][::-1]
+        for _ in range(max_iterations):
+            converged = True
+            for k, z in enumerate(roots):
+                # вне единичного круга p/p' считается через перевёрнутый многочлен, чтобы z^n не переполнялось
+                if abs(z) <= 1:
+                    value, slope = self._evaluate_float(monic, z), self._evaluate_float(derivative, z)
+                else:
+                    w = 1 / z
+                    value = self._evaluate_float(monic[::-1], w)
+                    value, slope = z * value, n * value - w * self._evaluate_float(reversed_derivative, w)
+                if not value or not slope:
+                    continue
+                ratio = value / slope
+                repulsion = sum(1 / (z - w) for j, w in enumerate(roots) if j != k)
+                step = ratio / (1 - ratio * repulsion)
+                roots[k] = z - step
+                if abs(step) > tolerance * max(1.0, abs(z)):
+                    converged = False
+            if converged:
+                break
+        return roots
+
+    @staticmethod
+    def _aberth_numpy(monic, roots, tolerance, max_iterations):
+        n = len(monic) - 1
+        direct = np.array(monic[::-1])
+        direct_derivative = np.polyder(direct)
+        reversed_ = np.array(monic)
+        reversed_derivative = np.polyder(reversed_)
+        roots = np.array(roots, dtype=np.complex128)
+        ratio = np.empty_like(roots)
+        with np.errstate(all='ignore'):
+            for _ in range(max_iterations):
+                inside = np.abs(roots) <= 1
+                z = roots[inside]
+                ratio[inside] = np.polyval(direct, z) / np.polyval(direct_derivative, z)
+                z = roots[~inside]
+                w = 1 / z
+                value = np.polyval(reversed_, w)
+                ratio[~inside] = z * value / (n * value - w * np.polyval(reversed_derivative, w))
+
+                differences = roots[:, None] - roots[None, :]
+                np.fill_diagonal(differences, 1)
+                inverse = 1 / differences
+                np.fill_diagonal(inverse, 0)
+                step = ratio / (1 - ratio * inverse.sum(axis=1))
+                step[~np.isfinite(step)] = 0
+                roots = roots - step
+                if np.all(np.abs(step) <= tolerance * np.maximum(1.0, np.abs(roots))):
+                    break
+        return roots.tolist()
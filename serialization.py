@@ -0,0 +1,121 @@
+import struct
+import sys
+from array import array
+
+from classes import Fraction, _read_varint, _unzigzag, _write_varint, _zigzag
+
+# Заголовок пакета: сигнатура, ширина значения в байтах (4, 8 или 0 — varint), 3 байта выравнивания, количество.
+# Дальше в режиме фиксированной ширины идут все числители, затем все знаменатели (little-endian),
+# в режиме varint — пары (zigzag-числитель, знаменатель).
+_MAGIC = b'FRAC'
+_HEADER = struct.Struct('<4sBxxxQ')
+_VARINT = 0
+_TYPECODES = {4: 'i', 8: 'q'}
+_LIMITS = {4: 2 ** 31, 8: 2 ** 63}
+
+
+class FractionBatch:
+    """Пакет дробей поверх буфера: Fraction создаётся только при обращении к элементу"""
+    __slots__ = ('numerators', 'denominators')
+
+    def __init__(self, numerators, denominators):
+        self.numerators = numerators
+        self.denominators = denominators
+
+    def __len__(self):
+        return len(self.numerators)
+
+    def __getitem__(self, index):
+        return Fraction._from_normalized(self.numerators[index], self.denominators[index])
+
+    def __iter__(self):
+        return map(Fraction._from_normalized, self.numerators, self.denominators)
+
+    def to_fractions(self):
+        return list(self)
+
+
+def encode_batch(fractions, varint=False):
+    """Упаковка последовательности Fraction (или int) в bytes.
+
+    По умолчанию выбирается наименьшая подходящая ширина (int32 или int64);
+    varint=True даёт самый компактный, но более медленный формат."""
+    # числители и знаменатели читаются двумя проходами: генератор нужно сохранить
+    fractions = list(fractions)
+    numerators = [f.numerator for f in fractions]
+    denominators = [f.denominator for f in fractions]
+    if varint:
+        return _encode_varint(numerators, denominators)
+
+    bound = max(max(numerators, default=0), -min(numerators, default=0) - 1, max(denominators, default=0))
+    width = next((width for width, limit in _LIMITS.items() if bound < limit), None)
+    if width is None:
+        return _encode_varint(numerators, denominators)
+
+    numerators = array(_TYPECODES[width], numerators)
+    denominators = array(_TYPECODES[width], denominators)
+    if sys.byteorder == 'big':
+        numerators.byteswap()
+        denominators.byteswap()
+    header = _HEADER.pack(_MAGIC, width, len(numerators))
+    return b''.join((header, numerators.tobytes(), denominators.tobytes()))
+
+
+def _encode_varint(numerators, denominators):
+    out = bytearray(_HEADER.pack(_MAGIC, _VARINT, len(numerators)))
+    for num, denom in zip(numerators, denominators):
+        _write_varint(out, _zigzag(num))
+        _write_varint(out, denom)
+    return bytes(out)
+
+
+def decode_batch(buffer):
+    """Чтение пакета из bytes, bytearray, memoryview или mmap.
+
+    В режиме фиксированной ширины числители и знаменатели — это memoryview над исходным буфером,
+    без копирования; буфер должен жить, пока используется результат."""
+    view = memoryview(buffer)
+    if len(view) < _HEADER.size:
+        raise ValueError("buffer is too short for a Fraction batch header")
+    magic, width, count = _HEADER.unpack_from(view)
+    if magic != _MAGIC:
+        raise ValueError("not a Fraction batch")
+
+    if width == _VARINT:
+        return _decode_varint(view, count)
+    if width not in _TYPECODES:
+        raise ValueError(f"unsupported value width: {width}")
+
+    typecode = _TYPECODES[width]
+    start = _HEADER.size
+    middle = start + count * width
+    end = middle + count * width
+    if len(view) < end:
+        raise ValueError("buffer is too short for the declared number of values")
+    numerators, denominators = view[start:middle], view[middle:end]
+    if sys.byteorder == 'big':
+        numerators, denominators = array(typecode, numerators), array(typecode, denominators)
+        numerators.byteswap()
+        denominators.byteswap()
+    else:
+        numerators, denominators = numerators.cast(typecode), denominators.cast(typecode)
+    # элементы создаются доверенным конструктором, поэтому знаменатели проверяются сразу
+    if count and min(denominators) < 1:
+        raise ValueError("non-positive denominator in Fraction batch")
+    return FractionBatch(numerators, denominators)
+
+
+def _decode_varint(view, count):
+    numerators, denominators = [], []
+    pos = _HEADER.size
+    try:
+        for _ in range(count):
+            num, pos = _read_varint(view, pos)
+            denom, pos = _read_varint(view, pos)
+            if denom == 0:
+                raise ValueError("non-positive denominator in Fraction batch")
+            numerators.append(_unzigzag(num))
+            denominators.append(denom)
+    except IndexError:
+        raise ValueError("buffer is too short for the declared number of values") from None
+    return FractionBatch(numerators, denominators)
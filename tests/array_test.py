@@ -0,0 +1,156 @@
+import fractions
+import unittest
+
+from classes import *
+
+try:
+    import numpy as np
+    from arrays import *
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestFractionArray(unittest.TestCase):
+
+    def test_init(self):
+        a = FractionArray([2, 3, -4], [4, 9, -6])
+        self.assertEqual(a.to_fractions(), [Fraction(1, 2), Fraction(1, 3), Fraction(2, 3)])
+        self.assertEqual(a.dtype, np.int64)
+
+        with self.assertRaises(ValueError):
+            FractionArray([1, 2], [1, 0])
+
+    def test_init_rejects_truncation(self):
+        self.assertEqual(FractionArray([Fraction(1, 2), 3]).to_fractions(), [Fraction(1, 2), Fraction(3)])
+        self.assertEqual(FractionArray([fractions.Fraction(-2, 3)])[0], Fraction(-2, 3))
+        self.assertEqual(FractionArray([np.int64(4)], [np.int64(6)])[0], Fraction(2, 3))
+        for values in ([0.5, 1.7], np.array([0.5]), ['1']):
+            with self.assertRaises(TypeError):
+                FractionArray(values)
+        with self.assertRaises(TypeError):
+            FractionArray([1], [1.5])
+        with self.assertRaises(TypeError):
+            FractionArray.from_fractions([Fraction(1, 2), 0.5])
+
+    def test_conversion(self):
+        fractions = [Fraction(1, 2), Fraction(-3, 7), 5]
+        a = FractionArray.from_fractions(fractions)
+        self.assertEqual(a.to_fractions(), [Fraction(1, 2), Fraction(-3, 7), Fraction(5)])
+        self.assertEqual(a[1], Fraction(-3, 7))
+        self.assertEqual(a[np.int64(1)], Fraction(-3, 7))
+        self.assertEqual(len(a[1:]), 2)
+
+    def test_arithmetic(self):
+        a = FractionArray([1, 1, 2], [2, 3, 5])
+        b = FractionArray([1, 2, -1], [3, 3, 5])
+        self.assertEqual((a + b).to_fractions(), [Fraction(5, 6), Fraction(1), Fraction(1, 5)])
+        self.assertEqual((a - b).to_fractions(), [Fraction(1, 6), Fraction(-1, 3), Fraction(3, 5)])
+        self.assertEqual((a * b).to_fractions(), [Fraction(1, 6), Fraction(2, 9), Fraction(-2, 25)])
+        self.assertEqual((a / b).to_fractions(), [Fraction(3, 2), Fraction(1, 2), Fraction(-2)])
+        self.assertEqual((a * 2).to_fractions(), [Fraction(1), Fraction(2, 3), Fraction(4, 5)])
+        self.assertEqual((1 - a).to_fractions(), [Fraction(1, 2), Fraction(2, 3), Fraction(3, 5)])
+        self.assertEqual((Fraction(1, 2) / a).to_fractions(), [Fraction(1), Fraction(3, 2), Fraction(5, 4)])
+
+        with self.assertRaises(ZeroDivisionError):
+            a / FractionArray([1, 0, 1])
+
+        self.assertEqual(a.__add__("string"), NotImplemented)
+
+    def test_compare(self):
+        a = FractionArray([1, 1, 2], [2, 3, 5])
+        b = FractionArray([1, 2, 2], [2, 3, 7])
+        self.assertEqual((a == b).tolist(), [True, False, False])
+        self.assertEqual((a < b).tolist(), [False, True, False])
+        self.assertEqual((a >= Fraction(2, 5)).tolist(), [True, False, True])
+
+    def test_reductions(self):
+        a = FractionArray([1, 1, 1, 1, 1], [2, 3, 4, 5, 6])
+        self.assertEqual(a.sum(), Fraction(29, 20))
+        self.assertEqual(a.prod(), Fraction(1, 720))
+        self.assertEqual(a.cumsum().to_fractions(),
+                         [Fraction(1, 2), Fraction(5, 6), Fraction(13, 12), Fraction(77, 60), Fraction(29, 20)])
+        self.assertEqual(FractionArray([]).sum(), Fraction(0))
+
+    def test_overflow_promotion(self):
+        big = 2 ** 40 + 1
+        a = FractionArray([1, 1], [big, big + 2])
+        product = a * a
+        self.assertEqual(product.dtype, object)
+        self.assertEqual(product[0], Fraction(1, big * big))
+
+        huge = FractionArray([2 ** 70], [3])
+        self.assertEqual(huge.dtype, object)
+        self.assertEqual((huge / huge)[0], Fraction(1))
+        self.assertEqual((huge / huge).dtype, np.int64)
+
+    def test_negation_overflow(self):
+        smallest = -2 ** 63
+        a = FractionArray([smallest, 1])
+        self.assertEqual((-a).to_fractions(), [Fraction(2 ** 63), Fraction(-1)])
+        self.assertEqual(abs(a)[0], Fraction(2 ** 63))
+        self.assertEqual((1 - a)[0], Fraction(2 ** 63 + 1))
+        self.assertEqual((0 - a)[0], Fraction(2 ** 63))
+        self.assertEqual((a - a).to_fractions(), [Fraction(0), Fraction(0)])
+        self.assertEqual((1 / a).to_fractions(), [Fraction(-1, 2 ** 63), Fraction(1)])
+        self.assertEqual(FractionArray([1], [smallest])[0], Fraction(-1, 2 ** 63))
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestComplexArray(unittest.TestCase):
+
+    def setUp(self):
+        self.a = ComplexArray.from_complexes([Complex(1, 2), Complex(3, -1), 5])
+        self.b = ComplexArray.from_complexes([Complex(0, 1), Complex(1, 1), Complex(2)])
+
+    def test_conversion(self):
+        self.assertTrue(self.a.exact)
+        self.assertEqual(self.a.to_complexes(), [Complex(1, 2), Complex(3, -1), Complex(5)])
+        self.assertEqual(self.a[1], Complex(3, -1))
+        self.assertEqual(self.a[np.int64(1)], Complex(3, -1))
+        self.assertEqual(len(self.a[1:]), 2)
+        self.assertEqual(ComplexArray([Fraction(1, 2)], [Fraction(-1, 3)]).to_complexes(),
+                         [Complex(Fraction(1, 2), Fraction(-1, 3))])
+        with self.assertRaises(TypeError):
+            ComplexArray([0.5])
+
+        fast = ComplexArray.from_complexes([Complex(Fraction(1, 2), 2)], exact=False)
+        self.assertFalse(fast.exact)
+        self.assertEqual(fast.to_complexes(), [Complex(Fraction(1, 2), 2)])
+        self.assertEqual(fast.to_numpy().tolist(), [0.5 + 2j])
+
+    def test_arithmetic(self):
+        self.assertEqual((self.a + self.b).to_complexes(), [Complex(1, 3), Complex(4), Complex(7)])
+        self.assertEqual((self.a - 1).to_complexes(), [Complex(0, 2), Complex(2, -1), Complex(4)])
+        self.assertEqual((self.a * self.b).to_complexes(), [Complex(-2, 1), Complex(4, 2), Complex(10)])
+        self.assertEqual((self.a / self.b).to_complexes(), [Complex(2, -1), Complex(1, -2), Complex(Fraction(5, 2))])
+        self.assertEqual((2 * self.a).to_complexes(), [Complex(2, 4), Complex(6, -2), Complex(10)])
+
+        with self.assertRaises(ZeroDivisionError):
+            self.a / ComplexArray.from_complexes([1, 0, 1])
+
+        self.assertEqual(self.a.__add__("string"), NotImplemented)
+
+    def test_fast_mode(self):
+        fast = ComplexArray.from_complexes(self.a.to_complexes(), exact=False)
+        self.assertFalse((fast * self.b).exact)
+        self.assertEqual((fast * self.b).to_numpy().tolist(), [-2 + 1j, 4 + 2j, 10 + 0j])
+        self.assertEqual((self.a * 1j).to_numpy().tolist(), [-2 + 1j, 1 + 3j, 5j])
+
+    def test_reductions(self):
+        self.assertEqual(self.a.sum(), Complex(9, 1))
+        self.assertEqual(self.a.dot(self.b), Complex(12, 3))
+        with self.assertRaises(TypeError):
+            self.a.dot([1, 2, 3])
+        self.assertEqual(self.a.conjugate().to_complexes(), [Complex(1, -2), Complex(3, 1), Complex(5)])
+        self.assertEqual(self.a.abs2().to_fractions(), [Fraction(5), Fraction(10), Fraction(25)])
+        self.assertAlmostEqual(abs(self.a)[1], 10 ** 0.5)
+        self.assertAlmostEqual(self.a.arg()[0], math.atan2(2, 1))
+
+    def test_transcendental(self):
+        for array in (self.a, ComplexArray.from_complexes(self.a.to_complexes(), exact=False)):
+            for name in ('exp', 'log', 'sqrt', 'sin', 'cos'):
+                result = getattr(array, name)()
+                self.assertFalse(result.exact)
+                expected = Complex.evaluate_many(name, self.a.to_complexes())
+                self.assertTrue(np.allclose(result.to_numpy(), expected))
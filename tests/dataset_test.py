@@ -0,0 +1,308 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+try:
+    import numpy as np
+    import pandas as pd
+    from dataset_hw import *
+except ImportError:
+    pd = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@unittest.skipIf(pd is None, "pandas is not installed")
+class TestImport(unittest.TestCase):
+
+    def loaded_modules(self, statement):
+        code = f'import sys; {statement}; print(" ".join(sorted({{m.partition(".")[0] for m in sys.modules}})))'
+        result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+        return set(result.stdout.split())
+
+    def test_lazy_backends(self):
+        modules = self.loaded_modules('import dataset_hw')
+        self.assertIn('pandas', modules)
+        for name in ('tensorflow', 'torch', 'sklearn', 'matplotlib', 'seaborn'):
+            self.assertNotIn(name, modules)
+
+
+@unittest.skipIf(pd is None, "pandas is not installed")
+class TestFillMissing(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame({'group': ['a', 'a', 'b', 'b', 'c'], 'x': [1.0, np.nan, 3.0, 5.0, np.nan],
+                                'y': [np.nan, 2.0, np.nan, 4.0, 6.0], 'n': [1, 2, 3, 4, 5],
+                                'kind': ['u', None, 'u', 'v', None]})
+        self.dataset = Dataset.from_frame(self.df.copy())
+
+    def test_statistics(self):
+        for strategy, method in (('mean', 'mean'), ('median', 'median')):
+            dataset = Dataset.from_frame(self.df.copy())
+            dataset.fill_missing(strategy)
+            expected = self.df.fillna({'x': getattr(self.df['x'], method)(), 'y': getattr(self.df['y'], method)()})
+            pd.testing.assert_frame_equal(dataset.df, expected)
+
+        self.dataset.fill_missing('constant', 0)
+        pd.testing.assert_frame_equal(self.dataset.df, self.df.fillna({'x': 0, 'y': 0}))
+        dataset = Dataset.from_frame(self.df.copy())
+        dataset.fill_missing('constant')
+        pd.testing.assert_frame_equal(dataset.df, self.df)
+
+    def test_mode_and_ffill(self):
+        self.dataset.fill_missing('mode')
+        self.assertEqual(list(self.dataset.df['kind']), ['u'] * 3 + ['v', 'u'])
+        self.assertEqual(list(self.dataset.df['y']), [2.0, 2.0, 2.0, 4.0, 6.0])
+
+        dataset = Dataset.from_frame(self.df.copy())
+        dataset.fill_missing('ffill')
+        pd.testing.assert_frame_equal(dataset.df, self.df.ffill())
+        self.assertEqual(dataset.fill_values, Dataset.from_frame(self.df).fit_missing('ffill'))
+        # следующая порция продолжает заполнение последними значениями предыдущей
+        batch = pd.DataFrame({'group': [None], 'x': [np.nan], 'y': [np.nan], 'n': [7], 'kind': [None]})
+        self.assertEqual(apply_fill(batch, dataset.fill_values).iloc[0].tolist(), ['c', 5.0, 6.0, 7, 'v'])
+
+    def test_group_mean(self):
+        self.dataset.fill_missing('group_mean', by='group')
+        self.assertEqual(list(self.dataset.df['x']), [1.0, 1.0, 3.0, 5.0, 3.0])
+        self.assertEqual(list(self.dataset.df['y']), [2.0, 2.0, 4.0, 4.0, 6.0])
+        with self.assertRaises(ValueError):
+            self.dataset.fill_missing('group_mean')
+        with self.assertRaises(ValueError):
+            self.dataset.fill_missing('nearest')
+
+    def test_reapply(self):
+        self.dataset.fill_missing('mean')
+        fill_values = self.dataset.fill_values
+        batch = Dataset.from_frame(pd.DataFrame({'x': [np.nan, 10.0], 'y': [1.0, np.nan], 'n': [np.nan, 1.0]}))
+        batch.fill_missing(fill_values=fill_values)
+        self.assertEqual(batch.df.to_dict('list'), {'x': [3.0, 10.0], 'y': [1.0, 4.0], 'n': [3.0, 1.0]})
+
+        train = Dataset.from_frame(self.df.copy())
+        train.fill_missing('group_mean', by='group')
+        batch = pd.DataFrame({'group': ['b', 'z'], 'x': [np.nan, np.nan], 'y': [np.nan, np.nan]})
+        self.assertEqual(apply_fill(batch, train.fill_values).to_dict('list'),
+                         {'group': ['b', 'z'], 'x': [4.0, 3.0], 'y': [4.0, 4.0]})
+
+
+@unittest.skipIf(pd is None, "pandas is not installed")
+class TestPreprocessor(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame({'x': [1.5, np.nan, 3.0, 4.0, 0.5], 'kind': ['a', None, 'b', 'a', 'b'],
+                                'k': [1, 2, 1, 1, 2]})
+        self.batch = pd.DataFrame({'x': [np.nan, 2.0], 'kind': ['c', 'b'], 'k': [2, 7]}, index=[10, 11])
+
+    def test_preparation(self):
+        dataset = Dataset.from_frame(self.df.copy())
+        dataset.preparation(threshold_of_num_cat=3)
+        self.assertEqual(dataset.preprocessor.categorical, ['kind', 'k'])
+        self.assertEqual(list(dataset.df.columns), ['x', 'kind', 'k', 'kind_a', 'kind_b', 'kind_nan', 'k_1', 'k_2'])
+        self.assertEqual(dataset.df['x'][1], 2.25)
+        self.assertEqual(list(dataset.df['kind_a']), [1.0, 0.0, 0.0, 1.0, 0.0])
+
+    def test_consistent_columns(self):
+        preprocessor = Preprocessor(threshold_of_num_cat=3).fit(self.df)
+        result = preprocessor.transform(self.batch)
+        self.assertEqual(list(result.columns), preprocessor.columns)
+        self.assertEqual(list(result.index), [10, 11])
+        self.assertEqual(result.loc[10].tolist()[3:], [0.0, 0.0, 0.0, 0.0, 1.0])
+        self.assertEqual(result.loc[10, 'x'], 2.25)
+        self.assertEqual(list(preprocessor.transform(self.batch.iloc[:0]).columns), preprocessor.columns)
+
+        labels = Preprocessor(threshold_of_num_cat=3, strategy='Label').fit(self.df).transform(self.batch)
+        self.assertEqual(labels['kind_labeled'].tolist(), [-1, 1])
+        self.assertEqual(labels['k_labeled'].tolist(), [1, -1])
+        self.assertEqual(labels['k_labeled'].dtype, 'Int64')
+
+    def test_group_mean(self):
+        preprocessor = Preprocessor(threshold_of_num_cat=3, fill_strategy='group_mean', by='k').fit(self.df)
+        self.assertEqual(preprocessor.transform(self.df)['x'][1], 0.5)
+        self.assertEqual(preprocessor.transform(self.batch)['x'].tolist(), [0.5, 2.0])
+        self.assertIn("by='k'", repr(preprocessor))
+
+    def test_eval_categorical(self):
+        dataset = Dataset.from_frame(self.df.copy())
+        dataset.eval_categorical(['kind'], strategy='Label')
+        self.assertEqual(list(dataset.df.columns), ['x', 'kind', 'k', 'kind_labeled'])
+        self.assertTrue(pd.isna(dataset.df['x'][1]))
+        self.assertEqual(dataset.df['kind_labeled'].tolist(), [0, pd.NA, 1, 0, 1])
+
+        dataset = Dataset.from_frame(self.df.copy())
+        dataset.eval_categorical(['kind', 'k'])
+        self.assertEqual(list(dataset.df.columns)[3:], ['kind_a', 'kind_b', 'kind_nan', 'k_1', 'k_2'])
+        self.assertEqual(list(dataset.df['k_2']), [0.0, 1.0, 0.0, 0.0, 1.0])
+
+    def test_batches_and_save(self):
+        preprocessor = Preprocessor(threshold_of_num_cat=3).fit(self.df)
+        whole = preprocessor.transform(self.df)
+        parts = pd.concat(preprocessor.transform_batches([self.df.iloc[:2], self.df.iloc[2:]]))
+        pd.testing.assert_frame_equal(parts, whole)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'preprocessor.pkl')
+            preprocessor.save(path)
+            pd.testing.assert_frame_equal(Preprocessor.load(path).transform(self.batch), preprocessor.transform(self.batch))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            Preprocessor(strategy='Binary')
+        with self.assertRaises(ValueError):
+            Preprocessor().transform(self.df)
+
+
+@unittest.skipIf(pd is None, "pandas is not installed")
+class TestStreamingDataset(unittest.TestCase):
+
+    def setUp(self):
+        generator = np.random.default_rng(1)
+        size = 20_000
+        self.df = pd.DataFrame({'x': generator.normal(size=size), 'n': generator.integers(0, 100, size).astype(float),
+                                'kind': generator.choice(['a', 'b', 'c'], size), 'k': generator.integers(0, 5, size)})
+        self.df.loc[generator.random(size) < 0.1, 'x'] = np.nan
+        self.df.loc[generator.random(size) < 0.1, 'n'] = np.nan
+        # в первых частях столбец kind состоит только из пропусков
+        self.df.loc[:4999, 'kind'] = np.nan
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'data.csv')
+        self.df.to_csv(self.path, index=False)
+        self.df = pd.read_csv(self.path)
+        self.stream = Dataset.from_csv(self.path, chunksize=1500)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_from_csv(self):
+        self.assertIsInstance(Dataset.from_csv(self.path), Dataset)
+        self.assertIsInstance(self.stream, StreamingDataset)
+        with self.assertRaises(ValueError):
+            StreamingDataset(self.path, chunksize=0)
+
+    def test_info(self):
+        info = self.stream.print_info()
+        self.assertEqual(info['Типы данных'].to_dict(), self.df.dtypes.to_dict())
+        self.assertEqual(info['Количество пропущенных значений'].to_dict(), self.df.isnull().sum().to_dict())
+
+    def test_chunk_values(self):
+        # в первой части flag состоит только из пропусков, в третьей bool смешан с пропусками
+        flag = [None] * 1500 + [True, False] * 750 + [True, None] * 750
+        df = pd.DataFrame({'flag': flag, 'k': [None] * 1500 + list(range(3000))})
+        path = os.path.join(self.directory.name, 'flags.csv')
+        df.to_csv(path, index=False)
+        result = pd.concat(StreamingDataset(path, chunksize=1500).chunks(), ignore_index=True)
+        pd.testing.assert_frame_equal(result, pd.read_csv(path))
+        self.assertIs(result['flag'][1501], False)
+
+        result = pd.concat(self.stream.chunks(), ignore_index=True)
+        pd.testing.assert_frame_equal(result, pd.read_csv(self.path))
+
+    def test_fill_missing(self):
+        self.stream.fill_missing('mean')
+        result = pd.concat(self.stream.chunks(), ignore_index=True)
+        expected = self.df.fillna({'x': self.df['x'].mean(), 'n': self.df['n'].mean()})
+        pd.testing.assert_frame_equal(result, expected)
+
+        stream = StreamingDataset(self.path, chunksize=1500)
+        stream.fill_missing('median')
+        median = pd.concat(stream.chunks(), ignore_index=True)['n']
+        self.assertEqual(median.isnull().sum(), 0)
+        self.assertAlmostEqual(median[self.df['n'].isnull()].iloc[0], self.df['n'].median(), delta=1)
+
+    def test_fill_strategies(self):
+        # те же стратегии, что и в Dataset, дают тот же результат по частям
+        for strategy, options in (('mode', {}), ('ffill', {}), ('group_mean', {'by': 'k'})):
+            stream = StreamingDataset(self.path, chunksize=1500)
+            stream.fill_missing(strategy, **options)
+            dataset = Dataset(self.path)
+            dataset.fill_missing(strategy, **options)
+            pd.testing.assert_frame_equal(pd.concat(stream.chunks(), ignore_index=True), dataset.df)
+
+        for strategy, options in (('average', {}), ('group_mean', {})):
+            with self.assertRaises(ValueError):
+                self.stream.fill_missing(strategy, **options)
+
+    def test_remove_outliers(self):
+        self.stream.remove_outliers('x')
+        x = pd.concat(self.stream.chunks())['x']
+        self.assertAlmostEqual(x.max(), self.df['x'].quantile(0.99), delta=0.05)
+        self.assertAlmostEqual(len(x), self.df['x'].count() * 0.99, delta=40)
+
+    def test_check_categorical(self):
+        dataset = Dataset(self.path)
+        for threshold in (None, 4, 5, 10, 1000):
+            self.assertEqual(self.stream.check_categorical(threshold), dataset.check_categorical(threshold))
+
+    def test_write(self):
+        self.stream.fill_missing('constant', 0)
+        expected = self.df.fillna({'x': 0, 'n': 0})
+        for name in ('out.csv', 'out.parquet'):
+            path = os.path.join(self.directory.name, name)
+            self.stream.write(path)
+            result = pd.read_parquet(path) if name.endswith('.parquet') else pd.read_csv(path)
+            pd.testing.assert_frame_equal(result, expected)
+
+
+@unittest.skipIf(pd is None, "pandas is not installed")
+class TestDatasetCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'data.csv')
+        self.df = pd.DataFrame({'x': [1.5, np.nan, 3.0], 'kind': ['a', None, 'b'], 'k': [1, 2, 3],
+                                'flag': [True, False, True]})
+        self.df.to_csv(self.path, index=False)
+        self.cache = DatasetCache(os.path.join(self.directory.name, 'cache'))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_hit(self):
+        first = Dataset(self.path, self.cache).df
+        second = Dataset.from_csv(self.path, cache=self.cache).df
+        pd.testing.assert_frame_equal(first, pd.read_csv(self.path))
+        pd.testing.assert_frame_equal(second, first)
+        self.assertEqual((self.cache.hits, self.cache.misses, len(self.cache)), (1, 1, 1))
+        self.cache.load(self.path, usecols=['k'])
+        self.assertEqual((self.cache.misses, len(self.cache)), (2, 2))
+
+    def test_invalidation(self):
+        Dataset(self.path, self.cache)
+        self.df['k'] = self.df['k'] * 10
+        self.df.to_csv(self.path, index=False)
+        os.utime(self.path, ns=(0, 10 ** 18))
+        self.assertEqual(list(Dataset(self.path, self.cache).df['k']), [10, 20, 30])
+        self.assertEqual((self.cache.hits, self.cache.misses, len(self.cache)), (0, 2, 1))
+
+        self.cache.invalidate(self.path)
+        self.assertEqual(len(self.cache), 0)
+        Dataset(self.path, self.cache)
+        self.cache.clear()
+        self.assertEqual((self.cache.hits, self.cache.misses, len(self.cache)), (0, 0, 0))
+
+
+@unittest.skipIf(pd is None, "pandas is not installed")
+class TestQuantileSketch(unittest.TestCase):
+
+    def test_quantile(self):
+        values = np.random.default_rng(2).exponential(size=100_000)
+        sketch = QuantileSketch(capacity=1024)
+        for part in np.array_split(values, 37):
+            sketch.update(part)
+        self.assertEqual(sketch.count, len(values))
+        for q in (0.01, 0.5, 0.99):
+            rank = (values < sketch.quantile(q)).mean()
+            self.assertAlmostEqual(rank, q, delta=0.005)
+
+    def test_exact_when_small(self):
+        values = [3.0, 1.0, np.nan, 2.0, 10.0]
+        sketch = QuantileSketch()
+        sketch.update(values)
+        for q in (0, 0.25, 0.5, 0.9, 1):
+            self.assertAlmostEqual(sketch.quantile(q), pd.Series(values).quantile(q))
+        self.assertTrue(np.isnan(QuantileSketch().quantile(0.5)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import random
+import unittest
+
+from classes import *
+from matrix import ComplexMatrix, FractionMatrix
+
+
+def random_rows(n, m=None, complex_values=False):
+    def value():
+        real = Fraction(random.randint(-9, 9), random.randint(1, 6))
+        return Complex(real, random.randint(-3, 3)) if complex_values else real
+
+    return [[value() for _ in range(m or n)] for _ in range(n)]
+
+
+def dot(row, x, zero):
+    return sum((a * b for a, b in zip(row, x)), zero)
+
+
+class TestFractionMatrix(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(11)
+        self.rows = [[Fraction(1, 2), 2, 0], [Fraction(-1, 3), 0, 1], [4, Fraction(2, 5), -1]]
+        self.a = FractionMatrix(self.rows)
+
+    def test_init(self):
+        self.assertEqual(self.a.shape, (3, 3))
+        self.assertEqual(self.a.to_fractions(), [[Fraction(v) for v in row] for row in self.rows])
+        self.assertEqual(self.a[1, 0], Fraction(-1, 3))
+        self.assertEqual(FractionMatrix([[0.5, 1]]), FractionMatrix([[Fraction(1, 2), 1]]))
+        with self.assertRaises(ValueError):
+            FractionMatrix([[1, 2], [3]])
+
+    def test_arithmetic(self):
+        self.assertEqual(self.a - self.a, FractionMatrix([[0] * 3] * 3))
+        self.assertEqual(self.a + self.a, 2 * self.a)
+        self.assertEqual(Fraction(1, 2) * (self.a + self.a), self.a)
+        self.assertEqual(self.a.transpose()[0, 1], Fraction(-1, 3))
+        self.assertEqual(self.a @ FractionMatrix.identity(3), self.a)
+
+        rows = random_rows(5, 3)
+        other = random_rows(3, 4)
+        expected = [[dot(row, column, Fraction(0)) for column in zip(*other)] for row in rows]
+        self.assertEqual((FractionMatrix(rows) @ FractionMatrix(other)).to_fractions(), expected)
+        with self.assertRaises(ValueError):
+            FractionMatrix(other) @ FractionMatrix(other)
+
+    def test_strassen(self):
+        a, b = FractionMatrix(random_rows(70)), FractionMatrix(random_rows(70))
+        self.assertEqual(a.matmul(b, strassen=True), a @ b)
+
+    def test_processes(self):
+        a, b = FractionMatrix(random_rows(6)), FractionMatrix(random_rows(6))
+        self.assertEqual(a.matmul(b, processes=2), a @ b)
+
+    def test_det(self):
+        self.assertEqual(self.a.det(), Fraction(107, 15))
+        self.assertEqual(FractionMatrix([[0, 1], [1, 0]]).det(), -1)
+        self.assertEqual(FractionMatrix([[1, 2], [2, 4]]).det(), 0)
+        b = FractionMatrix(random_rows(8))
+        self.assertEqual((b @ b).det(), b.det() ** 2)
+
+    def test_inverse_and_solve(self):
+        self.assertEqual(self.a @ self.a.inverse(), FractionMatrix.identity(3))
+        self.assertEqual(FractionMatrix([[0, 2], [1, 0]]).inverse(), FractionMatrix([[0, 1], [Fraction(1, 2), 0]]))
+
+        rows = random_rows(10)
+        b = [Fraction(random.randint(-9, 9), random.randint(1, 6)) for _ in range(10)]
+        x = FractionMatrix(rows).solve(b)
+        self.assertEqual([dot(row, x, Fraction(0)) for row in rows], b)
+
+        right = FractionMatrix(random_rows(10, 2))
+        self.assertEqual(FractionMatrix(rows) @ FractionMatrix(rows).solve(right), right)
+
+        with self.assertRaises(ZeroDivisionError):
+            FractionMatrix([[1, 2], [2, 4]]).inverse()
+        with self.assertRaises(ValueError):
+            FractionMatrix([[1, 2]]).det()
+
+
+class TestComplexMatrix(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(13)
+        self.a = ComplexMatrix([[Complex(1, 1), 2], [Complex(0, -1), Fraction(1, 2)]])
+
+    def test_init(self):
+        self.assertEqual(self.a[0, 0], Complex(1, 1))
+        self.assertEqual(self.a[1, 1], Complex(Fraction(1, 2)))
+        self.assertEqual(self.a.conjugate()[1, 0], Complex(0, 1))
+        self.assertEqual(ComplexMatrix([[1, 2]]), FractionMatrix([[1, 2]]))
+
+    def test_matmul(self):
+        rows, other = random_rows(4, 3, True), random_rows(3, 5, True)
+        expected = [[dot(row, column, Complex(0)) for column in zip(*other)] for row in rows]
+        self.assertEqual((ComplexMatrix(rows) @ ComplexMatrix(other)).to_complexes(), expected)
+        b = FractionMatrix(random_rows(2))
+        self.assertEqual(self.a @ b, self.a @ ComplexMatrix.from_fraction_matrix(b))
+        self.assertEqual(b @ self.a, ComplexMatrix.from_fraction_matrix(b) @ self.a)
+        self.assertEqual(b.matmul(self.a), b @ self.a)
+        for matrix in (self.a, b):
+            with self.assertRaises(TypeError):
+                matrix.matmul([[1, 0], [0, 1]])
+
+    def test_det(self):
+        self.assertEqual(self.a.det(), Complex(Fraction(1, 2), Fraction(5, 2)))
+        self.assertEqual(ComplexMatrix([[Complex(0, 1), 0], [0, 1]]).det(), Complex(0, 1))
+        b = ComplexMatrix(random_rows(6, complex_values=True))
+        self.assertEqual((b @ b).det(), b.det() ** 2)
+
+    def test_inverse_and_solve(self):
+        self.assertEqual(self.a @ self.a.inverse(), ComplexMatrix.identity(2))
+        rows = random_rows(7, complex_values=True)
+        b = [Complex(random.randint(-5, 5), random.randint(-5, 5)) for _ in range(7)]
+        x = ComplexMatrix(rows).solve(b)
+        self.assertEqual([dot(row, x, Complex(0)) for row in rows], b)
+        with self.assertRaises(ZeroDivisionError):
+            ComplexMatrix([[Complex(1, 1), 2], [Complex(2, 2), 4]]).inverse()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import random
+import unittest
+
+import polynomial
+from classes import *
+from polynomial import Polynomial
+
+
+def horner(coefficients, x):
+    result = x - x
+    for c in reversed(coefficients):
+        result = result * x + c
+    return result
+
+
+class TestPolynomial(unittest.TestCase):
+
+    def setUp(self):
+        self.p = Polynomial([1, -3, 2])
+        self.q = Polynomial([Complex(1, 2), 3])
+
+    def test_init(self):
+        self.assertEqual(self.p.coefficients, [Fraction(1), Fraction(-3), Fraction(2)])
+        self.assertEqual(self.p.degree, 2)
+        self.assertEqual(Polynomial([Fraction(1, 2), 0, 0]).degree, 0)
+        self.assertEqual(Polynomial([]).degree, -1)
+        self.assertEqual(Polynomial([Fraction(2, 4), Complex(1, Fraction(1, 3))]).coefficients,
+                         [Complex(Fraction(1, 2)), Complex(1, Fraction(1, 3))])
+        self.assertEqual(Polynomial([0.5, 2]), Polynomial([Fraction(1, 2), 2]))
+        self.assertEqual(repr(self.p), 'Polynomial([1, -3, 2])')
+
+    def test_arithmetic(self):
+        self.assertEqual(self.p + self.q, Polynomial([Complex(2, 2), 0, 2]))
+        self.assertEqual(self.p - self.p, Polynomial([]))
+        self.assertEqual(self.q * self.q, Polynomial([Complex(-3, 4), Complex(6, 12), 9]))
+        self.assertEqual(2 * self.p, Polynomial([2, -6, 4]))
+        self.assertEqual(1 - self.p, Polynomial([0, 3, -2]))
+        self.assertEqual(self.p.derivative(), Polynomial([-3, 4]))
+
+    def test_karatsuba(self):
+        random.seed(3)
+        for size in (40, 100, 257):
+            a = [Complex(Fraction(random.randint(-9, 9), random.randint(1, 9)), random.randint(-3, 3))
+                 for _ in range(size)]
+            b = [Fraction(random.randint(-9, 9), random.randint(1, 9)) for _ in range(size // 2 + 7)]
+            expected = [Complex(0)] * (len(a) + len(b) - 1)
+            for i, x in enumerate(a):
+                for j, y in enumerate(b):
+                    expected[i + j] = expected[i + j] + x * y
+            self.assertEqual(Polynomial(a) * Polynomial(b), Polynomial(expected))
+
+    def test_evaluate(self):
+        self.assertEqual(self.p(Fraction(1, 2)), 0)
+        self.assertEqual(self.p(2), 3)
+        self.assertEqual(self.p(Complex(1, 1)), Complex(-2, 1))
+        self.assertEqual(self.q(Complex(0, 1)), Complex(1, 5))
+        self.assertEqual(self.p(0.5), 0.0)
+        self.assertEqual(Polynomial([])(Fraction(3)), 0)
+
+        random.seed(5)
+        coefficients = [Fraction(random.randint(-100, 100), random.randint(1, 12)) for _ in range(300)]
+        p = Polynomial(coefficients)
+        points = [Fraction(3, 7), Fraction(-2), Complex(Fraction(1, 3), Fraction(-2, 5))]
+        self.assertEqual(p.evaluate_many(points), [horner(coefficients, x) for x in points])
+
+        grid = [Fraction(k, 12) for k in range(-6, 7)] + [Complex(Fraction(1, 12), Fraction(1, 6))]
+        self.assertEqual(p.evaluate_many(grid), [horner(coefficients, x) for x in grid])
+
+        approximate = p.evaluate_many([0.5, 1j], exact=False)
+        self.assertIsInstance(approximate, list)
+        self.assertIsInstance(approximate[0], complex)
+        self.assertEqual(Polynomial([]).evaluate_many([1, 2], exact=False), [0j, 0j])
+        self.assertAlmostEqual(complex(approximate[0]), float(horner(coefficients, Fraction(1, 2))))
+        exact = horner(coefficients, Complex(0, 1))
+        self.assertAlmostEqual(complex(approximate[1]), complex(float(exact.real), float(exact.imagine)))
+
+    def test_roots(self):
+        p = Polynomial([-6, 11, -6, 1])
+        for roots in (p.roots(), self._pure_python_roots(p)):
+            self.assertEqual(len(roots), 3)
+            for root, expected in zip(sorted(roots, key=lambda z: z.real), (1, 2, 3)):
+                self.assertAlmostEqual(root, expected)
+
+        roots = Polynomial([1, 0, 1]).roots()
+        self.assertEqual(sorted(round(z.imag, 9) for z in roots), [-1, 1])
+        self.assertEqual(Polynomial([5]).roots(), [])
+
+        random.seed(7)
+        p = Polynomial([random.randint(-100, 100) for _ in range(101)])
+        for root in p.roots():
+            self.assertLess(abs(p(root)), 1e-6 * max(1.0, abs(root)) ** 100)
+
+    @staticmethod
+    def _pure_python_roots(p):
+        np, polynomial.np = polynomial.np, None
+        try:
+            return p.roots()
+        finally:
+            polynomial.np = np
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,19 @@
 from classes import *
+from serialization import *
+from decimal import Decimal
+import cmath
+import fractions
+import numbers
+import pickle
+import random
+import sys
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class TestFraction(unittest.TestCase):
@@ -47,6 +61,68 @@ class TestFraction(unittest.TestCase):
         f7 = Fraction(Fraction(2, 3), 2)
         self.assertEqual(str(f7), "1/3")
 
+    def test_float_exponent_notation(self):
+        f = Fraction(1e-20)
+        self.assertEqual(f.numerator / f.denominator, 1e-20)
+
+        f = Fraction(1.5e300)
+        self.assertEqual(f, Fraction(int(1.5e300)))
+        self.assertEqual(Fraction(2.0 ** 60), 2 ** 60)
+        self.assertEqual(Fraction(-2.0 ** 70), -2 ** 70)
+        self.assertEqual(Fraction(2.0 ** 52 + 1), Fraction(2 ** 52 + 1))
+
+        f = Fraction(-123.456)
+        self.assertEqual(str(f), "-15432/125")
+
+    def test_float_matches_repr(self):
+        self.assertEqual(Fraction(527352880319309.75), Fraction(52735288031930975, 100))
+        self.assertEqual(Fraction(0.1 + 0.2), Fraction(30000000000000004, 10 ** 17))
+        random.seed(4)
+        for _ in range(2000):
+            x = random.uniform(-1, 1) * 10 ** random.randint(-30, 30)
+            # целые float переводятся точно, остальные — по repr
+            expected = Fraction(int(x)) if x.is_integer() else Fraction.from_str(repr(x))
+            self.assertEqual(Fraction(x), expected)
+        with self.assertRaises(ValueError):
+            Fraction(float('inf'))
+
+    def test_from_float(self):
+        self.assertEqual(Fraction.from_float(0.75), Fraction(3, 4))
+        self.assertEqual(Fraction.from_float(-2.0), Fraction(-2))
+        self.assertEqual(Fraction.from_float(0.1), Fraction(3602879701896397, 36028797018963968))
+
+        with self.assertRaises(ValueError):
+            Fraction.from_float(float('nan'))
+
+    def test_limit_denominator(self):
+        self.assertEqual(Fraction(3141592653, 1000000000).limit_denominator(100), Fraction(311, 99))
+        self.assertEqual(Fraction.from_float(math.pi).limit_denominator(1000), Fraction(355, 113))
+        self.assertEqual(Fraction(-7, 10).limit_denominator(3), Fraction(-2, 3))
+        self.assertEqual(Fraction(1, 3).limit_denominator(), Fraction(1, 3))
+
+        with self.assertRaises(ValueError):
+            Fraction(1, 3).limit_denominator(0)
+
+    def test_from_str(self):
+        self.assertEqual(repr(Fraction.from_str("3/4")), "Fraction(numerator=3, denominator=4)")
+        self.assertEqual(Fraction.from_str("-1.25"), Fraction(-5, 4))
+        self.assertEqual(Fraction.from_str(" 2e-3 "), Fraction(1, 500))
+        self.assertEqual(Fraction.from_str("+1.5E+2"), Fraction(150))
+        self.assertEqual(Fraction.from_str(".5"), Fraction(1, 2))
+        self.assertEqual(Fraction.from_str("0.1"), Fraction(1, 10))
+
+        for text in ("", "abc", "1/-2", "1.2/3", "1/0"):
+            with self.assertRaises(ValueError):
+                Fraction.from_str(text)
+
+    def test_parse_many(self):
+        self.assertEqual(Fraction.parse_many(["1/2", "3", "0.75"]), [Fraction(1, 2), Fraction(3), Fraction(3, 4)])
+        self.assertEqual(Fraction.parse_many(["1", "x", "2/4"], errors='ignore'), [Fraction(1), None, Fraction(1, 2)])
+
+        with self.assertRaises(FractionParseError) as context:
+            Fraction.parse_many(["1", "x", "1/0", None, "2.5"])
+        self.assertEqual(context.exception.rows, [(1, "x"), (2, "1/0"), (3, None)])
+
     def test_str(self):
         f = Fraction(1, 2)
         self.assertEqual(str(f), "1/2")
@@ -91,6 +167,51 @@ class TestFraction(unittest.TestCase):
 
         self.assertEqual(f1.__truediv__("string"), NotImplemented)
 
+    def test_mixed_operands(self):
+        f = Fraction(3, 4)
+        self.assertEqual(repr(f + 1), "Fraction(numerator=7, denominator=4)")
+        self.assertEqual(repr(2 - f), "Fraction(numerator=5, denominator=4)")
+        self.assertEqual(repr(f * 2), "Fraction(numerator=3, denominator=2)")
+        self.assertEqual(repr(4 * f), "Fraction(numerator=3, denominator=1)")
+        self.assertEqual(repr(f / -6), "Fraction(numerator=-1, denominator=8)")
+        self.assertEqual(repr(3 / f), "Fraction(numerator=4, denominator=1)")
+        self.assertEqual(f * 0, Fraction(0))
+
+        self.assertEqual(f + 0.25, Fraction(1))
+        self.assertEqual(0.5 - f, Fraction(-1, 4))
+        self.assertEqual(f * 0.2, Fraction(3, 4) * Fraction.from_float(0.2))
+        self.assertEqual(1.5 / f, Fraction(2))
+
+    def test_float_rule(self):
+        # во всех смешанных операциях float берётся по точному двоичному значению
+        tenth = Fraction(1, 10)
+        self.assertFalse(tenth == 0.1)
+        self.assertNotEqual(tenth - 0.1, 0)
+        self.assertEqual(tenth - 0.1, tenth - Fraction.from_float(0.1))
+        self.assertTrue(tenth < 0.1 and tenth <= 0.1 and not tenth > 0.1)
+        self.assertTrue(Fraction.from_float(0.1) == 0.1 and Fraction.from_float(0.1) - 0.1 == 0)
+        self.assertEqual(hash(Fraction.from_float(0.1)), hash(0.1))
+        for x in (0.1, -2.5, 1e-300, 1.5e300, 0.0):
+            exact = Fraction.from_float(x)
+            self.assertEqual(exact == x, True)
+            self.assertEqual((exact <= x, exact < x, exact >= x), (True, False, True))
+            self.assertEqual(Fraction(1, 3) + x, Fraction(1, 3) + exact)
+        self.assertTrue(Fraction(10 ** 400) < float('inf') and Fraction(-1) > float('-inf'))
+        self.assertFalse(Fraction(1) < float('nan') or Fraction(1) >= float('nan'))
+        self.assertEqual(Complex(1, 1) + 0.1, Complex(Fraction(1) + Fraction.from_float(0.1), 1))
+        self.assertEqual(Complex(1, 1) + 0.1j, Complex(1, 1 + Fraction.from_float(0.1)))
+        self.assertEqual(0.5 / Complex(0, 1), Complex(0, Fraction(-1, 2)))
+        self.assertTrue(Complex(Fraction.from_float(0.1)) == 0.1 and Complex(tenth) != 0.1)
+        # явное преобразование остаётся десятичным
+        self.assertEqual(Fraction(0.1), tenth)
+
+        with self.assertRaises(ZeroDivisionError):
+            1 / Fraction(0)
+
+    def test_sum(self):
+        values = [Fraction(1, 2), Fraction(1, 3), Fraction(1, 6)]
+        self.assertEqual(sum(values), Fraction(1))
+
     def test_pow(self):
         f = Fraction(2, 3)
         result = f ** 2
@@ -99,6 +220,35 @@ class TestFraction(unittest.TestCase):
 
         self.assertEqual(f.__pow__("string"), NotImplemented)
 
+    def test_pow_negative(self):
+        f = Fraction(-2, 3)
+        self.assertEqual(repr(f ** -3), "Fraction(numerator=-27, denominator=8)")
+        self.assertEqual(f ** 0, Fraction(1))
+        self.assertEqual(f ** Fraction(2), Fraction(4, 9))
+        self.assertEqual(Fraction(1, 4) ** 0.5, 0.5)
+
+        with self.assertRaises(ZeroDivisionError):
+            Fraction(0) ** -1
+
+    def test_pow_mod(self):
+        self.assertEqual(pow(Fraction(3), 4, 7), 81 % 7)
+        # 1/2 по модулю 7 — это 4, так как 2 * 4 == 1 (mod 7)
+        self.assertEqual(pow(Fraction(1, 2), 1, 7), 4)
+        self.assertEqual(pow(Fraction(1, 2), -2, 7), 4)
+
+        with self.assertRaises(ValueError):
+            pow(Fraction(1, 7), 2, 7)
+
+    def test_root(self):
+        self.assertEqual(repr(Fraction(9, 4).sqrt()), "Fraction(numerator=3, denominator=2)")
+        self.assertEqual(Fraction(-8, 27).root(3), Fraction(-2, 3))
+
+        approx = Fraction(2).sqrt(Fraction(1, 10 ** 6))
+        self.assertTrue(approx * approx <= 2 < (approx + Fraction(1, 10 ** 6)) ** 2)
+
+        with self.assertRaises(ValueError):
+            Fraction(-4).sqrt()
+
     def test_eq(self):
         f1 = Fraction(1, 2)
         f2 = Fraction(1, 2)
@@ -112,6 +262,91 @@ class TestFraction(unittest.TestCase):
 
         self.assertEqual(f1.__eq__("string"), NotImplemented)
 
+    def test_eq_numbers(self):
+        self.assertTrue(Fraction(4, 2) == 2)
+        self.assertTrue(2 == Fraction(4, 2))
+        self.assertFalse(Fraction(1, 2) == 1)
+        self.assertTrue(Fraction(1, 2) == 0.5)
+        self.assertFalse(Fraction(1, 3) == 1 / 3)
+        self.assertFalse(Fraction(1, 2) == float('nan'))
+        self.assertTrue(Fraction(1, 2) != 1)
+
+    def test_stdlib_interop(self):
+        f = Fraction(1, 2)
+        third = fractions.Fraction(1, 3)
+        self.assertIsInstance(f, numbers.Rational)
+        self.assertEqual(f + third, Fraction(5, 6))
+        self.assertIsInstance(third + f, Fraction)
+        self.assertEqual(third - f, Fraction(-1, 6))
+        self.assertEqual(f / third, Fraction(3, 2))
+        self.assertTrue(third < f and f > third and third == Fraction(1, 3))
+        self.assertEqual(hash(third), hash(Fraction(1, 3)))
+
+        self.assertEqual(f + Decimal('0.25'), Fraction(3, 4))
+        self.assertEqual(Decimal('1.5') * f, Fraction(3, 4))
+        self.assertTrue(Decimal('0.5') == f and f < Decimal('0.6'))
+
+        self.assertEqual(f + 1j, Complex(Fraction(1, 2), 1))
+        self.assertEqual((2 + 0j) / f, Complex(4))
+        self.assertEqual(complex(f), 0.5 + 0j)
+        with self.assertRaises(TypeError):
+            f < 1j
+
+        self.assertEqual(Fraction.from_stdlib(third), Fraction(1, 3))
+        self.assertEqual(Fraction.from_stdlib(Decimal('-1.25')), Fraction(-5, 4))
+        self.assertEqual(Fraction.from_stdlib(0.1), Fraction(1, 10))
+        self.assertEqual(Fraction(-6, 4).to_stdlib(), fractions.Fraction(-3, 2))
+        with self.assertRaises(TypeError):
+            Fraction.from_stdlib("1/2")
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_numpy_scalars(self):
+        big = 2 ** 62
+        for result in (Fraction(1, 3) + np.int64(big), np.int64(big) + Fraction(1, 3)):
+            self.assertEqual(result, Fraction(3 * big + 1, 3))
+            self.assertIs(type(result.numerator), int)
+        self.assertEqual(Fraction(1, 3) * np.int32(6), Fraction(2))
+        self.assertEqual(Fraction(2 ** 62) * np.int64(4), Fraction(2 ** 64))
+        self.assertIs(type(Fraction.from_stdlib(np.uint64(2 ** 63)).numerator), int)
+        self.assertEqual(Complex(1, 1) + np.int64(big), Complex(big + 1, 1))
+
+    def test_rational_protocol(self):
+        f = Fraction(-7, 2)
+        self.assertEqual((math.floor(f), math.ceil(f), math.trunc(f)), (-4, -3, -3))
+        self.assertEqual(Fraction(7, 2) // Fraction(1, 3), 10)
+        self.assertEqual(Fraction(7, 2) % Fraction(1, 3), Fraction(1, 6))
+        self.assertEqual(7 // Fraction(2, 3), 10)
+        self.assertEqual(7 % Fraction(2, 3), Fraction(1, 3))
+        self.assertEqual(2 ** Fraction(-3), Fraction(1, 8))
+        self.assertEqual(4 ** Fraction(1, 2), 2.0)
+        self.assertFalse(Fraction(0))
+        self.assertEqual((f.real, f.imag, f.conjugate(), +f), (f, 0, f, f))
+
+    def test_hash(self):
+        self.assertEqual(hash(Fraction(2, 4)), hash(Fraction(1, 2)))
+        self.assertEqual(hash(Fraction(1, 2)), hash(0.5))
+        self.assertEqual(hash(Fraction(-3)), hash(-3))
+        self.assertEqual(hash(Fraction(-1)), hash(-1))
+        self.assertEqual(len({Fraction(1, 2), Fraction(2, 4), 0.5, Fraction(1, 3)}), 2)
+
+    def test_interned(self):
+        cache = FractionCache(maxsize=2)
+        f = cache.get(1, 2)
+        self.assertIs(cache.get(1, 2), f)
+        self.assertEqual(f, Fraction(1, 2))
+        cache.get(1, 100)
+        cache.get(3, 4)
+        self.assertIsNot(cache.get(1, 2), f)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual((cache.hits, cache.misses), (1, 4))
+
+        self.assertIs(Fraction.interned(5, 100), Fraction.interned(5, 100))
+        self.assertIs(Fraction.interned(5, 100), Fraction.interned(1, 20))
+        self.assertIs(Fraction.interned(1, 3), Fraction.interned(2, 6))
+        self.assertIs(Fraction.interned(-2, -4), Fraction.interned(Fraction(1, 2)))
+        with self.assertRaises(ValueError):
+            cache.get(1, 0)
+
     def test_ne(self):
         f1 = Fraction(1, 2)
         f2 = Fraction(1, 2)
@@ -203,6 +438,217 @@ class TestFraction(unittest.TestCase):
         f = Fraction(1, -2)
         self.assertEqual(abs(f), Fraction(1, 2))
 
+    def test_slots(self):
+        f = Fraction(1, 2)
+        self.assertFalse(hasattr(f, '__dict__'))
+        with self.assertRaises(AttributeError):
+            f.extra = 1
+
+    def test_normalized_results(self):
+        f1 = Fraction(5, 6)
+        f2 = Fraction(1, 6)
+        self.assertEqual(repr(f1 + f2), "Fraction(numerator=1, denominator=1)")
+        self.assertEqual(repr(f1 - f2), "Fraction(numerator=2, denominator=3)")
+        self.assertEqual(repr(Fraction(4, 9) * Fraction(3, 8)), "Fraction(numerator=1, denominator=6)")
+        self.assertEqual(repr(Fraction(1, 2) / Fraction(-3, 4)), "Fraction(numerator=-2, denominator=3)")
+        self.assertEqual(repr(Fraction(-3, 4) - 1), "Fraction(numerator=-7, denominator=4)")
+
+
+class TestOrdering(unittest.TestCase):
+
+    def setUp(self):
+        self.values = [Fraction(1, 3), Fraction(-2), Fraction(2, 6), Fraction(10 ** 400), Fraction(1, 2),
+                       Fraction(1, 10 ** 20), Fraction(1, 10 ** 20 + 1), Fraction(-10 ** 400)]
+
+    def test_sort_key(self):
+        self.assertEqual(sorted(self.values, key=Fraction.sort_key), sorted(self.values))
+        self.assertEqual(sorted_fractions(self.values, reverse=True), sorted(self.values, reverse=True))
+        self.assertEqual(Fraction(1, 2).sort_key(), (0.5, Fraction(1, 2)))
+
+    def test_top_k(self):
+        self.assertEqual(nsmallest(3, self.values), [Fraction(-10 ** 400), Fraction(-2), Fraction(1, 10 ** 20 + 1)])
+        self.assertEqual(nlargest(2, self.values), [Fraction(10 ** 400), Fraction(1, 2)])
+        # при равенстве сохраняется исходный порядок
+        self.assertIs(nsmallest(5, self.values)[-1], self.values[0])
+        self.assertIs(nlargest(4, self.values)[2], self.values[0])
+        self.assertEqual(nsmallest(0, self.values), [])
+
+    def test_streaming(self):
+        top = FractionTopK(2)
+        for value in self.values:
+            top.push(value)
+        self.assertEqual(top.result(), [Fraction(-10 ** 400), Fraction(-2)])
+        self.assertEqual(len(top), 2)
+
+
+class TestSerialization(unittest.TestCase):
+
+    def test_bytes(self):
+        for f in (Fraction(1, 2), Fraction(-3, 7), Fraction(0), Fraction(-2 ** 100, 3 ** 50)):
+            self.assertEqual(Fraction.from_bytes(f.to_bytes()), f)
+        self.assertEqual(Fraction(1, 2).to_bytes(), b'\x02\x02')
+
+        for data in (b'\x02\x02\x00', b'', b'\x02', b'\x02\x82', b'\x02\x00'):
+            with self.assertRaises(ValueError):
+                Fraction.from_bytes(data)
+
+    def test_pickle(self):
+        f = Fraction(-3, 7)
+        self.assertEqual(pickle.loads(pickle.dumps(f)), f)
+
+    def test_batch(self):
+        values = [Fraction(1, 2), Fraction(-3, 7), Fraction(5)]
+        data = encode_batch(values)
+        self.assertEqual(len(data), 16 + 2 * 4 * len(values))
+        batch = decode_batch(bytearray(data))
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(batch[1], Fraction(-3, 7))
+        self.assertEqual(batch.to_fractions(), values)
+
+        values.append(Fraction(-2 ** 40))
+        self.assertEqual(len(encode_batch(values)), 16 + 2 * 8 * len(values))
+        self.assertEqual(decode_batch(encode_batch(values)).to_fractions(), values)
+
+        values.append(Fraction(1, 2 ** 70))
+        self.assertEqual(decode_batch(memoryview(encode_batch(values))).to_fractions(), values)
+        self.assertEqual(decode_batch(encode_batch(values, varint=True)).to_fractions(), values)
+        self.assertEqual(decode_batch(encode_batch([])).to_fractions(), [])
+
+        with self.assertRaises(ValueError):
+            decode_batch(b'NOPE' + data[4:])
+        with self.assertRaises(ValueError):
+            decode_batch(data[:-1])
+        with self.assertRaises(ValueError):
+            decode_batch(encode_batch(values, varint=True)[:-1])
+        # нулевой знаменатель в повреждённом буфере
+        for data in (encode_batch([Fraction(1, 2)])[:-4] + bytes(4),
+                     encode_batch([Fraction(1, 2)], varint=True)[:-1] + b'\x00'):
+            with self.assertRaises(ValueError):
+                decode_batch(data)
+
+    def test_batch_from_generator(self):
+        values = [Fraction(1, 2), Fraction(-3, 7), Fraction(1, 2 ** 70)]
+        for varint in (False, True):
+            self.assertEqual(decode_batch(encode_batch((v for v in values[:2]), varint)).to_fractions(), values[:2])
+            self.assertEqual(decode_batch(encode_batch(iter(values), varint)).to_fractions(), values)
+
+
+class TestFractionSum(unittest.TestCase):
+
+    def test_sum(self):
+        values = [Fraction(1, d) for d in range(1, 21)]
+        expected = Fraction(0)
+        for value in values:
+            expected = expected + value
+        self.assertEqual(FractionSum(values).value(), expected)
+        self.assertEqual(Fraction.accumulate(values), expected)
+        self.assertEqual(FractionSum(values, threshold=3).value(), expected)
+
+    def test_add(self):
+        s = FractionSum()
+        s.add(Fraction(1, 2))
+        s += 3
+        s += Fraction(-1, 6)
+        self.assertEqual(s, Fraction(10, 3))
+        self.assertEqual(str(s), "10/3")
+        self.assertEqual(repr(s.value()), "Fraction(numerator=10, denominator=3)")
+
+        s += FractionSum([Fraction(2, 3)])
+        self.assertEqual(s, 4)
+
+        with self.assertRaises(TypeError):
+            s.add("string")
+        self.assertEqual(s.__iadd__("string"), NotImplemented)
+
+    def test_empty(self):
+        self.assertEqual(FractionSum().value(), Fraction(0))
+
+    def test_float(self):
+        # float копится по тому же правилу, что и скалярный +
+        values = [Fraction(1, 3), 0.1, 2, -0.25]
+        expected = Fraction(0)
+        for value in values:
+            expected = expected + value
+        self.assertEqual(FractionSum(values).value(), expected)
+        s = FractionSum()
+        s.add(0.1)
+        s += 0.2
+        s.sub(0.5)
+        self.assertEqual(s, Fraction(0) + 0.1 + 0.2 - 0.5)
+        with self.assertRaises(OverflowError):
+            s.add(float('inf'))
+        self.assertTrue(FractionSum([0.5]) == 0.5 and FractionSum([0.1]) == 0.1)
+        self.assertFalse(FractionSum([Fraction(1, 10)]) == 0.1)
+        self.assertTrue(FractionSum([Fraction(1, 2)]) == fractions.Fraction(1, 2))
+        self.assertTrue(FractionSum([1]) != "1")
+
+
+class TestPrecision(unittest.TestCase):
+
+    def setUp(self):
+        self.values = [Fraction(1000 + i, 999 - i) for i in range(50)]
+
+    def chain(self):
+        result = Fraction(1)
+        for x in self.values:
+            result = result * x + Fraction(1, 7)
+        return result
+
+    def test_max_denominator(self):
+        exact = self.chain()
+        with precision(max_denominator=10 ** 6) as stats:
+            bounded = self.chain()
+        self.assertLessEqual(bounded.denominator, 10 ** 6)
+        self.assertLess(abs(float((bounded - exact) / exact)), 1e-9)
+        self.assertEqual(stats.operations, 100)
+        self.assertGreater(stats.rounded, 0)
+        self.assertLess(stats.max_bits, 64)
+        self.assertEqual(self.chain(), exact)
+
+    def test_tolerance(self):
+        exact = self.chain()
+        with precision(tolerance=Fraction(1, 10 ** 6)) as stats:
+            bounded = self.chain()
+        self.assertLess(abs(float((bounded - exact) / exact)), 1e-4)
+        self.assertLessEqual(stats.max_error, 1e-6)
+        with precision(tolerance=Fraction(1, 10)):
+            self.assertEqual(Fraction(1, 3) * Fraction(22, 21), Fraction(1, 3))
+            self.assertEqual(Fraction(-10, 3) / 3, Fraction(-1))
+        with self.assertRaises(ValueError):
+            precision(tolerance=2).__enter__()
+
+    def test_statistics_only(self):
+        exact = self.chain()
+        with precision() as stats:
+            self.assertEqual(self.chain(), exact)
+        self.assertEqual(stats.rounded, 0)
+        self.assertEqual(stats.max_bits, max(exact.numerator.bit_length(), exact.denominator.bit_length()))
+        self.assertGreater(stats.mean_bits, 0)
+
+    def test_nested_and_complex(self):
+        with precision(max_denominator=100) as outer:
+            with precision(max_denominator=10) as inner:
+                self.assertEqual(Fraction(1, 3) * Fraction(2, 7), Fraction(1, 10))
+            self.assertEqual((inner.operations, outer.operations), (1, 0))
+            self.assertEqual(Complex(1, 2) / Complex(3, Fraction(1, 97)), Complex(Fraction(33, 98), Fraction(2, 3)))
+            self.assertEqual(Fraction(2, 3) ** 20, 0)
+        self.assertEqual(Fraction(1, 3) / 77, Fraction(1, 231))
+
+    def test_threads(self):
+        # контексты в разных потоках не мешают друг другу, а после выхода из всех арифметика снова точная
+        def work(_):
+            with precision(max_denominator=10):
+                return (Fraction(1, 3) * Fraction(2, 7)).denominator
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                self.assertEqual(set(pool.map(work, range(2000))), {10})
+        finally:
+            sys.setswitchinterval(interval)
+        self.assertEqual(Fraction(1, 3) * Fraction(2, 7), Fraction(2, 21))
+
 
 class TestComplex(unittest.TestCase):
 
@@ -221,6 +667,19 @@ class TestComplex(unittest.TestCase):
         c.imagine = 1000
         self.assertEqual(c, Complex(-2, 1000))
 
+    def test_slots(self):
+        c = Complex(1, 2)
+        self.assertFalse(hasattr(c, '__dict__'))
+        self.assertIsInstance(c.real, Fraction)
+        self.assertIsInstance(c.real, Fraction)
+
+    def test_norm_cache(self):
+        c = Complex(3, 4)
+        self.assertEqual(abs(c), 5)
+        c.real = 0
+        self.assertEqual(abs(c), 4)
+        self.assertEqual(Complex(1, 2) / c, Complex(Fraction(1, 2), Fraction(-1, 4)))
+
     def test_str(self):
         c = Complex(1, 2)
         self.assertEqual(str(c), "1 + 2i")
@@ -290,17 +749,51 @@ class TestComplex(unittest.TestCase):
         c = Complex(3, 4)
         self.assertEqual(abs(c), 5)
 
+    def test_truediv_fractions(self):
+        c1 = Complex(Fraction(1, 2), Fraction(1, 3))
+        c2 = Complex(Fraction(3, 4), Fraction(-2, 5))
+        result = c1 / c2
+        self.assertEqual(result.real, Fraction(1, 2) * Fraction(3, 4) / c2.abs2() - Fraction(1, 3) * Fraction(2, 5) / c2.abs2())
+        self.assertEqual(result * c2, c1)
+        self.assertEqual(Complex(3, 4) / Complex(0, Fraction(1, 2)), Complex(8, -6))
+
+    def test_abs_precision(self):
+        c = Complex(1, 1)
+        self.assertEqual(c.abs2(), 2)
+        self.assertEqual(abs(c), math.sqrt(2))
+        self.assertTrue(abs(c.abs(Fraction(1, 10 ** 20)) ** 2 - 2) < Fraction(3, 10 ** 20))
+        self.assertEqual(repr(Complex(Fraction(3, 5), Fraction(4, 5)).abs(Fraction(1, 100))),
+                         "Fraction(numerator=1, denominator=1)")
+        self.assertEqual(abs(Complex(10 ** 200, 10 ** 200)), math.sqrt(2) * 1e200)
+
     def test_pow(self):
         c = Complex(1, 1)
         result = c ** 2
         self.assertEqual(result.real, 0)
         self.assertEqual(result.imagine, 2)
 
+    def test_pow_exact(self):
+        self.assertEqual(Complex(1, 1) ** 40, Complex(2 ** 20, 0))
+        self.assertEqual(Complex(1, 2) ** 3, Complex(-11, -2))
+        self.assertEqual(Complex(1, 2) ** 0, Complex(1, 0))
+        self.assertEqual(Complex(Fraction(1, 2), Fraction(1, 2)) ** 2, Complex(0, Fraction(1, 2)))
+        self.assertEqual(Complex(1, 1) ** -2, Complex(0, Fraction(-1, 2)))
+
+        with self.assertRaises(ZeroDivisionError):
+            Complex(0, 0) ** -1
+
+    def test_pow_float(self):
+        self.assertAlmostEqual(Complex(1, 2).power(3, exact=False), complex(-11, -2))
+        self.assertIsInstance(Complex(1, 1).power(2, exact=False), complex)
+
+        with self.assertRaises(TypeError):
+            Complex(1, 1).power(0.5)
+
     def test_iadd(self):
         c1 = Complex(1, 2)
         c1 += 1
         self.assertEqual(c1.real, 2)
-        self.assertEqual(c1.imagine, 3)
+        self.assertEqual(c1.imagine, 2)
 
         c1 = Complex(1, 2)
         c1 += Complex(3, 4)
@@ -310,7 +803,7 @@ class TestComplex(unittest.TestCase):
         c1 = Complex(Fraction(1, 3), Fraction(2, 3))
         c1 += Fraction(1, 5)
         self.assertEqual(c1.real, Fraction(8, 15))
-        self.assertEqual(c1.imagine, Fraction(13, 15))
+        self.assertEqual(c1.imagine, Fraction(2, 3))
 
         self.assertEqual(c1.__iadd__("string"), NotImplemented)
 
@@ -318,7 +811,7 @@ class TestComplex(unittest.TestCase):
         c1 = Complex(1, 2)
         c1 -= 1
         self.assertEqual(c1.real, 0)
-        self.assertEqual(c1.imagine, 1)
+        self.assertEqual(c1.imagine, 2)
 
         c1 = Complex(1, 2)
         c1 -= Complex(3, 4)
@@ -328,7 +821,7 @@ class TestComplex(unittest.TestCase):
         c1 = Complex(1, 2)
         c1 -= Fraction(1, 2)
         self.assertEqual(c1.real, Fraction(1, 2))
-        self.assertEqual(c1.imagine, Fraction(3, 2))
+        self.assertEqual(c1.imagine, 2)
 
         self.assertEqual(c1.__isub__("string"), NotImplemented)
 
@@ -367,6 +860,34 @@ class TestComplex(unittest.TestCase):
 
         self.assertEqual(c1.__idiv__("string"), NotImplemented)
         
+    def test_inplace_identity(self):
+        c1 = Complex(1, 2)
+        c2 = c1
+        c1 += Complex(1, 1)
+        c1 *= 2
+        c1 /= Complex(0, 1)
+        self.assertIs(c1, c2)
+        self.assertEqual(c2, Complex(6, -4))
+        self.assertEqual(abs(c2), abs(Complex(6, -4)))
+
+    def test_accumulator(self):
+        acc = ComplexAccumulator([Complex(1, 2), Complex(Fraction(1, 2), Fraction(-1, 3))])
+        acc += 1
+        acc -= Complex(0, Fraction(2, 3))
+        acc.add(Fraction(1, 2))
+        self.assertEqual(acc.value(), Complex(3, 1))
+        self.assertEqual(acc, Complex(3, 1))
+        self.assertEqual(str(acc), "3 + 1i")
+
+        with self.assertRaises(TypeError):
+            acc.add("string")
+        self.assertEqual(acc.__iadd__("string"), NotImplemented)
+
+        acc = ComplexAccumulator([Complex(1, 2), 0.1, 0.5 - 0.2j])
+        acc -= 0.25j
+        self.assertEqual(acc, Complex(1, 2) + 0.1 + (0.5 - 0.2j) - 0.25j)
+        self.assertTrue(ComplexAccumulator([0.5, 0.25j]) == 0.5 + 0.25j and ComplexAccumulator([3]) == 3)
+
     def test_temp(self):
         c1 = Complex(1, 2)
         with self.assertRaises(ZeroDivisionError):
@@ -390,6 +911,69 @@ class TestComplex(unittest.TestCase):
         c = Complex(1, 1)
         self.assertEqual(c.arg(), math.pi / 4)
 
+    def test_transcendental(self):
+        c = Complex(Fraction(1, 2), -3)
+        precision = Fraction(1, 10 ** 20)
+        for name in ('exp', 'log', 'sqrt', 'sin', 'cos'):
+            approximate = getattr(c, name)()
+            self.assertAlmostEqual(approximate, getattr(cmath, name)(0.5 - 3j))
+            exact = getattr(c, name)(precision)
+            self.assertIsInstance(exact, Complex)
+            self.assertAlmostEqual(complex(exact), approximate)
+
+        # e**(i pi / 2) == i; pi ~ 355/113 с погрешностью меньше 3e-7
+        self.assertLess(abs(Complex(0, Fraction(355, 226)).exp(precision) - Complex(0, 1)), 3e-7)
+        self.assertEqual(Complex(3, 4).sqrt(1e-9), Complex(2, 1))
+        self.assertEqual(Complex(-4).sqrt(1e-9), Complex(0, 2))
+        self.assertEqual(Complex(0, -2).sqrt(1e-9), Complex(1, -1))
+        self.assertEqual(Complex(0).exp(1e-9), Complex(1))
+        self.assertAlmostEqual(float(Complex(-1).log(precision).imagine), math.pi)
+        with self.assertRaises(ValueError):
+            Complex(0).log(precision)
+        with self.assertRaises(ValueError):
+            c.exp(0)
+
+    def test_polar(self):
+        c = Complex(1, 1)
+        modulus, phase = c.polar()
+        self.assertAlmostEqual(modulus, math.sqrt(2))
+        self.assertAlmostEqual(phase, math.pi / 4)
+        modulus, phase = c.polar(Fraction(1, 10 ** 15))
+        self.assertIsInstance(phase, Fraction)
+        self.assertLess(abs(phase - math.pi / 4), 1e-15)
+        self.assertAlmostEqual(Complex.from_polar(2, math.pi / 2), 2j)
+        self.assertLess(abs(Complex.from_polar(modulus, phase, Fraction(1, 10 ** 12)) - c), 1e-12)
+
+    def test_evaluate_many(self):
+        values = [Complex(1, 2), 1j, Fraction(1, 2), 3]
+        self.assertEqual(Complex.evaluate_many('exp', values), [cmath.exp(complex(v)) for v in values])
+        exact = Complex.evaluate_many('sqrt', [Complex(3, 4), -1j, 4], Fraction(1, 10 ** 6))
+        self.assertEqual(exact[0], Complex(2, 1))
+        self.assertEqual(exact[2], Complex(2))
+        with self.assertRaises(ValueError):
+            Complex.evaluate_many('tan', values)
+
+    def test_stdlib_interop(self):
+        c = Complex(1, 2)
+        self.assertIsInstance(c, numbers.Complex)
+        self.assertEqual(complex(c), 1 + 2j)
+        self.assertEqual(c + 1j, Complex(1, 3))
+        self.assertEqual((1 + 1j) - c, Complex(0, -1))
+        self.assertEqual(c == 1 + 2j, True)
+        self.assertEqual(c * fractions.Fraction(1, 3), Complex(Fraction(1, 3), Fraction(2, 3)))
+        self.assertEqual(Decimal('0.5') * c, Complex(Fraction(1, 2), 1))
+
+        self.assertEqual(2 * c, Complex(2, 4))
+        self.assertEqual(1 - c, Complex(0, -2))
+        self.assertEqual(2 / c, Complex(Fraction(2, 5), Fraction(-4, 5)))
+        self.assertTrue(Complex(3) == 3 and Complex(3, 1) != 3)
+
+        self.assertEqual(Complex.from_stdlib(0.1 + 0.2j), Complex(Fraction(1, 10), Fraction(1, 5)))
+        self.assertEqual(Complex.from_stdlib(fractions.Fraction(1, 3)), Complex(Fraction(1, 3)))
+        self.assertEqual(c.to_stdlib(), 1 + 2j)
+        self.assertEqual((c.imag, c.conjugate(), +c), (Fraction(2), Complex(1, -2), c))
+        self.assertFalse(Complex(0))
+
     def test_type_error_add(self):
         c = Complex(1, 2)
         with self.assertRaises(TypeError):